@@ -0,0 +1,61 @@
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from django.urls import (
+    include,
+    path,
+)
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from docs.models import *
+request = req('get')
+
+
+# language=rst
+"""
+Cell
+====
+
+Base class: `CellConfig`
+
+"""
+def test_base():
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+* `attrs`
+
+        Type: :doc:`Attrs`
+    
+* `contents`
+
+* `format`
+
+        Type: `Callable`
+    
+* `link`
+
+* `tag`
+
+        Type: `str`
+    
+* `template`
+
+        Type: `Union[str, iommi._web_compat.Template]`
+    
+* `url`
+
+        Type: `str`
+    
+* `url_title`
+
+        Type: `str`
+    
+* `value`
+
+
+"""
@@ -0,0 +1,30 @@
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from django.urls import (
+    include,
+    path,
+)
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from docs.models import *
+request = req('get')
+
+
+# language=rst
+"""
+ColumnHeader
+============
+
+Base class: `object`
+
+"""
+def test_base():
+    # language=rst
+    """
+    Internal class implementing a column header. For configuration options
+    read the docs for :doc:`HeaderConfig`.
+    
+
+"""
@@ -0,0 +1,77 @@
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from django.urls import (
+    include,
+    path,
+)
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from docs.models import *
+request = req('get')
+
+
+# language=rst
+"""
+Container
+=========
+
+Base class: :doc:`Fragment`
+
+"""
+def test_base():
+    # language=rst
+    """
+    The main container for iommi. This class is useful when you want to apply styling or change the tag of what iommi produces for its content inside your body tag.
+    
+
+Refinable members
+-----------------
+
+* `after`
+
+        Type: `Union[int, str]`
+    
+* `assets`
+
+        Type: `Namespace`
+    
+* `attrs`
+
+        Type: :doc:`Attrs`
+    
+* `children`
+
+* `endpoints`
+
+        Type: `Namespace`
+    
+* `extra`
+
+        Type: `Dict[str, Any]`
+    
+* `extra_evaluated`
+
+        Type: `Dict[str, Any]`
+    
+* `include`
+
+        Type: `bool`
+    
+* `iommi_style`
+
+        Type: `str`
+    
+* `tag`
+
+* `template`
+
+        Type: `Union[str, iommi._web_compat.Template]`
+    
+
+Defaults
+^^^^^^^^
+
+
+"""
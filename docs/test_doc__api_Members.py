@@ -0,0 +1,41 @@
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from django.urls import (
+    include,
+    path,
+)
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from docs.models import *
+request = req('get')
+
+
+# language=rst
+"""
+Members
+=======
+
+Base class: :doc:`Traversable`
+
+"""
+def test_base():
+    # language=rst
+    """
+    Internal iommi class that holds members of another class, for example the columns of a `Table` instance.
+    
+
+Refinable members
+-----------------
+
+* `assets`
+
+* `endpoints`
+
+* `iommi_style`
+
+        Type: `str`
+    
+
+"""
@@ -0,0 +1,97 @@
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.admin import Admin
+from django.urls import (
+    include,
+    path,
+)
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from docs.models import *
+request = req('get')
+
+
+# language=rst
+"""
+Page
+====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+    A page is used to compose iommi parts into a bigger whole.
+    
+    See the `howto <https://docs.iommi.rocks/en/latest/cookbook_parts_pages.html#parts-pages>`_ for example usages.
+    
+
+Refinable members
+-----------------
+
+* `after`
+
+        Type: `Union[int, str]`
+    
+* `assets`
+
+        Type: `Namespace`
+    
+* `concurrent_queries`
+
+        Run the queries of the tables of the page (the counts and the rows of the current pages) concurrently on a thread pool when rendering, instead of one table after the other. Each thread uses its own database connection, outside of the transaction of the request, so this does nothing if the request is in a transaction (like with `ATOMIC_REQUESTS`). The current request, language, time zone, SQL trace and timing are carried over to the threads.
+
+        Type: `bool`
+    
+* `concurrent_queries_max_workers`
+
+        The most threads (and so database connections) `concurrent_queries` uses for a request. Default 4.
+
+        Type: `int`
+    
+* `context`
+
+        Cookbook: :ref:`page.context`
+        
+* `endpoints`
+
+        Type: `Namespace`
+    
+* `extra`
+
+        Type: `Dict[str, Any]`
+    
+* `extra_evaluated`
+
+        Type: `Dict[str, Any]`
+    
+* `h_tag`
+
+        Type: `Union[iommi.fragment.Fragment, str]`
+    
+* `include`
+
+        Type: `bool`
+    
+* `iommi_style`
+
+        Type: `str`
+    
+* `member_class`
+
+        Type: `Type[iommi.fragment.Fragment]`
+    
+* `parts`
+
+        Type: `Dict[str, Union[iommi.part.Part, str, iommi._web_compat.Template]]`
+    
+* `title`
+
+        Type: `str`
+    
+        Cookbook: :ref:`page.title`
+        
+
+"""
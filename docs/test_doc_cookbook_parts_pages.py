@@ -1,3 +1,4 @@
+from docs.models import *
 from iommi import *
 from tests.helpers import (
     req,
@@ -157,3 +158,37 @@ class MyPage(Page):
     # @test
     show_output(index(req('get')))
     # @end
+
+
+def test_how_do_i_run_the_queries_of_the_tables_of_a_page_concurrently():
+    # language=rst
+    """
+    How do I run the queries of the tables of a page concurrently?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A dashboard with several tables runs the count and the query for the rows
+    of each table one after the other. With `concurrent_queries=True` they
+    run concurrently on a thread pool, so the page takes about as long as the
+    slowest table instead of the sum of them:
+
+    """
+    Page(
+        parts__albums=Table(auto__model=Album),
+        parts__artists=Table(auto__model=Artist),
+        parts__tracks=Table(auto__model=Track),
+        concurrent_queries=True,
+    )
+
+    # language=rst
+    """
+    Each thread uses its own database connection, so make sure your database
+    allows a few more connections. At most `concurrent_queries_max_workers`
+    (default 4) threads are used per request. All the counts run first, and
+    then all the queries for the rows. The tables are still rendered one after
+    the other.
+
+    The connections of the threads are not in the transaction of the request,
+    so they would not see changes the request has made but not committed yet.
+    Because of that the queries run in the thread of the request as usual if
+    it is in a transaction, for example with `ATOMIC_REQUESTS`.
+    """
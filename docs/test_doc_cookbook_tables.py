@@ -12,6 +12,7 @@
     HttpResponse,
     HttpResponseRedirect,
 )
+from django.urls import path
 import pytest
 pytestmark = pytest.mark.django_db
 
@@ -71,6 +72,170 @@ class Meta:
             page_size = None
 
 
+def test_how_do_i_paginate_a_huge_table():
+    # language=rst
+    """
+    How do I paginate a huge table?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The default paginator counts all rows and uses `OFFSET` to get to a page,
+    which gets slow for big tables and deep pages. Turn on keyset pagination
+    to instead get the next page by the values of the sort columns of the
+    last row of the current page. There's no count and only next/previous
+    links are rendered:
+
+    """
+    Table(
+        auto__model=Album,
+        parts__page__keyset=True,
+    )
+
+    # language=rst
+    """
+    The pk is added as a tie-breaker to the ordering. Keyset pagination needs
+    sort columns that are model fields that can't be null and are not
+    relations, when sorting on something else (like an expression) the
+    paginator uses page numbers instead.
+    """
+
+
+def test_how_do_i_avoid_counting_all_rows():
+    # language=rst
+    """
+    How do I avoid counting all rows?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The paginator runs a `COUNT(*)` query to know the number of pages. There
+    are a few count strategies in `iommi.table` that you can give to
+    `parts__page__count` if that query is too slow. `capped_count` stops
+    counting at a limit and then shows "1000+":
+
+    """
+    from iommi.table import capped_count
+
+    Table(
+        auto__model=Album,
+        parts__page__count=capped_count(limit=1000),
+    )
+
+    # language=rst
+    """
+    `estimated_count` uses the row estimate of PostgreSQL for unfiltered
+    tables, and `cached_count` keeps the result of a count strategy in the
+    Django cache for a while:
+
+    """
+    from iommi.table import (
+        cached_count,
+        estimated_count,
+    )
+
+    Table(
+        auto__model=Album,
+        parts__page__count=cached_count(timeout=300, count=estimated_count()),
+    )
+
+    # language=rst
+    """
+    If you need the exact count, `window_count` gets it in the same query as
+    the rows of the page, with `COUNT(*) OVER ()`, which saves a round trip to
+    the database. `count` is then only used for a page after the last page:
+
+    """
+    Table(
+        auto__model=Album,
+        parts__page__window_count=True,
+    )
+
+
+def test_how_do_i_paginate_a_table_with_slow_filters():
+    # language=rst
+    """
+    How do I paginate a table with slow filters?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    If the filtering makes the query slow, like a freetext search across
+    joins, every page runs that query again. With `snapshot` the pks of all
+    the filtered and sorted rows are stored in the Django cache on the first
+    request, and the other pages are fetched by pk:
+
+    """
+    Table(
+        auto__model=Album,
+        columns__name__filter=dict(include=True, freetext=True),
+        parts__page__snapshot__timeout=600,
+    )
+
+    # language=rst
+    """
+    The links of the paginator get a `page_snapshot` parameter that refers to
+    the snapshot. Rows that are created after the snapshot was made are not
+    shown and deleted rows are skipped, until the snapshot expires or the
+    filtering or sorting changes. If there are more than
+    `snapshot__max_size` (default 10000) rows no snapshot is made, and the
+    requests for the same query until the timeout don't try again.
+    """
+
+
+
+def test_how_do_i_cache_the_rendering_of_rows():
+    # language=rst
+    """
+    How do I cache the rendering of rows?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    For tables whose rows rarely change you can cache the rendered HTML of
+    each row in the Django cache with `row__cache`. You supply a key function
+    that changes when the row changes, and a prefix that is unique for the
+    table. The columns, the style and the language are added to the key for
+    you:
+
+    """
+    Table(
+        auto__model=Album,
+        row__cache__key=lambda row, **_: (row.pk, row.year),
+        row__cache__prefix='albums',
+        row__cache__timeout=3600,
+    )
+
+    # language=rst
+    """
+    The cached rows of a page are fetched with one `get_many` call. Anything
+    else that affects the rendering of a row, like the permissions of the
+    user, must be part of the key. Row caching can not be combined with
+    `auto_rowspan`.
+    """
+
+
+def test_how_do_i_stream_a_big_table():
+    # language=rst
+    """
+    How do I stream a big table?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Pass `stream=True` to `as_view` (or `render_to_response`) to return a
+    `StreamingHttpResponse`. The page up to the rows of the table is sent
+    right away, and then the rows are rendered and sent in chunks of 100:
+
+    """
+    urlpatterns = [
+        path('albums/', Table(auto__model=Album, page_size=None).as_view(stream=True)),
+    ]
+
+    # @test
+    response = urlpatterns[0].callback(req('get'))
+    assert response.streaming
+    # @end
+
+    # language=rst
+    """
+    Everything except the rows, like the filter form and the paginator, is
+    rendered before the response is returned, so errors there still result
+    in a normal error page. Middleware that reads `response.content` does not
+    work with streaming responses.
+    """
+
+
 def test_how_do_i_customize_the_rendering_of_a_cell():
     # language=rst
     """
@@ -306,6 +471,80 @@ def test_how_do_i_make_a_freetext_search_field():
     # @end
 
 
+def test_how_do_i_filter_a_table_of_a_list():
+    # language=rst
+    """
+    How do I filter a table of a list?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Filters work the same when the rows are a list, like the results from an
+    API or a computed report. The rows can be objects or dicts:
+
+
+    """
+    table = Table(
+        rows=[
+            dict(name='Heaven & Hell', year=1980),
+            dict(name='Mob Rules', year=1981),
+        ],
+        columns__name__filter__include=True,
+        columns__year=Column.integer(filter__include=True),
+    )
+
+    # language=rst
+    """
+    The query is evaluated in Python on the rows, with the same operators as
+    for a `QuerySet`. The rows are filtered before they are sorted, so only the
+    rows that match are sorted. This means that for a list `table.sorted_rows`
+    is the rows in their original order: use `table.sorted_and_filtered_rows`
+    for the sorted rows.
+
+    Without a model there is nothing to tell the type of a column, so use the
+    filter shortcut for the type, like `Column.integer` above. A filter
+    without a type compares the text of the query with the values, and
+    `year>1980` would be an error. Lookups like `range` and `year` are not
+    supported either.
+    """
+
+    # @test
+    t = table.bind(request=req('get', **{'-query/query': 'year>1980'}))
+    assert [row['name'] for row in t.sorted_and_filtered_rows] == ['Mob Rules']
+    # @end
+
+
+def test_how_do_i_make_a_table_of_millions_of_rows_in_memory():
+    # language=rst
+    """
+    How do I make a table of millions of rows in memory?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Sorting and filtering a list in Python gets slow for millions of rows. If
+    you have NumPy installed you can store the rows as columns instead, as a
+    dict of arrays or a structured array, with `iommi.columnar.ColumnarRows`:
+
+    .. code-block:: python
+
+        from iommi.columnar import ColumnarRows
+
+        rows = ColumnarRows(dict(
+            name=numpy.array(names),
+            year=numpy.array(years),
+        ))
+
+        def albums(request):
+            return Table(
+                rows=rows,
+                columns__name__filter__include=True,
+                columns__year=Column.integer(filter__include=True),
+            ).bind(request=request).render_to_response()
+
+    The sort order of each column is calculated once and kept in the
+    `ColumnarRows`, so create it once and reuse it. The filters are
+    evaluated on whole columns, and rows are only created for the
+    current page.
+    """
+
+
 def test_how_do_i_customize_html_attributes__css_classes_or_css_style_specifications():
     # @test
     # TODO: the code in here is no longer tested!
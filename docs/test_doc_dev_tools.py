@@ -110,6 +110,16 @@ def test_profile():
         if you want to use this in production. Only staff users are allowed to
         profile in production, but all users can profile in debug mode.
 
+    cProfile is too heavy to run under real load. For production you can
+    instead sample the stacks of a fraction of the requests by setting
+    `settings.IOMMI_PROFILE_SAMPLE_RATE` (e.g. `0.01` for 1% of the requests).
+    The stacks are sampled every `settings.IOMMI_PROFILE_SAMPLE_INTERVAL`
+    seconds (default `0.005`) from a background thread, and aggregated in
+    memory per URL pattern. `?_iommi_prof=flame` shows an SVG flame graph of the
+    samples collected for the URL pattern of the current page. This doesn't
+    need any extra tools installed. Requests with another `_iommi_prof` value
+    get the cProfile profile they ask for, and are not sampled.
+
 
     """
     
@@ -160,4 +170,54 @@ def test_sql_trace():
 
 
     You can use this middleware on non-iommi views too. Just add `?_iommi_sql_trace` to your url.
+
+    The middleware also groups the statements of a request by their SQL with
+    the literals and parameters stripped, and by the line of your code that
+    ran them. When the same statement runs more than
+    `settings.SQL_DEBUG_N_PLUS_ONE_CUTOFF` (default 3) times from the same line,
+    it's reported as a probable N+1. The findings are listed in the
+    `X-Iommi-Sql-N-Plus-One` response header, at the top of the SQL trace and
+    in the debug menu.
+
+    To make sure a view doesn't regress you can give it a query budget in
+    your tests with `assert_max_queries`. It fails if more queries are run, and
+    lists the probable N+1 problems:
+
+    .. code-block:: python
+
+        from iommi.sql_trace import assert_max_queries
+
+        with assert_max_queries(3):
+            client.get('/albums/')
+    """
+
+
+def test_server_timing():
+    # language=rst
+    """
+    Server timing
+    -------------
+
+    Add `'iommi.timing.Middleware'` to `settings.MIDDLEWARE` to time the phases
+    of iommi requests: `bind`, `on_bind`, `dispatch`, `sort`, `get_q` (building
+    the query from the filters), `count` (the paginator count), `sql`, `render`
+    and `render_root` (the base template). In debug mode, and for staff users,
+    the totals are sent in a `Server-Timing` header, which the network tab of
+    the browser dev tools shows.
+
+    The full timing tree, with the iommi path of each part, is available as
+    `request.iommi_timing`. To forward it to your APM, register a hook:
+
+    .. code-block:: python
+
+        from iommi.timing import register_timing_hook
+
+        def forward_to_apm(request, timing):
+            for span, depth in timing.spans():
+                ...
+
+        register_timing_hook(forward_to_apm)
+
+    When the middleware isn't installed, timing costs a thread local lookup
+    for each instrumented call.
     """
@@ -74,3 +74,60 @@ class Menu(iommi.Menu):
 
     class MenuItem(iommi.MenuItem):
         pass
+
+
+def test_performance():
+    # language=rst
+    """
+    Performance
+    ~~~~~~~~~~~
+
+    iommi caches the style data it calculates for each class, so the first
+    requests after a restart are a bit slower than the rest. If you want to
+    pay that cost at startup instead, turn on warming of the style caches in
+    your settings:
+
+    .. code-block:: python
+
+        IOMMI_WARM_STYLE_CACHES = True
+
+    This calculates the style data for the standard iommi classes in all
+    registered styles when the app is loaded. You can also call
+    `iommi.style.warm_style_caches(additional_classes=[...])` yourself, for
+    example in the `ready()` of your own app, to include your own classes.
+
+    Creating a table or form from its declaration (applying the styles,
+    sorting the members and creating the columns or fields from the model)
+    is a large part of the time of a request. `as_view()` only does this once,
+    and in your own views you can use `prepared()` to get an instance that is
+    created once per process and shared by all requests:
+
+    .. code-block:: python
+
+        def albums(request):
+            return AlbumTable.prepared().bind(request=request).render_to_response()
+    """
+
+
+def test_async_views():
+    # language=rst
+    """
+    Async views
+    ~~~~~~~~~~~
+
+    If you run Django under ASGI, use `as_async_view()` instead of `as_view()`
+    on `Table`, `Form` and `Page`:
+
+    .. code-block:: python
+
+        urlpatterns = [
+            path('albums/', Table(auto__model=Album).as_async_view()),
+        ]
+
+    The view is a coroutine. The bind, dispatch (like the choice lookups of
+    select fields and the saving of forms) and render still run synchronously,
+    in a worker thread with `sync_to_async`. That is what Django does with an
+    `as_view()` view under ASGI anyway, so the queries are not async and the
+    worker thread is busy while they run. Use it where you need a coroutine.
+    In your own async views you can use `await part.arender_to_response()`.
+    """
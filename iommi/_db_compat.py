@@ -121,6 +121,11 @@ def field_char_field_factory(model_field, **_):
     register_field_factory(FileField, shortcut_name='file')
 
 
+def query_is_sliced(query):
+    # Query.is_sliced was added in Django 3.1
+    return query.low_mark != 0 or query.high_mark is not None
+
+
 def base_defaults_factory(model_field):
     from iommi.base import capitalize
 
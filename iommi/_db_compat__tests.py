@@ -1,7 +1,10 @@
 import pytest
 from tri_struct import merged
 
-from iommi._db_compat import field_defaults_factory
+from iommi._db_compat import (
+    field_defaults_factory,
+    query_is_sliced,
+)
 
 
 @pytest.mark.django
@@ -38,3 +41,12 @@ def test_field_defaults_factory_boolean():
 
     assert field_defaults_factory(models.BooleanField(null=True, blank=False)) == base
     assert field_defaults_factory(models.BooleanField(null=True, blank=True)) == base
+
+
+@pytest.mark.django
+def test_query_is_sliced():
+    from tests.models import TFoo
+
+    assert not query_is_sliced(TFoo.objects.all().query)
+    assert query_is_sliced(TFoo.objects.all()[:3].query)
+    assert query_is_sliced(TFoo.objects.all()[3:].query)
@@ -6,6 +6,7 @@
     from django.core.exceptions import ValidationError
     from django.core.validators import validate_email, URLValidator
     from django.http import HttpResponse
+    from django.http import StreamingHttpResponse
     from django.http import QueryDict  # noqa: F401
     from django.template import RequestContext
     from django.template.loader import render_to_string
@@ -109,6 +110,7 @@ def _headers(self):
             return {k.lower(): [v] for k, v in self.r.headers._list}
 
     HttpResponseBase = HttpResponse
+    StreamingHttpResponse = HttpResponse
 
     def format_html(format_string, *args, **kwargs):
         return Markup(format_string).format(*args, **kwargs)
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 from iommi.from_model import register_search_fields
 from iommi.style_bootstrap_docs import bootstrap_docs
@@ -41,3 +42,35 @@ def ready(self):
         register_style('foundation', foundation)
         register_style('django_admin', django_admin)
         register_style('bootstrap_docs', bootstrap_docs)
+
+        if getattr(settings, 'IOMMI_WARM_STYLE_CACHES', False):
+            from iommi.style import warm_style_caches
+
+            warm_style_caches()
+
+        from django.core.signals import setting_changed
+
+        setting_changed.connect(_setting_changed, dispatch_uid='iommi_setting_changed')
+
+        try:
+            from django.utils.autoreload import file_changed
+        except ImportError:  # pragma: no cover
+            # Django < 2.2
+            pass
+        else:
+            file_changed.connect(_file_changed, dispatch_uid='iommi_file_changed')
+
+
+def _setting_changed(setting, **_):
+    if setting == 'TEMPLATES':
+        from iommi.part import clear_root_template_cache
+
+        clear_root_template_cache()
+
+
+def _file_changed(**_):
+    # Django resets the template loaders when a template changes on disk (in development), so we follow suit. Don't
+    # return a value here: that would tell the autoreloader that the change has been handled.
+    from iommi.part import clear_root_template_cache
+
+    clear_root_template_cache()
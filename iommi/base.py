@@ -36,14 +36,14 @@ def model_and_rows(model, rows):
     return model, rows
 
 
-def build_as_view_wrapper(target):
+def build_as_view_wrapper(target, stream=False):
     from iommi.path import decode_path_components  # avoid circular import
     if not target.is_refine_done and getattr(settings, 'IOMMI_REFINE_DONE_OPTIMIZATION', True):
         target = target.refine_done()
 
     def view_wrapper(request, **view_params):
         decode_path_components(request, **view_params)
-        return target.bind(request=request).render_to_response()
+        return target.bind(request=request).render_to_response(stream=stream)
 
     view_wrapper.__name__ = f'{target.__class__.__name__}.as_view'
     view_wrapper.__doc__ = target.__class__.__doc__
@@ -52,6 +52,28 @@ def view_wrapper(request, **view_params):
     return view_wrapper
 
 
+def build_async_as_view_wrapper(target):
+    """
+    Like `build_as_view_wrapper`, but returns an async view for ASGI. The
+    bind, dispatch and render, and with them all queries and form saves,
+    run synchronously in a worker thread through `sync_to_async`, the same
+    way Django runs a sync view under ASGI.
+    """
+    from asgiref.sync import sync_to_async
+    sync_view_wrapper = build_as_view_wrapper(target)
+    target = sync_view_wrapper.__iommi_target__
+    render_in_thread = sync_to_async(sync_view_wrapper, thread_sensitive=True)
+
+    async def view_wrapper(request, **view_params):
+        return await render_in_thread(request, **view_params)
+
+    view_wrapper.__name__ = f'{target.__class__.__name__}.as_async_view'
+    view_wrapper.__doc__ = target.__class__.__doc__
+    view_wrapper.__iommi_target__ = target
+
+    return view_wrapper
+
+
 def capitalize(s):
     if isinstance(s, SafeText):
         return SafeText(capitalize('' + s))  # str(s) will give you back SafeText, and then we have infinite recursion
@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import pytest
 from django.http import HttpResponse
 from django.template import RequestContext
@@ -10,13 +13,16 @@
 from tri_struct import Struct
 
 from iommi import (
+    Form,
     Fragment,
     MISSING,
     Page,
+    Table,
 )
 from iommi._web_compat import Template
 from iommi.base import (
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     capitalize,
     get_display_name,
     get_wrapped_view,
@@ -51,6 +57,57 @@ class Foo(Fragment):
     assert vw.__name__ == 'Foo.as_view'
 
 
+def test_build_async_as_view_wrapper():
+    pytest.importorskip('asgiref.sync')
+
+    class Foo(Fragment):
+        """
+        docs
+        """
+
+        pass
+
+    vw = build_async_as_view_wrapper(Foo())
+    assert asyncio.iscoroutinefunction(vw)
+    assert vw.__doc__ == Foo.__doc__
+    assert vw.__name__ == 'Foo.as_async_view'
+    assert vw.__iommi_target__.is_refine_done
+
+
+@pytest.mark.django_db
+def test_as_async_view():
+    async_to_sync = pytest.importorskip('asgiref.sync').async_to_sync
+    Foo.objects.create(foo=7)
+    table = Table(auto__model=Foo)
+
+    expected = table.as_view()(req('get')).content
+    response = async_to_sync(table.as_async_view())(req('get'))
+    assert response.content == expected
+    assert '<td class="rj">7</td>' in response.content.decode()
+
+    # Dispatch to an endpoint
+    response = async_to_sync(table.as_async_view())(req('get', **{'/endpoints/tbody': ''}))
+    assert '<td class="rj">7</td>' in json.loads(response.content)['html']
+
+
+@pytest.mark.django_db
+def test_as_async_view_form_save():
+    async_to_sync = pytest.importorskip('asgiref.sync').async_to_sync
+    view = Form.create(auto__model=Foo).as_async_view()
+    response = async_to_sync(view)(req('post', foo='17', **{'-submit': ''}))
+    assert response.status_code == 302
+    assert Foo.objects.get().foo == 17
+
+
+@pytest.mark.django_db
+def test_arender_to_response():
+    async_to_sync = pytest.importorskip('asgiref.sync').async_to_sync
+    Foo.objects.create(foo=7)
+    page = Page(parts__foo=Table(auto__model=Foo)).bind(request=req('get'))
+    response = async_to_sync(page.arender_to_response)()
+    assert '<td class="rj">7</td>' in response.content.decode()
+
+
 def test_capitalize():
     assert capitalize('xFooBarBaz Foo oOOOo') == 'XFooBarBaz Foo oOOOo'
 
@@ -0,0 +1,293 @@
+"""
+Columnar rows for tables of big in-memory datasets. Requires NumPy.
+
+.. code-block:: python
+
+    rows = ColumnarRows(dict(
+        name=numpy.array(names),
+        year=numpy.array(years),
+    ))
+
+    Table(
+        rows=rows,
+        columns__name__filter__include=True,
+        columns__year=Column.integer(filter__include=True),
+    )
+
+Sorting uses an `argsort` per column that is calculated once and kept on
+the `ColumnarRows`, the filters compile to boolean masks, and the paginator
+slices an array of indexes. Row objects are only created for the rows that
+are rendered. Create the `ColumnarRows` once and reuse it for all requests
+to keep the sort cache.
+"""
+from functools import reduce
+
+from django.db.models import (
+    F,
+    Q,
+)
+from tri_struct import Struct
+
+from iommi.query import (
+    LOOKUP_FUNCTIONS,
+    q_to_predicate,
+    split_lookup,
+)
+from iommi.table import MIN
+
+
+class _Data:
+    def __init__(self, columns):
+        self.columns = columns
+        self.length = len(next(iter(columns.values()))) if columns else 0
+        self.argsort_by_name = {}
+        self.rank_by_name = {}
+
+
+class ColumnarRows:
+    """
+    Rows stored as columns, from a dict of NumPy arrays of the same length or
+    a NumPy structured array. Filtering, sorting and slicing return new
+    `ColumnarRows` that share the columns and the sort cache, and iterating
+    gives a `Struct` per row.
+
+    Missing values are `None` in arrays of objects and `NaN` in arrays of
+    floats.
+    """
+
+    def __init__(self, data, *, _index=None):
+        import numpy
+
+        if isinstance(data, _Data):
+            self._data = data
+        else:
+            if isinstance(data, numpy.ndarray):
+                assert data.dtype.names, 'ColumnarRows needs a structured array or a dict of arrays'
+                columns = {name: data[name] for name in data.dtype.names}
+            else:
+                columns = {name: numpy.asarray(column) for name, column in data.items()}
+            assert len({len(column) for column in columns.values()}) <= 1, 'All columns must have the same length'
+            self._data = _Data(columns)
+
+        self.index = numpy.arange(self._data.length) if _index is None else _index
+
+    def __repr__(self):
+        return f'<ColumnarRows {len(self)} rows of {self._data.length}: {", ".join(self._data.columns)}>'
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        names = list(self._data.columns)
+        chunk_size = 1000
+        for start in range(0, len(self.index), chunk_size):
+            index = self.index[start:start + chunk_size]
+            values = [_to_list(self._data.columns[name][index]) for name in names]
+            for row in zip(*values):
+                yield Struct(zip(names, row))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._derive(self.index[item])
+        i = self.index[item]
+        return Struct({name: _to_list(column[i:i + 1])[0] for name, column in self._data.columns.items()})
+
+    def _derive(self, index):
+        return ColumnarRows(self._data, _index=index)
+
+    def _mask_of_index(self):
+        import numpy
+
+        mask = numpy.zeros(self._data.length, dtype=bool)
+        mask[self.index] = True
+        return mask
+
+    # Sorting
+
+    def _argsort(self, name):
+        import numpy
+
+        result = self._data.argsort_by_name.get(name)
+        if result is None and name.startswith('-'):
+            # Descending, with equal values in the original order like for a list
+            result = numpy.argsort(-self._rank(name[1:]), kind='stable')
+            self._data.argsort_by_name[name] = result
+        elif result is None:
+            column = self._data.columns[name]
+            try:
+                result = numpy.argsort(column, kind='stable')
+            except TypeError:
+                # Arrays of objects with None in them
+                values = column.tolist()
+                result = numpy.array(sorted(range(len(values)), key=lambda i: MIN if values[i] is None else values[i]), dtype=numpy.intp)
+            self._data.argsort_by_name[name] = result
+        return result
+
+    def _rank(self, name):
+        """
+        The position of each row when sorted by the column `name`, where equal values get the same rank.
+        """
+        import numpy
+
+        result = self._data.rank_by_name.get(name)
+        if result is None:
+            argsort = self._argsort(name)
+            sorted_column = self._data.columns[name][argsort]
+            result = numpy.empty(self._data.length, dtype=numpy.intp)
+            if self._data.length:
+                changes = numpy.asarray(sorted_column[1:] != sorted_column[:-1], dtype=bool)
+                result[argsort] = numpy.concatenate([[0], numpy.cumsum(changes)])
+            self._data.rank_by_name[name] = result
+        return result
+
+    def order_by(self, *fields):
+        """
+        Sort the rows django style: `order_by('-year', 'name')`.
+        """
+        import numpy
+
+        fields = [x for x in fields if x]
+        if not fields:
+            return self
+
+        for field in fields:
+            assert field.lstrip('-') in self._data.columns, f'Unknown column {field.lstrip("-")}, available columns: {", ".join(self._data.columns)}'
+
+        if len(fields) == 1:
+            argsort = self._argsort(fields[0])
+            if len(self.index) == self._data.length:
+                return self._derive(argsort)
+            # Keep the rows of this subset, in the order of the argsort of all rows
+            return self._derive(argsort[self._mask_of_index()[argsort]])
+
+        # numpy.lexsort sorts by the last key first
+        keys = [
+            -self._rank(field[1:])[self.index] if field.startswith('-') else self._rank(field)[self.index]
+            for field in reversed(fields)
+        ]
+        return self._derive(self.index[numpy.lexsort(keys)])
+
+    # Filtering
+
+    def filter(self, q):
+        """
+        The rows that match `q`, a `Q` object like the ones `Query.parse_query_string` returns.
+        """
+        mask = self._mask(q)
+        return self._derive(self.index[mask[self.index]])
+
+    def _mask(self, q):
+        import numpy
+
+        if isinstance(q, Q):
+            masks = [self._mask(child) for child in q.children]
+            if masks:
+                result = reduce(numpy.logical_and if q.connector == Q.AND else numpy.logical_or, masks)
+            else:
+                result = numpy.ones(self._data.length, dtype=bool)
+            return ~result if q.negated else result
+
+        key, value = q
+        path, lookup = split_lookup(key)
+
+        column = self._data.columns.get(path)
+        other = self._data.columns.get(value.name) if isinstance(value, F) else value
+        if column is None or (isinstance(value, F) and other is None):
+            # Not a column, like a path into the values. Fall back to testing the rows one at a time.
+            predicate = q_to_predicate(q)
+            return numpy.fromiter((predicate(row) for row in self._derive(numpy.arange(self._data.length))), dtype=bool, count=self._data.length)
+
+        result = _vectorized_lookup(column, lookup, other)
+        if result is not None:
+            return result
+
+        f = LOOKUP_FUNCTIONS[lookup]
+        a = _to_list(column)
+        if isinstance(value, F):
+            return numpy.fromiter((f(x, y) for x, y in zip(a, _to_list(other))), dtype=bool, count=len(a))
+        return numpy.fromiter((f(x, value) for x in a), dtype=bool, count=len(a))
+
+
+_NUMBER_KINDS = 'biuf'
+
+
+def _to_list(column):
+    """
+    The values of `column` as Python objects. `tolist()` gives ints for
+    datetimes and timedeltas finer than microseconds (like the default
+    `datetime64[ns]` of pandas), so those are converted to microseconds first.
+    """
+    import numpy
+
+    if column.dtype.kind in 'Mm' and numpy.datetime_data(column.dtype)[0] in ('ns', 'ps', 'fs', 'as'):
+        column = column.astype('datetime64[us]' if column.dtype.kind == 'M' else 'timedelta64[us]')
+    return column.tolist()
+
+
+def _kind_of_value(value):
+    """
+    The NumPy dtype kind that `value` compares like, or `''`.
+    """
+    import numpy
+
+    if isinstance(value, numpy.ndarray):
+        return value.dtype.kind
+    if isinstance(value, str):
+        return 'U'
+    if isinstance(value, (bool, int, float)):
+        return 'f'
+    return ''
+
+
+def _vectorized_lookup(column, lookup, value):
+    """
+    The mask for `lookup` on a whole column, or `None` if it can't be done vectorized for these types.
+    """
+    import numpy
+
+    kind = column.dtype.kind
+
+    if lookup == 'isnull' or lookup == 'exact' and value is None:
+        is_null = value if lookup == 'isnull' else True
+        if kind == 'f':
+            return numpy.isnan(column) == bool(is_null)
+        if kind in _NUMBER_KINDS or kind == 'U':
+            return numpy.full(len(column), not is_null)
+        return None
+
+    value_kind = _kind_of_value(value)
+    is_string = kind == 'U' and value_kind == 'U'
+    is_number = kind in _NUMBER_KINDS and value_kind in _NUMBER_KINDS
+    if not (is_string or is_number):
+        return None
+
+    if lookup == 'exact':
+        return column == value
+    if lookup == 'gt':
+        return column > value
+    if lookup == 'gte':
+        return column >= value
+    if lookup == 'lt':
+        return column < value
+    if lookup == 'lte':
+        return column <= value
+    if lookup == 'in':
+        return None
+
+    if not is_string or isinstance(value, numpy.ndarray):
+        return None
+
+    if lookup.startswith('i'):
+        column = numpy.char.lower(column)
+        value = value.lower()
+        lookup = lookup[1:]
+
+    if lookup == 'exact':
+        return column == value
+    if lookup == 'contains':
+        return numpy.char.find(column, value) >= 0
+    if lookup == 'startswith':
+        return numpy.char.startswith(column, value)
+    if lookup == 'endswith':
+        return numpy.char.endswith(column, value)
+    return None
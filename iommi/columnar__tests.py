@@ -0,0 +1,174 @@
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+)
+from unittest import mock
+
+import pytest
+from django.db.models import (
+    F,
+    Q,
+)
+from tri_struct import Struct
+
+from iommi import (
+    Column,
+    Table,
+)
+from iommi.query import (
+    Filter,
+    q_to_predicate,
+    Query,
+    QueryException,
+)
+from iommi.table import ordered_by_on_list
+from tests.helpers import req
+
+numpy = pytest.importorskip('numpy')
+
+from iommi.columnar import ColumnarRows  # noqa: E402
+
+
+def columnar_rows():
+    return ColumnarRows(dict(
+        a=numpy.array([3, 1, 4, 1, 5, 9, 2, 6]),
+        b=numpy.array(['foo', 'Bar', 'FOOD', 'baz', 'food', 'quux', 'bar', 'x']),
+        c=numpy.array([0.5, 1.5, 0.5, 2.5, 1.5, 0.5, 3.5, 0.5]),
+        d=numpy.array(['x', None, 'y', 'x', None, 'z', 'y', 'x'], dtype=object),
+    ))
+
+
+@pytest.mark.parametrize(
+    'query_string',
+    [
+        'a=1',
+        'a!=1',
+        'a>3',
+        'a>=3',
+        'a<3',
+        'a<=3',
+        'c>1',
+        'a>c',
+        'b=foo',
+        'b:oo',
+        'b!:OO',
+        'b_case=foo',
+        'b_case:oo',
+        'd=x',
+        'd:X',
+        'd=null',
+        'a=1 or a=9 and b:u',
+        '(a=1 or a=9) and b:u',
+        '"foo"',
+    ],
+)
+def test_filter_is_the_same_as_for_a_list(query_string):
+    class MyQuery(Query):
+        a = Filter.integer()
+        b = Filter(freetext=True)
+        b_case = Filter.case_sensitive(attr='b')
+        c = Filter.float()
+        d = Filter()
+
+    rows = columnar_rows()
+    q = MyQuery().bind(request=None).parse_query_string(query_string)
+    expected = [row for row in rows if q_to_predicate(q)(row)]
+    assert list(rows.filter(q)) == expected
+    assert list(rows.order_by('-a').filter(q)) == ordered_by_on_list(expected, 'a', is_desc=True)
+
+
+def test_filter_fallbacks():
+    rows = columnar_rows()
+    # Not vectorized
+    assert [row.a for row in rows.filter(Q(a__in=[1, 9]))] == [1, 1, 9]
+    assert [row.a for row in rows.filter(Q(a__iexact=1))] == [1, 1]
+    # Values that can't be compared, and lookups that are not supported, are errors like for a list
+    with pytest.raises(QueryException, match="Can not compare 3 and 'x'"):
+        rows.filter(Q(a__gt=F('d')))
+    with pytest.raises(QueryException, match="Can not compare 'foo' and 0.5"):
+        rows.filter(Q(b__lt=F('c')))
+    with pytest.raises(QueryException, match='The lookup "range" is not supported'):
+        rows.filter(Q(a__range=(1, 2)))
+    # Not a column
+    assert [row.a for row in rows.filter(Q(b__upper='FOO'))] == []
+    assert [row.a for row in rows.filter(Q(a__gt=F('not_a_column')))] == []
+    # NaN is null in float columns
+    rows = ColumnarRows(dict(a=numpy.array([1.0, numpy.nan])))
+    assert [numpy.isnan(row.a) for row in rows.filter(Q(a=None))] == [True]
+    assert [row.a for row in rows.filter(Q(a__isnull=False))] == [1.0]
+
+
+def test_order_by():
+    rows = columnar_rows()
+    as_list = list(rows)
+    assert list(rows.order_by('a')) == ordered_by_on_list(as_list, 'a')
+    assert list(rows.order_by('d')) == ordered_by_on_list(as_list, 'd')
+    assert [row.a for row in rows.order_by('-a')] == [9, 6, 5, 4, 3, 2, 1, 1]
+    assert [(row.c, row.a) for row in rows.order_by('c', '-a')] == sorted(((row.c, row.a) for row in as_list), key=lambda x: (x[0], -x[1]))
+    assert list(rows.order_by()) == as_list
+
+    # The argsort of a column is calculated once per direction and shared by the derived rows
+    with mock.patch('numpy.argsort', wraps=numpy.argsort) as argsort:
+        rows = columnar_rows()
+        rows.order_by('a')
+        filtered = rows.filter(Q(a__gt=2))
+        assert [row.a for row in filtered.order_by('a')] == [3, 4, 5, 6, 9]
+        assert [row.a for row in filtered[1:3].order_by('-a')] == [5, 4]
+        assert [row.a for row in filtered.order_by('-a')] == [9, 6, 5, 4, 3]
+    assert argsort.call_count == 2
+
+    with pytest.raises(AssertionError) as e:
+        rows.order_by('foo')
+    assert str(e.value) == 'Unknown column foo, available columns: a, b, c, d'
+
+
+def test_rows():
+    structured = numpy.array([(1, 'a'), (2, 'b'), (3, 'c')], dtype=[('x', int), ('y', 'U1')])
+    rows = ColumnarRows(structured)
+    assert repr(rows) == '<ColumnarRows 3 rows of 3: x, y>'
+    assert len(rows) == 3
+    assert rows[1] == Struct(x=2, y='b')
+    assert type(rows[1].x) is int
+    assert list(rows[1:]) == [Struct(x=2, y='b'), Struct(x=3, y='c')]
+    assert repr(rows[1:]) == '<ColumnarRows 2 rows of 3: x, y>'
+
+    with pytest.raises(AssertionError):
+        ColumnarRows(numpy.array([1, 2]))
+
+    with pytest.raises(AssertionError):
+        ColumnarRows(dict(a=[1, 2], b=[1]))
+
+
+def test_rows_datetimes():
+    rows = ColumnarRows(dict(
+        at=numpy.array(['2020-01-02T03:04:05.123456789', 'NaT'], dtype='datetime64[ns]'),
+        took=numpy.array([1500, 2000000], dtype='timedelta64[ns]'),
+        day=numpy.array(['2020-01-02', '2020-01-03'], dtype='datetime64[D]'),
+    ))
+    first = Struct(at=datetime(2020, 1, 2, 3, 4, 5, 123456), took=timedelta(microseconds=1), day=date(2020, 1, 2))
+    assert rows[0] == first
+    assert list(rows) == [first, Struct(at=None, took=timedelta(seconds=0.002), day=date(2020, 1, 3))]
+    assert list(rows.filter(Q(took__in=[timedelta(seconds=0.002)]))) == [rows[1]]
+
+
+def test_table():
+    rows = ColumnarRows(dict(
+        a=numpy.arange(1000),
+        b=numpy.array([f'row {i}' for i in range(1000)]),
+    ))
+    table = Table(
+        rows=rows,
+        page_size=3,
+        columns__a=Column.integer(filter__include=True),
+        columns__b=Column(filter__include=True),
+    ).refine_done()
+
+    with mock.patch.object(ColumnarRows, '__iter__', autospec=True, side_effect=ColumnarRows.__iter__) as iter_rows:
+        t = table.bind(request=req('get', **{'-query/query': 'a>=990 or b="row 17"', 'order': '-a', 'page': '2'}))
+        html = t.__html__()
+    # Only the visible page is turned into rows
+    assert [len(call.args[0]) for call in iter_rows.call_args_list] == [3]
+    assert [row.a for row in t.visible_rows] == [996, 995, 994]
+    assert t.parts.page.count == 11
+    assert '<td class="rj">996</td>' in html
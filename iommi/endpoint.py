@@ -5,9 +5,13 @@
     Refinable,
 )
 
-from iommi.base import keys
+from iommi.base import (
+    items,
+    keys,
+)
 from iommi.refinable import EvaluatedRefinable
 from iommi.traversable import (
+    build_long_path_by_path,
     get_long_path_by_path,
     get_path_by_long_path,
     Traversable,
@@ -71,23 +75,32 @@ def own_evaluate_parameters(self):
         return dict(endpoint=self)
 
 
-def find_target(*, path, root):
+def _long_path_of_dispatch_path(*, path, long_path_by_path, path_by_long_path):
     assert path.startswith(DISPATCH_PATH_SEPARATOR)
     p = path[1:]
 
-    long_path = get_long_path_by_path(root).get(p)
-    if long_path is None:
+    long_path = long_path_by_path.get(p)
+    if long_path is None and p in path_by_long_path:
         long_path = p
-        if long_path not in keys(get_path_by_long_path(root)):
+    return long_path
 
-            def format_paths(paths):
-                return '\n        '.join(["''" if not x else x for x in keys(paths)])
 
-            raise InvalidEndpointPathException(
-                f"Given path {path} not found.\n"
-                f"    Short alternatives:\n        {format_paths(get_long_path_by_path(root))}\n"
-                f"    Long alternatives:\n        {format_paths(get_path_by_long_path(root))}"
-            )
+def find_target(*, path, root):
+    long_path = _long_path_of_dispatch_path(
+        path=path,
+        long_path_by_path=get_long_path_by_path(root),
+        path_by_long_path=get_path_by_long_path(root),
+    )
+    if long_path is None:
+
+        def format_paths(paths):
+            return '\n        '.join(["''" if not x else x for x in keys(paths)])
+
+        raise InvalidEndpointPathException(
+            f"Given path {path} not found.\n"
+            f"    Short alternatives:\n        {format_paths(get_long_path_by_path(root))}\n"
+            f"    Long alternatives:\n        {format_paths(get_path_by_long_path(root))}"
+        )
 
     node = root
     for part in long_path.split('/'):
@@ -100,6 +113,31 @@ def format_paths(paths):
     return node
 
 
+def get_dispatch_target_long_path(node):
+    """
+    The long path of the target of the ajax dispatch of the current request,
+    or `None` if the request is not an ajax dispatch. This can be used at bind
+    time to skip binding things that the target does not need.
+    """
+    root = node.iommi_root()
+    if not hasattr(root, '_dispatch_target_long_path'):
+        long_path = None
+        request = root.get_request()
+        if request is not None and request.method == 'GET':
+            paths = [x for x in keys(request.GET) if x.startswith(DISPATCH_PREFIX)]
+            if len(paths) == 1:
+                # The path maps are cached on the root the first time they are needed after bind. Building
+                # them here, in the middle of the bind, could give different short paths, so don't cache this one.
+                long_path_by_path = build_long_path_by_path(root)
+                long_path = _long_path_of_dispatch_path(
+                    path=paths[0],
+                    long_path_by_path=long_path_by_path,
+                    path_by_long_path={v: k for k, v in items(long_path_by_path)},
+                )
+        root._dispatch_target_long_path = long_path
+    return root._dispatch_target_long_path
+
+
 def perform_ajax_dispatch(*, root, path, value):
     assert root._is_bound
 
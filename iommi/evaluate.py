@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 
 from tri_declarative import Namespace
 
@@ -7,36 +8,42 @@
     keys,
 )
 
-_matches_cache = {}
+MATCHES_CACHE_SIZE = 4096
 
+_interned_signatures = {}
 
-def matches(caller_parameters, callee_parameters, __match_empty=False):
-    cache_key = ';'.join((caller_parameters, callee_parameters))  # pragma: no mutate
-    cached_value = _matches_cache.get(
-        cache_key, None
-    )  # pragma: no mutate (mutation changes this to cached_value = None, which just slows down the code)
-    if cached_value is not None:
-        return cached_value
-
-    caller = set(caller_parameters.split(',')) if caller_parameters else set()
 
+@lru_cache(maxsize=MATCHES_CACHE_SIZE)
+def _parse_callee_parameters(callee_parameters):
     a, b, c = callee_parameters.split('|')
-    required = set(a.split(',')) if a else set()
-    optional = set(b.split(',')) if b else set()
+    required = frozenset(a.split(',')) if a else frozenset()
+    optional = frozenset(b.split(',')) if b else frozenset()
     wildcard = c == '*'
+    return required, optional, wildcard
+
+
+@lru_cache(maxsize=MATCHES_CACHE_SIZE)
+def _matches(caller_parameters, callee_parameters, __match_empty):
+    required, optional, wildcard = _parse_callee_parameters(callee_parameters)
 
     if not __match_empty and not required and not optional and wildcard:
         return False  # Special case to not match no-specification function "lambda **whatever: ..."
 
+    caller = frozenset(caller_parameters)
     if wildcard:
-        result = caller >= required
+        return caller >= required
     else:
-        result = required <= caller <= required.union(optional)
+        return required <= caller <= required | optional
 
-    _matches_cache[
-        cache_key
-    ] = result  # pragma: no mutate (mutation changes result to None which just makes things slower)
-    return result
+
+def matches(caller_parameters, callee_parameters, __match_empty=False):
+    """
+    :param caller_parameters: a signature from `signature_from_kwargs`, or a string of comma separated parameter names
+    :param callee_parameters: a signature from `get_signature`
+    """
+    if isinstance(caller_parameters, str):
+        caller_parameters = intern_signature(tuple(sorted(caller_parameters.split(','))) if caller_parameters else ())
+    return _matches(caller_parameters, callee_parameters, __match_empty)
 
 
 def get_callable_description(c):
@@ -51,13 +58,16 @@ def get_callable_description(c):
 
 
 def evaluate(func_or_value, __signature=None, __strict=False, __match_empty=True, **kwargs):
+    """
+    Call `func_or_value` with the subset of `kwargs` it asks for, if it's a callable with a matching signature. Pass `__signature=signature_from_kwargs(kwargs)` if you evaluate many things with the same kwargs, to not calculate it for every call.
+    """
     if callable(func_or_value):
-        if __signature is None:
-            __signature = signature_from_kwargs(kwargs)
-
         callee_parameters = get_signature(func_or_value)
-        if callee_parameters is not None and matches(__signature, callee_parameters, __match_empty):
-            return func_or_value(**kwargs)
+        if callee_parameters is not None:
+            if __signature is None:
+                __signature = signature_from_kwargs(kwargs)
+            if _matches(__signature, callee_parameters, __match_empty):
+                return func_or_value(**kwargs)
 
         if __strict:
             assert isinstance(func_or_value, Namespace) and 'call_target' not in func_or_value, (
@@ -73,7 +83,7 @@ def evaluate(func_or_value, __signature=None, __strict=False, __match_empty=True
 
 def evaluate_strict(func_or_value, __signature=None, __match_empty=True, **kwargs):
     # noinspection PyArgumentEqualDefault
-    return evaluate(func_or_value, __signature=None, __strict=True, __match_empty=__match_empty, **kwargs)
+    return evaluate(func_or_value, __signature=__signature, __strict=True, __match_empty=__match_empty, **kwargs)
 
 
 def get_signature(func):
@@ -114,20 +124,39 @@ def get_signature(func):
 
 
 def signature_from_kwargs(kwargs):
-    return ','.join(sorted(keys(kwargs)))
+    """
+    The signature of a call with `kwargs`, as an interned tuple of the sorted parameter names.
+    """
+    # The lookup is on the names in the order they were given to avoid sorting in the common case
+    names = tuple(kwargs)
+    signature = _interned_signatures.get(names)
+    if signature is None:
+        signature = intern_signature(tuple(sorted(names)))
+        _interned_signatures[names] = signature
+    return signature
+
+
+def intern_signature(signature):
+    if len(_interned_signatures) >= MATCHES_CACHE_SIZE:  # pragma: no mutate
+        _interned_signatures.clear()
+    return _interned_signatures.setdefault(signature, signature)
 
 
-def evaluate_members(obj, keys, **kwargs):
+def evaluate_members(obj, keys, __signature=None, **kwargs):
+    if __signature is None:
+        __signature = signature_from_kwargs(kwargs)
     for key in keys:
-        evaluate_member(obj, key, **kwargs)
+        evaluate_member(obj, key, __signature=__signature, **kwargs)
 
 
-def evaluate_member(obj, key, strict=True, **kwargs):
+def evaluate_member(obj, key, strict=True, __signature=None, **kwargs):
     value = getattr(obj, key)
-    new_value = evaluate(value, __strict=strict, **kwargs)
+    new_value = evaluate(value, __signature=__signature, __strict=strict, **kwargs)
     if new_value is not value:
         setattr(obj, key, new_value)
 
 
-def evaluate_strict_container(c, **kwargs):
-    return Namespace({k: evaluate_strict(v, **kwargs) for k, v in items(c)})
+def evaluate_strict_container(c, __signature=None, **kwargs):
+    if __signature is None:
+        __signature = signature_from_kwargs(kwargs)
+    return Namespace({k: evaluate_strict(v, __signature=__signature, **kwargs) for k, v in items(c)})
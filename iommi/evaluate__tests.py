@@ -1,6 +1,7 @@
 import pytest
 
 from iommi.evaluate import (
+    _matches,
     evaluate,
     evaluate_member,
     evaluate_strict,
@@ -8,7 +9,9 @@
     get_callable_description,
     get_signature,
     matches,
+    MATCHES_CACHE_SIZE,
     Namespace,
+    signature_from_kwargs,
 )
 
 
@@ -206,3 +209,33 @@ def __init__(self):
 
     evaluate_member(foo, 'foo', x=3)
     assert foo.foo == 3
+
+
+def test_signature_from_kwargs():
+    signature = signature_from_kwargs(dict(b=1, a=2))
+    assert signature == ('a', 'b')
+    assert signature_from_kwargs(dict(a=3, b=4)) is signature
+    assert signature_from_kwargs(dict(b=5, a=6)) is signature
+    assert signature_from_kwargs({}) == ()
+
+
+def test_matches_with_signature():
+    assert matches(signature_from_kwargs(dict(a=1, b=2)), "a,b||")
+    assert not matches(signature_from_kwargs(dict(a=1, b=2, d=3)), "a,b|c|")
+    assert matches(signature_from_kwargs(dict(b=1, a=2)), "a||*")
+    assert matches("b,a", "a,b||")
+
+
+def test_matches_cache_is_bounded():
+    assert _matches.cache_info().maxsize == MATCHES_CACHE_SIZE
+
+
+def test_evaluate_with_signature():
+    def f(a, b):
+        return a + b
+
+    kwargs = dict(a=1, b=2)
+    signature = signature_from_kwargs(kwargs)
+    assert evaluate(f, __signature=signature, **kwargs) == 3
+    assert evaluate_strict(f, __signature=signature, **kwargs) == 3
+    assert evaluate_strict_container(Namespace(foo=f), __signature=signature, **kwargs) == Namespace(foo=3)
@@ -71,6 +71,7 @@
 from iommi.attrs import Attrs
 from iommi.base import (
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     capitalize,
     get_display_name,
     items,
@@ -97,6 +98,7 @@
     AutoConfig,
     create_members_from_model,
     get_search_fields,
+    invalidate_members_from_model_cache,
     member_from_model,
     NoRegisteredSearchFieldException,
 )
@@ -161,6 +163,7 @@ def register_field_factory(django_field_class, *, shortcut_name=MISSING, factory
         factory = Shortcut(call_target__attribute=shortcut_name)
 
     _field_factory_by_field_type[django_field_class] = factory
+    invalidate_members_from_model_cache()
 
 
 def create_object__post_handler(*, form, **kwargs):
@@ -1781,3 +1784,6 @@ def delete(cls, call_target, **kwargs):
 
     def as_view(self):
         return build_as_view_wrapper(self)
+
+    def as_async_view(self):
+        return build_async_as_view_wrapper(self)
@@ -1,4 +1,5 @@
 import warnings
+from copy import copy
 from typing import (
     Iterator,
     List,
@@ -19,15 +20,65 @@
 from tri_struct import Struct
 
 from iommi.base import (
+    items,
     MISSING,
 )
 from iommi.evaluate import evaluate
 from iommi.refinable import RefinableObject
 
 
+MEMBERS_FROM_MODEL_CACHE_SIZE = 1024
+
+_members_from_model_cache = {}
+
+
+def invalidate_members_from_model_cache():
+    """
+    Clear the cache of `create_members_from_model`. This is called when a
+    factory is registered.
+    """
+    _members_from_model_cache.clear()
+
+
 def create_members_from_model(
     *, member_class, model, include: List[str] = None, exclude: List[str] = None, default_included=True,
 ):
+    """
+    Create the members (columns, fields or filters) for the fields of
+    `model`. The members are created once per set of arguments. Each call
+    gets copies of them, so they can be refined and named independently.
+    """
+    key = (
+        member_class,
+        model,
+        tuple(include) if include is not None else None,
+        tuple(exclude) if exclude is not None else None,
+        default_included is False,
+    )
+    try:
+        members = _members_from_model_cache.get(key)
+    except TypeError:
+        # Unhashable arguments
+        key = None
+        members = None
+
+    if members is None:
+        members = _create_members_from_model(
+            member_class=member_class,
+            model=model,
+            include=include,
+            exclude=exclude,
+            default_included=default_included,
+        )
+        if key is not None:
+            if len(_members_from_model_cache) >= MEMBERS_FROM_MODEL_CACHE_SIZE:
+                _members_from_model_cache.clear()
+            _members_from_model_cache[key] = members
+
+    return Struct((name, copy(member)) for name, member in items(members))
+
+
+def _create_members_from_model(*, member_class, model, include, exclude, default_included):
     members = Struct()
 
     check_list(model, include, 'include')
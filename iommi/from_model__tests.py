@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from django.contrib.auth.models import User
 from django.db.models import (
@@ -11,7 +13,9 @@
     Field,
     Form,
 )
+from iommi.form import register_field_factory
 from iommi.from_model import (
+    _create_members_from_model,
     get_field_path,
     get_search_fields,
     NoRegisteredSearchFieldException,
@@ -254,3 +258,34 @@ def test_weird_override_bug_failing_case2(MyField):
         fields__foo__call_target__attribute='float',
     )
     assert form.bind().fields.foo.__tri_declarative_shortcut_stack == ['float']
+
+
+@pytest.mark.filterwarnings("ignore:Model 'tests.cachedmembersmodel' was already registered")
+def test_create_members_from_model_is_cached():
+    from django.db.models import Field as DjangoField
+
+    class CachedMembersModel(Model):
+        foo = IntegerField()
+        bar = CharField()
+
+    class UnusedField(DjangoField):
+        pass
+
+    with mock.patch('iommi.from_model._create_members_from_model', wraps=_create_members_from_model) as create:
+        first = Form.fields_from_model(model=CachedMembersModel)
+        second = Form.fields_from_model(model=CachedMembersModel)
+        assert create.call_count == 1
+        assert list(first.keys()) == list(second.keys()) == ['id', 'foo', 'bar']
+        assert first.foo is not second.foo
+
+        # The members can be refined and bound independently
+        f = Form(auto__model=CachedMembersModel, fields__foo__display_name='Changed').bind(request=req('get'))
+        assert f.fields.foo.display_name == 'Changed'
+        assert Form(auto__model=CachedMembersModel).bind(request=req('get')).fields.foo.display_name == 'Foo'
+
+        Form.fields_from_model(model=CachedMembersModel, include=['foo'])
+        assert create.call_count == 2
+
+        register_field_factory(UnusedField, factory=None)
+        Form.fields_from_model(model=CachedMembersModel)
+        assert create.call_count == 3
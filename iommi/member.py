@@ -21,6 +21,7 @@
 from iommi.refinable import RefinableMembers
 from iommi.sort_after import sort_after
 from iommi.traversable import (
+    invalidate_path_entries,
     Traversable,
 )
 
@@ -220,6 +221,8 @@ def __delitem__(self, name):
         _declared_members = object.__getattribute__(self, '_declared_members')
         _bindable_names.remove(name)
         del _declared_members[name]
+        # The declared members can be shared with other binds, and the paths are cached per declaration
+        invalidate_path_entries()
 
     def get(self, name, *args):
         _force_bind(self, name)
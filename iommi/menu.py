@@ -304,5 +304,19 @@ class DebugMenu(Menu):
             tag='li',
             include=lambda **_: 'iommi.sql_trace.Middleware' in settings.MIDDLEWARE,
         )
+        sql_n_plus_one = MenuItem(
+            display_name=lambda request, **_: f'N+1 ({len(_n_plus_one(request))})',
+            url='?_iommi_sql_trace',
+            attrs__title=lambda request, **_: '\n'.join(f'{x.count} times from {x.origin}' for x in _n_plus_one(request)),
+            attrs__style__color='red',
+            tag='li',
+            include=lambda request, **_: 'iommi.sql_trace.Middleware' in settings.MIDDLEWARE and bool(_n_plus_one(request)),
+        )
 
     return DebugMenu(**kwargs)
+
+
+def _n_plus_one(request):
+    from iommi.sql_trace import sql_debug_n_plus_one
+
+    return sql_debug_n_plus_one(getattr(request, 'iommi_sql_debug_log', None) or [])
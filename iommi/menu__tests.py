@@ -85,6 +85,13 @@ def test_debug_menu():
     )
 
 
+def test_debug_menu_n_plus_one():
+    request = req('get')
+    request.iommi_sql_debug_log = [dict(sql=f'SELECT a FROM b WHERE c = {i}', origin='foo.py:1 in f') for i in range(4)]
+    html = get_debug_menu().bind(request=request).__html__()
+    assert '<li style="color: red" title="4 times from foo.py:1 in f"><a class="link" href="?_iommi_sql_trace">N+1 (1)</a></li>' in html
+
+
 def test_template():
     menu = Menu(template=Template('{{ menu.sub_menu.foo.display_name }}'), sub_menu=dict(foo=MenuItem())).bind(
         request=req('get')
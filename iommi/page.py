@@ -19,6 +19,7 @@
 )
 from iommi.base import (
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     items,
     values,
 )
@@ -41,6 +42,7 @@
     EvaluatedRefinable,
     RefinableMembers,
 )
+from iommi.timing import timed
 from iommi.traversable import Traversable
 
 
@@ -65,6 +67,8 @@ class Page(Part):
         Fragment, str
     ] = Refinable()  # h_tag is evaluated, but in a special way so gets no EvaluatedRefinable type
     parts: Dict[str, PartType] = RefinableMembers()
+    concurrent_queries: bool = EvaluatedRefinable()
+    concurrent_queries_max_workers: int = EvaluatedRefinable()
 
     class Meta:
         member_class = Fragment
@@ -72,6 +76,16 @@ class Meta:
         parts = EMPTY
         context = EMPTY
         h_tag__call_target = Header
+        concurrent_queries = False
+        concurrent_queries_max_workers = 4
+
+    @dispatch
+    def __init__(self, **kwargs):
+        """
+        :param concurrent_queries: Run the queries of the tables of the page (the counts and the rows of the current pages) concurrently on a thread pool when rendering, instead of one table after the other. Each thread uses its own database connection, outside of the transaction of the request, so this does nothing if the request is in a transaction (like with `ATOMIC_REQUESTS`). The current request, language, time zone, SQL trace and timing are carried over to the threads.
+        :param concurrent_queries_max_workers: The most threads (and so database connections) `concurrent_queries` uses for a request. Default 4.
+        """
+        super(Page, self).__init__(**kwargs)
 
     def on_refine_done(self):
         # First we have to up sample parts that aren't Part into Fragment
@@ -103,6 +117,9 @@ def own_evaluate_parameters(self):
     @dispatch(render=lambda rendered: format_html('{}' * len(rendered), *values(rendered)))
     def __html__(self, *, render=None):
         self.context = evaluate_strict_container(self.context or {}, **self.iommi_evaluate_parameters())
+        if self.concurrent_queries:
+            from iommi.table import run_queries_concurrently
+            timed('queries', self, run_queries_concurrently, tables_of_page(self), max_workers=self.concurrent_queries_max_workers)
         request = self.get_request()
         context = {**self.get_context(), **self.iommi_evaluate_parameters()}
         rendered = {'h_tag': as_html(request=request, part=self.h_tag, context=context)}
@@ -115,5 +132,23 @@ def __html__(self, *, render=None):
 
         return render(rendered)
 
-    def as_view(self):
-        return build_as_view_wrapper(self)
+    def as_view(self, stream=False):
+        return build_as_view_wrapper(self, stream=stream)
+
+    def as_async_view(self):
+        return build_async_as_view_wrapper(self)
+
+
+def tables_of_page(page):
+    """
+    The tables among the parts of `page`, and of the pages in it.
+    """
+    from iommi.table import Table
+
+    result = []
+    for part in values(page.parts):
+        if isinstance(part, Table):
+            result.append(part)
+        elif isinstance(part, Page):
+            result.extend(tables_of_page(part))
+    return result
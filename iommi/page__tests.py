@@ -1,23 +1,50 @@
+import threading
 from platform import python_implementation
+from unittest import mock
 
 import pytest
+from django.core.management.color import no_style
+from django.db import (
+    connection,
+    connections,
+)
+from django.db.backends.signals import connection_created
 from django.test import override_settings
+from django.utils.timezone import (
+    get_current_timezone_name,
+    override as timezone_override,
+)
+from django.utils.translation import (
+    get_language,
+    override as translation_override,
+)
 
 from iommi import (
     Fragment,
     html,
     Page,
+    Table,
 )
 from iommi._web_compat import (
     Template,
 )
 from iommi.member import _force_bind_all
 from iommi.part import as_html
+from iommi.thread_locals import (
+    get_current_request,
+    set_current_request,
+)
+from iommi.timing import Middleware
 from tests.helpers import (
     prettify,
     req,
+    staff_req,
     user_req,
 )
+from tests.models import (
+    TBar,
+    TFoo,
+)
 
 
 def test_simple_page():
@@ -134,3 +161,154 @@ def test_title_empty():
 
 def test_title_attr():
     assert '<h1 class="foo">Foo</h1>' == Page(title='foo', h_tag__attrs__class__foo=True).bind(request=req('get')).__html__()
+
+
+@pytest.fixture
+def committed_rows():
+    yield
+    # The rows are committed, so reset the ids for the tests that depend on them
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sql_flush(no_style(), [TBar._meta.db_table, TFoo._meta.db_table], reset_sequences=True):
+            cursor.execute(sql)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_queries(committed_rows):
+    foo = TFoo.objects.create(a=1, b='foo')
+    TFoo.objects.create(a=2, b='bar')
+    TBar.objects.create(foo=foo, c=True)
+
+    def page(**kwargs):
+        return Page(
+            parts__foos=Table(auto__model=TFoo, page_size=1),
+            parts__inner=Page(parts__bars=Table(auto__model=TBar)),
+            **kwargs,
+        ).bind(request=req('get'))
+
+    expected = page().__html__()
+
+    threads = []
+
+    def on_connection_created(**_):
+        threads.append(threading.get_ident())
+
+    main_thread_queries = []
+
+    def count_main_thread_queries(execute, sql, *args):
+        main_thread_queries.append(sql)
+        return execute(sql, *args)
+
+    connection_created.connect(on_connection_created)
+    try:
+        p = page(concurrent_queries=True)
+        with connection.execute_wrapper(count_main_thread_queries):
+            assert p.__html__() == expected
+    finally:
+        connection_created.disconnect(on_connection_created)
+
+    assert main_thread_queries == []
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_queries_state_of_the_request(committed_rows):
+    TFoo.objects.create(a=1, b='foo')
+
+    seen = []
+
+    def count(rows, **_):
+        seen.append((threading.get_ident(), get_current_request(), get_language(), get_current_timezone_name()))
+        return rows.count()
+
+    def view(request):
+        return Page(
+            parts=dict(
+                (f'foo{i}', Table(auto__model=TFoo, parts__page__count=count))
+                for i in range(3)
+            ),
+            concurrent_queries=True,
+            concurrent_queries_max_workers=2,
+        ).bind(request=request).render_to_response()
+
+    request = staff_req('get')
+    set_current_request(request)
+    try:
+        with translation_override('sv'), timezone_override('Europe/Stockholm'):
+            Middleware(view)(request)
+    finally:
+        set_current_request(None)
+
+    assert len(seen) == 3
+    # At most two threads
+    assert len({thread for thread, *_ in seen}) <= 2
+    assert threading.get_ident() not in {thread for thread, *_ in seen}
+    assert {tuple(x) for _, *x in seen} == {(request, 'sv', 'Europe/Stockholm')}
+
+    # The spans of the threads are in the timing of the request
+    spans = [(span.kind, span.path, depth) for span, depth in request.iommi_timing.spans()]
+    queries_depth = next(depth for kind, _, depth in spans if kind == 'queries')
+    assert sorted(path for kind, path, _ in spans if kind == 'count') == ['parts/foo0/parts/page', 'parts/foo1/parts/page', 'parts/foo2/parts/page']
+    assert {depth for kind, _, depth in spans if kind == 'count'} == {queries_depth + 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_queries_close_connections_once_per_thread(committed_rows):
+    TFoo.objects.create(a=1, b='foo')
+
+    page = Page(
+        parts=dict(
+            (f'foo{i}', Table(auto__model=TFoo))
+            for i in range(5)
+        ),
+        concurrent_queries=True,
+        concurrent_queries_max_workers=2,
+    ).bind(request=req('get'))
+
+    with mock.patch.object(connections, 'close_all', wraps=connections.close_all) as close_all:
+        html = page.__html__()
+
+    assert html.count('<td>foo</td>') == 5
+    assert close_all.call_count == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_queries_error(committed_rows):
+    def count(**_):
+        raise ZeroDivisionError()
+
+    page = Page(
+        parts__foo=Table(auto__model=TFoo),
+        parts__bar=Table(auto__model=TFoo, parts__page__count=count),
+        concurrent_queries=True,
+    ).bind(request=req('get'))
+
+    with mock.patch.object(connections, 'close_all', wraps=connections.close_all) as close_all:
+        with pytest.raises(ZeroDivisionError):
+            page.__html__()
+
+    assert close_all.call_count == 2
+
+
+@pytest.mark.django_db
+def test_concurrent_queries_in_a_transaction():
+    TFoo.objects.create(a=1, b='foo')
+
+    threads = []
+
+    def on_connection_created(**_):
+        threads.append(threading.get_ident())
+
+    connection_created.connect(on_connection_created)
+    try:
+        # The test runs in a transaction, so the rows are only visible to the connection of this thread
+        html = Page(
+            parts__foos=Table(auto__model=TFoo),
+            parts__bars=Table(auto__model=TFoo),
+            concurrent_queries=True,
+        ).bind(request=req('get')).__html__()
+    finally:
+        connection_created.disconnect(on_connection_created)
+
+    assert threads == []
+    assert html.count('<td>foo</td>') == 2
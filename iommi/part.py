@@ -1,10 +1,12 @@
 import json
 from abc import abstractmethod
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
     Union,
 )
+from uuid import uuid4
 
 from tri_declarative import (
     dispatch,
@@ -18,6 +20,7 @@
     HttpResponse,
     HttpResponseBase,
     mark_safe,
+    StreamingHttpResponse,
     Template,
 )
 from iommi.base import (
@@ -43,6 +46,10 @@
 from iommi.style import (
     get_style_object,
 )
+from iommi.timing import (
+    get_timing,
+    timed,
+)
 from iommi.traversable import (
     Traversable,
 )
@@ -75,6 +82,8 @@ class Part(Traversable):
     # Only the assets used by this part
     assets: Namespace = RefinableMembers()
 
+    _iommi_timed = True
+
     @dispatch(
         extra=EMPTY,
         include=True,
@@ -88,6 +97,29 @@ def __init__(self, **kwargs):
             frame = inspect.currentframe()
             self._instantiated_at_info = get_instantiated_at_info(frame.f_back)
 
+    @classmethod
+    def prepared(cls):
+        """
+        Returns a refine done instance of the class, that is created once per
+        process and shared. This skips the refine, the styling and the creation
+        of the members from the model on each request, leaving only the bind:
+
+        .. code-block:: python
+
+            def albums(request):
+                return AlbumTable.prepared().bind(request=request).render_to_response()
+
+        The instance is created again when the registered styles change. The
+        declaration can not be refined further; make a subclass for that.
+        """
+        from iommi import style
+
+        prepared = cls.__dict__.get('_iommi_prepared')
+        if prepared is None or prepared[0] != style._component_cache_generation:
+            prepared = (style._component_cache_generation, cls().refine_done())
+            cls._iommi_prepared = prepared
+        return prepared[1]
+
     def on_refine_done(self):
         from iommi.asset import Asset
 
@@ -107,7 +139,18 @@ def __str__(self):
         return self.__html__()
 
     def bind(self, *, parent=None, request=None):
-        result = super(Part, self).bind(parent=parent, request=request)
+        timing = get_timing()
+        if timing is None:
+            result = super(Part, self).bind(parent=parent, request=request)
+        else:
+            result = None
+            span = timing.start('bind')
+            try:
+                result = super(Part, self).bind(parent=parent, request=request)
+            finally:
+                span.node = result
+                timing.finish(span)
+
         if result is None:
             return None
         del self
@@ -150,7 +193,7 @@ def dispatch_response_handler(r):
         if dispatch_commands:
             dispatch_target, value = next(iter(dispatch_commands.items()))
             try:
-                result = dispatcher(root=self, path=dispatch_target, value=value)
+                result = timed('dispatch', self, dispatcher, root=self, path=dispatch_target, value=value)
             except InvalidEndpointPathException:
                 if settings.DEBUG:
                     raise
@@ -165,15 +208,32 @@ def dispatch_response_handler(r):
         return None
 
     @dispatch
-    def render_to_response(self, **kwargs):
+    def render_to_response(self, stream=False, **kwargs):
+        """
+        :param stream: return a `StreamingHttpResponse` that sends the page up to the rows of the tables right away, and then the rows in chunks as they are rendered. See `render_root_streaming`.
+        """
         dispatch = self.perform_dispatch(**kwargs)
         if dispatch is not None:
             return dispatch
 
-        response = HttpResponse(render_root(part=self, **kwargs))
+        if stream:
+            response = StreamingHttpResponse(render_root_streaming(part=self, **kwargs))
+        else:
+            response = HttpResponse(render_root(part=self, **kwargs))
         response.iommi_part = self
         return response
 
+    async def arender_to_response(self, **kwargs):
+        """
+        Async version of `render_to_response`, for use in async views. The
+        dispatch and render run in a worker thread through `sync_to_async`,
+        since they query the database. Bind the part in that thread too, by
+        using `as_async_view` or `sync_to_async(part.bind)(request=request)`,
+        as binding can also run queries.
+        """
+        from asgiref.sync import sync_to_async
+        return await sync_to_async(self.render_to_response, thread_sensitive=True)(**kwargs)
+
     def iommi_collected_assets(self):
         return sort_after(self.iommi_root()._iommi_collected_assets)
 
@@ -204,13 +264,83 @@ def get_title(part):
 )
 def render_root(*, part, context, **render):
     assert part._is_bound
-    root_style = get_style_object(part)
-    template_name = root_style.base_template
-    content_block_name = root_style.content_block
 
     # Render early so that all the binds are forced before we look at all_assets,
     # since they are populated as a side-effect
-    content = part.__html__(**render)
+    content = timed('render', part, part.__html__, **render)
+
+    return _render_root_template(part=part, context=context, content=content)
+
+
+@dispatch(
+    render=EMPTY,
+    context=EMPTY,
+)
+def render_root_streaming(*, part, context, **render):
+    """
+    Like `render_root`, but returns an iterator of chunks of the page. The
+    page is rendered and bound right away, except for the parts that
+    registered themselves with `stream_placeholder` (like the rows of a
+    table). The chunks up to the first of them can be sent to the browser
+    before those are rendered. If a template doesn't render each of them
+    exactly once, the page is sent as a single chunk instead.
+    """
+    assert part._is_bound
+    root = part.iommi_root()
+    root._iommi_streamed = streamed = []
+    try:
+        content = timed('render', part, part.__html__, **render)
+    finally:
+        del root._iommi_streamed
+
+    marker = _stream_marker()
+    page = _render_root_template(part=part, context=context, content=mark_safe(marker))
+    assert page.count(marker) == 1, f"The base template of {get_style_object(part)} must render the content exactly once to be streamed"
+    head, tail = page.split(marker)
+
+    if any(content.count(placeholder) != 1 for placeholder, _ in streamed):
+        # A template dropped or repeated a streamed part, so the content can't
+        # be split around them. Render the page in one go instead.
+        for placeholder, placeholder_chunks in streamed:
+            if placeholder in content:
+                content = content.replace(placeholder, ''.join(placeholder_chunks()))
+        return iter([head, content, tail])
+
+    def chunks():
+        rest = content
+        yield head
+        for placeholder, placeholder_chunks in streamed:
+            before, rest = rest.split(placeholder)
+            yield before
+            yield from placeholder_chunks()
+        yield rest
+        yield tail
+
+    return chunks()
+
+
+def _stream_marker():
+    return f'<!-- iommi-stream-{uuid4().hex} -->'
+
+
+def stream_placeholder(part, chunks):
+    """
+    If the page of `part` is rendered with `render_root_streaming`, register
+    `chunks` (a callable returning an iterator of strings) to be streamed in
+    place of the returned placeholder. Otherwise returns `None`.
+    """
+    streamed = getattr(part.iommi_root(), '_iommi_streamed', None)
+    if streamed is None:
+        return None
+    placeholder = _stream_marker()
+    streamed.append((placeholder, chunks))
+    return mark_safe(placeholder)
+
+
+def _render_root_template(*, part, context, content):
+    root_style = get_style_object(part)
+    template_name = root_style.base_template
+    content_block_name = root_style.content_block
 
     assets = part.iommi_collected_assets()
 
@@ -233,6 +363,22 @@ def render_root(*, part, context, **render):
         **context,
     )
 
+    template = get_root_template(template_name, content_block_name)
+    return timed('render_root', part, template.render, context=context, request=part.get_request())
+
+
+ROOT_TEMPLATE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=ROOT_TEMPLATE_CACHE_SIZE)
+def get_root_template(template_name, content_block_name):
+    """
+    Returns the compiled template that `render_root` uses to put the content into the base template of the style.
+
+    The parent template is looked up by the template engine at render time, so the cache only holds the small
+    wrapper template. It is cleared by `clear_root_template_cache`, which is called when the template engines
+    are reset (i.e. when the `TEMPLATES` setting changes or when templates are changed on disk during development).
+    """
     template_string = (
         '{% extends "'
         + template_name
@@ -240,7 +386,11 @@ def render_root(*, part, context, **render):
         + content_block_name
         + ' %}{{ iommi_debug_panel }}{{ content }}{% endblock %}'
     )
-    return get_template_from_string(template_string).render(context=context, request=part.get_request())
+    return get_template_from_string(template_string)
+
+
+def clear_root_template_cache(**_):
+    get_root_template.cache_clear()
 
 
 PartType = Union[Part, str, Template]
@@ -1,22 +1,34 @@
+from pathlib import Path
+
+import django
+import pytest
+
+from django.test import override_settings
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from tri_struct import Struct
 
 from iommi import (
+    Fragment,
     Header,
     Page,
     register_style,
+    Table,
 )
 from iommi._web_compat import Template
 from iommi.part import (
     as_html,
+    clear_root_template_cache,
+    get_root_template,
     get_title,
     render_root,
     request_data,
+    stream_placeholder,
 )
 from iommi.style import Style
 from iommi.style_base import base
 from tests.helpers import req
+from tests.models import TFoo
 
 
 def test_request_data():
@@ -76,3 +88,70 @@ def test_context_processor_is_called_on_render_root():
 
 def test_get_title_of_header():
     assert get_title(Header(children__foo='foo', children__bar='qwe').bind(request=req('get'))) == 'foo'
+
+
+def test_root_template_is_cached():
+    clear_root_template_cache()
+    template = get_root_template('iommi/base.html', 'content')
+    assert get_root_template('iommi/base.html', 'content') is template
+    assert get_root_template('iommi/base.html', 'other_block') is not template
+
+    clear_root_template_cache()
+    assert get_root_template('iommi/base.html', 'content') is not template
+
+
+def test_root_template_cache_is_cleared_when_templates_change():
+    template = get_root_template('iommi/base.html', 'content')
+
+    with override_settings(TEMPLATES=[dict(BACKEND='django.template.backends.django.DjangoTemplates', APP_DIRS=True)]):
+        assert get_root_template('iommi/base.html', 'content') is not template
+
+
+@pytest.mark.skipif(not django.VERSION[:2] >= (2, 2), reason='Requires django 2.2+')
+def test_root_template_cache_is_cleared_when_a_file_changes():
+    from django.utils.autoreload import file_changed
+
+    template = get_root_template('iommi/base.html', 'content')
+    file_changed.send(sender=None, file_path=Path(__file__).parent / 'templates' / 'iommi' / 'base.html')
+    assert get_root_template('iommi/base.html', 'content') is not template
+
+
+@pytest.mark.django_db
+def test_prepared():
+    class FooTable(Table):
+        class Meta:
+            auto__model = TFoo
+
+    class BarTable(FooTable):
+        class Meta:
+            columns__a__include = False
+
+    TFoo.objects.create(a=17, b='foo')
+
+    prepared = FooTable.prepared()
+    assert prepared.is_refine_done
+    assert FooTable.prepared() is prepared
+    assert BarTable.prepared() is not prepared
+    assert BarTable.prepared() is BarTable.prepared()
+
+    expected = FooTable().bind(request=req('get')).__html__()
+    assert prepared.bind(request=req('get')).__html__() == expected
+    assert prepared.bind(request=req('get')).__html__() == expected
+    assert '17' not in BarTable.prepared().bind(request=req('get')).__html__()
+
+    with register_style('test_prepared', Style(base)):
+        assert FooTable.prepared() is not prepared
+
+
+def test_streaming_falls_back_when_a_placeholder_is_repeated():
+    placeholders = []
+
+    class Rows:
+        def __html__(self):
+            if not placeholders:
+                placeholders.append(stream_placeholder(fragment, lambda: iter(['<tr>', '</tr>'])))
+            return placeholders[0]
+
+    fragment = Fragment(children__a=Rows(), children__b=Rows()).refine_done().bind(request=req('get'))
+    content = b''.join(fragment.render_to_response(stream=True).streaming_content)
+    assert content.count(b'<tr></tr>') == 2
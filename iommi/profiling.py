@@ -2,17 +2,28 @@
 
 import cProfile
 import os
+import random
 import subprocess
 import sys
+import threading
+from collections import Counter
+from html import escape
 from io import StringIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from time import sleep
+from zlib import crc32
 
 from iommi._web_compat import HttpResponse
 from ._web_compat import settings
 
 MEDIA_PREFIXES = ['/static/']
 
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+SAMPLES_MAX_URL_PATTERNS = 256
+SAMPLES_MAX_STACKS = 10000
+
 _dot_search_paths = [
     '/usr/bin/dot',
     '/usr/local/bin/dot',
@@ -33,6 +44,188 @@ def should_profile(request):
     return '_iommi_prof' in request.GET and ((not disabled and is_staff) or settings.DEBUG)
 
 
+def should_sample(request):
+    """
+    Sample the stacks of a fraction `settings.IOMMI_PROFILE_SAMPLE_RATE`
+    (default 0) of the requests, and all the requests that ask for the
+    flame graph. Requests that ask for a cProfile profile are not sampled.
+    """
+    if request.profiler_disabled:
+        return False
+    if '_iommi_prof' in request.GET:
+        return request.GET['_iommi_prof'] == 'flame' and should_profile(request)
+    sample_rate = getattr(settings, 'IOMMI_PROFILE_SAMPLE_RATE', 0)
+    return bool(sample_rate) and random.random() < sample_rate
+
+
+def collapse_stack(frame, stop_at=None):
+    """
+    The stack of `frame` in collapsed format: the functions from the outermost
+    to the innermost, separated by `;`. If the code object `stop_at` is in the
+    stack, only the frames called from it are included.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        if code is stop_at:
+            break
+        names.append(f'{frame.f_globals.get("__name__", "?")}.{getattr(code, "co_qualname", code.co_name)}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class Sampler:
+    """
+    Samples the stacks of the registered threads every `interval` seconds,
+    from one background thread that only runs while there are registered
+    threads.
+    """
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.samples_by_thread_id = {}
+        self.thread = None
+
+    def start(self, thread_id, stop_at=None):
+        with self.lock:
+            self.samples_by_thread_id[thread_id] = (stop_at, Counter())
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='iommi-sampler', daemon=True)
+                self.thread.start()
+
+    def stop(self, thread_id):
+        with self.lock:
+            _, samples = self.samples_by_thread_id.pop(thread_id)
+        return samples
+
+    def sample(self):
+        frames = sys._current_frames()
+        with self.lock:
+            for thread_id, (stop_at, samples) in self.samples_by_thread_id.items():
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    samples[collapse_stack(frame, stop_at=stop_at)] += 1
+
+    def run(self):
+        while True:
+            sleep(self.interval)
+            with self.lock:
+                if not self.samples_by_thread_id:
+                    self.thread = None
+                    return
+            self.sample()
+
+
+_sampler = None
+_samples_lock = threading.Lock()
+# URL pattern -> Counter of collapsed stacks, with the most recently sampled URL pattern last
+_samples_by_url_pattern = {}
+
+
+def get_sampler():
+    global _sampler
+    if _sampler is None:
+        _sampler = Sampler(interval=getattr(settings, 'IOMMI_PROFILE_SAMPLE_INTERVAL', DEFAULT_SAMPLE_INTERVAL))
+    return _sampler
+
+
+def url_pattern_of_request(request):
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return '<unresolved>'
+    return getattr(resolver_match, 'route', None) or resolver_match.view_name
+
+
+def add_samples(url_pattern, samples):
+    """
+    Add samples to the ones of `url_pattern`. At most `SAMPLES_MAX_URL_PATTERNS`
+    URL patterns are kept, and when a URL pattern gets more than
+    `SAMPLES_MAX_STACKS` different stacks only the most common half is kept.
+    """
+    with _samples_lock:
+        counter = _samples_by_url_pattern.pop(url_pattern, None)
+        if counter is None:
+            counter = Counter()
+            if len(_samples_by_url_pattern) >= SAMPLES_MAX_URL_PATTERNS:
+                # Forget the URL pattern that was sampled the longest time ago
+                del _samples_by_url_pattern[next(iter(_samples_by_url_pattern))]
+        counter.update(samples)
+        if len(counter) > SAMPLES_MAX_STACKS:
+            # The rare stacks are too narrow to see in a flame graph anyway
+            counter = Counter(dict(counter.most_common(SAMPLES_MAX_STACKS // 2)))
+        _samples_by_url_pattern[url_pattern] = counter
+
+
+def get_samples(url_pattern):
+    """
+    The aggregated collapsed stacks of the sampled requests of a URL pattern,
+    as a `Counter` from stack to number of samples.
+    """
+    with _samples_lock:
+        return Counter(_samples_by_url_pattern.get(url_pattern, {}))
+
+
+def clear_samples():
+    with _samples_lock:
+        _samples_by_url_pattern.clear()
+
+
+def flame_graph_svg(samples, *, title='', width=1200, frame_height=16):
+    """
+    Render collapsed stacks (a mapping from stack to number of samples) as an
+    SVG flame graph.
+    """
+    root = dict(name='all', count=0, children={})
+    for stack, count in samples.items():
+        root['count'] += count
+        node = root
+        for name in stack.split(';') if stack else []:
+            node = node['children'].setdefault(name, dict(name=name, count=0, children={}))
+            node['count'] += count
+
+    total = root['count'] or 1
+    min_width = 0.1
+    rects = []
+    todo = [(root, 0.0, 0)]
+    while todo:
+        node, x, depth = todo.pop()
+        rect_width = node['count'] / total * width
+        if rect_width < min_width:
+            continue
+        rects.append((node, x, depth, rect_width))
+        child_x = x
+        for name, child in sorted(node['children'].items()):
+            todo.append((child, child_x, depth + 1))
+            child_x += child['count'] / total * width
+
+    max_depth = max((depth for _, _, depth, _ in rects), default=0)
+    top = frame_height * 2
+    height = top + (max_depth + 1) * frame_height
+
+    def color(name):
+        h = crc32(name.encode())
+        return f'rgb({205 + h % 50}, {(h >> 8) % 230}, {(h >> 16) % 55})'
+
+    result = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" font-family="monospace" font-size="11">',
+        f'<text x="{width / 2}" y="{frame_height}" text-anchor="middle" font-size="14">{escape(title)}</text>',
+    ]
+    for node, x, depth, rect_width in rects:
+        y = top + (max_depth - depth) * frame_height
+        name = node['name']
+        label_length = int((rect_width - 6) / 7)
+        label = name if len(name) <= label_length else name[:label_length - 2] + '..'
+        result.append(
+            f'<g><title>{escape(name)} ({node["count"]} samples, {node["count"] / total * 100:.1f}%)</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{rect_width:.1f}" height="{frame_height - 1}" fill="{color(name)}" rx="2"/>'
+            + (f'<text x="{x + 3:.1f}" y="{y + frame_height - 4}">{escape(label)}</text>' if label_length >= 3 else '')
+            + '</g>'
+        )
+    result.append('</svg>')
+    return '\n'.join(result)
+
+
 class Middleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -46,6 +239,9 @@ def __call__(self, request):
                 request.profiler_disabled = True
                 break
 
+        if should_sample(request):
+            return self.sample(request)
+
         if should_profile(request):
             prof = cProfile.Profile()
             prof.enable()
@@ -161,3 +357,22 @@ def strip_extra_path(s, token):
                 response['Content-Type'] = 'text/html'
 
         return response
+
+    def sample(self, request):
+        sampler = get_sampler()
+        thread_id = threading.get_ident()
+        sampler.start(thread_id, stop_at=Middleware.sample.__code__)
+        try:
+            response = self.get_response(request)
+        finally:
+            samples = sampler.stop(thread_id)
+
+        url_pattern = url_pattern_of_request(request)
+        add_samples(url_pattern, samples)
+
+        if request.GET.get('_iommi_prof') == 'flame':
+            response = HttpResponse(
+                flame_graph_svg(get_samples(url_pattern), title=url_pattern),
+                content_type='image/svg+xml',
+            )
+        return response
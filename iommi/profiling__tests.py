@@ -1,9 +1,18 @@
 import sys
+from time import sleep
+from unittest import mock
 
 import pytest
+from django.test import override_settings
 
 from iommi.profiling import (
+    add_samples,
+    clear_samples,
+    collapse_stack,
+    flame_graph_svg,
     get_dot_path,
+    get_sampler,
+    get_samples,
     Middleware,
 )
 from tests.helpers import (
@@ -60,3 +69,83 @@ def test_profiler_graph_dot_not_present():
     iommi.profiling._dot_search_paths[:] = orig
 
     assert response.content.decode().startswith('digraph {')
+
+
+def test_collapse_stack():
+    def f():
+        return collapse_stack(sys._getframe(), stop_at=test_collapse_stack.__code__)
+
+    stack = f()
+    assert ';' not in stack
+    assert stack.startswith('iommi.profiling__tests.')
+    assert stack.endswith('f')
+
+
+def test_flame_graph_svg():
+    svg = flame_graph_svg({'a;b': 3, 'a;c': 1, 'a;<d>': 0}, title='/foo/<int:pk>/')
+    assert svg.startswith('<svg xmlns="http://www.w3.org/2000/svg" width="1200" height="80" ')
+    assert '>/foo/&lt;int:pk&gt;/</text>' in svg
+    assert '<title>all (4 samples, 100.0%)</title>' in svg
+    assert '<title>a (4 samples, 100.0%)</title>' in svg
+    assert '<title>b (3 samples, 75.0%)</title><rect x="0.0" y="32" width="900.0"' in svg
+    assert '<title>c (1 samples, 25.0%)</title><rect x="900.0" y="32" width="300.0"' in svg
+    assert '&lt;d&gt;' not in svg
+
+
+def sleeping_view(request):
+    sleep(0.1)
+    return sentinel
+
+
+def test_sampling():
+    clear_samples()
+    middleware = Middleware(sleeping_view)
+
+    with override_settings(IOMMI_PROFILE_SAMPLE_RATE=0):
+        assert middleware(req('get')) is sentinel
+    assert get_samples('<unresolved>') == {}
+
+    with override_settings(IOMMI_PROFILE_SAMPLE_RATE=1):
+        assert middleware(req('get')) is sentinel
+    samples = get_samples('<unresolved>')
+    assert sum(samples.values()) > 1
+    assert all(x.split(';')[0] == 'iommi.profiling__tests.sleeping_view' for x in samples)
+
+    # The sampler thread stops when there is nothing to sample
+    sleep(0.05)
+    assert get_sampler().thread is None
+
+    response = middleware(staff_req('get', _iommi_prof='flame'))
+    assert response['Content-Type'] == 'image/svg+xml'
+    assert 'sleeping_view' in response.content.decode()
+    assert sum(get_samples('<unresolved>').values()) > sum(samples.values())
+
+    # Only staff can see the flame graph
+    assert middleware(user_req('get', _iommi_prof='flame')) is sentinel
+
+    # Asking for a cProfile profile gives one, even if the request would be sampled
+    clear_samples()
+    with override_settings(IOMMI_PROFILE_SAMPLE_RATE=1):
+        assert 'white-space: nowrap' in middleware(staff_req('get', _iommi_prof='')).content.decode()
+        assert middleware(user_req('get', _iommi_prof='')) is sentinel
+    assert get_samples('<unresolved>') == {}
+    clear_samples()
+
+
+def test_samples_are_capped():
+    clear_samples()
+    with mock.patch('iommi.profiling.SAMPLES_MAX_URL_PATTERNS', 2), mock.patch('iommi.profiling.SAMPLES_MAX_STACKS', 4):
+        add_samples('a', {'x': 1})
+        add_samples('b', {'x': 1})
+        add_samples('a', {'x': 1})
+        add_samples('c', {'x': 1})
+        # b was sampled the longest time ago
+        assert get_samples('a') == {'x': 2}
+        assert get_samples('b') == {}
+        assert get_samples('c') == {'x': 1}
+
+        add_samples('a', {'y': 3, 'z': 1, 'w': 1})
+        assert len(get_samples('a')) == 4
+        add_samples('a', {'v': 1})
+        assert get_samples('a') == {'y': 3, 'x': 2}
+    clear_samples()
@@ -1,5 +1,11 @@
 import operator
-from functools import reduce
+from collections import OrderedDict
+from copy import deepcopy
+from functools import (
+    lru_cache,
+    reduce,
+)
+from threading import Lock
 from typing import (
     Type,
     Union,
@@ -79,6 +85,7 @@
     AutoConfig,
     create_members_from_model,
     get_search_fields,
+    invalidate_members_from_model_cache,
     member_from_model,
     NoRegisteredSearchFieldException,
 )
@@ -94,6 +101,7 @@
     EvaluatedRefinable,
     RefinableMembers,
 )
+from iommi.timing import timed
 
 
 class QueryException(Exception):
@@ -128,6 +136,7 @@ def register_filter_factory(django_field_class, *, shortcut_name=MISSING, factor
         factory = Shortcut(call_target__attribute=shortcut_name)
 
     _filter_factory_by_django_field_type[django_field_class] = factory
+    invalidate_members_from_model_cache()
 
 
 def to_string_surrounded_by_quote(v):
@@ -211,6 +220,106 @@ def choice_queryset__is_valid_filter(name, filter, **_):
     )
 
 
+def _get_value(row, path):
+    """
+    The value of a django style attribute path (`foo__bar`) on a row, where
+    the row and the objects along the path can be objects or dicts. Missing
+    attributes and keys are `None`, like a `NULL` in the database.
+    """
+    for name in path.split('__'):
+        if row is None:
+            return None
+        if isinstance(row, dict):
+            row = row.get(name)
+        else:
+            row = getattr(row, name, None)
+    return row
+
+
+def _lower(value):
+    return str(value).lower()
+
+
+def _compare(op):
+    def compare(a, b):
+        if a is None or b is None:
+            return False
+        try:
+            return op(a, b)
+        except TypeError:
+            raise QueryException(f'Can not compare {a!r} and {b!r}')
+    return compare
+
+
+LOOKUP_FUNCTIONS = {
+    'exact': lambda a, b: a is None if b is None else a == b,
+    'iexact': lambda a, b: a is None if b is None else a is not None and _lower(a) == _lower(b),
+    'contains': lambda a, b: a is not None and str(b) in str(a),
+    'icontains': lambda a, b: a is not None and _lower(b) in _lower(a),
+    'startswith': lambda a, b: a is not None and str(a).startswith(str(b)),
+    'istartswith': lambda a, b: a is not None and _lower(a).startswith(_lower(b)),
+    'endswith': lambda a, b: a is not None and str(a).endswith(str(b)),
+    'iendswith': lambda a, b: a is not None and _lower(a).endswith(_lower(b)),
+    'gt': _compare(operator.gt),
+    'gte': _compare(operator.ge),
+    'lt': _compare(operator.lt),
+    'lte': _compare(operator.le),
+    'in': lambda a, b: a in b,
+    'isnull': lambda a, b: (a is None) == bool(b),
+}
+
+
+@lru_cache(maxsize=None)
+def _django_lookups():
+    from django.db.models import (
+        DateField,
+        DateTimeField,
+        Field,
+        TimeField,
+    )
+
+    return set().union(*(field_class.get_lookups() for field_class in (Field, DateField, DateTimeField, TimeField)))
+
+
+def split_lookup(key):
+    """
+    Split a key of a `Q` object into the path and the lookup. Raises
+    `QueryException` for lookups that Django has but that are not in
+    `LOOKUP_FUNCTIONS`, like `range` or `year`.
+    """
+    path, _, lookup = key.rpartition('__')
+    if lookup in LOOKUP_FUNCTIONS:
+        return path, lookup
+    if path and lookup in _django_lookups():
+        raise QueryException(f'The lookup "{lookup}" is not supported when filtering rows that are not a QuerySet')
+    return key, 'exact'
+
+
+def q_to_predicate(q):
+    """
+    Compile a `Q` object, like the ones `Query.parse_query_string` returns, into
+    a function that takes a row and returns if it matches. This is how a `Query`
+    filters rows that are not a `QuerySet`. The rows can be objects or dicts.
+    The lookups in `LOOKUP_FUNCTIONS` are supported, and `F` objects are
+    looked up on the row. Other Django lookups, and comparing values that
+    can't be compared, raise `QueryException`.
+    """
+    if isinstance(q, Q):
+        predicates = [q_to_predicate(child) for child in q.children]
+        combine = all if q.connector == Q.AND else any
+        if q.negated:
+            return lambda row: not combine(predicate(row) for predicate in predicates)
+        return lambda row: combine(predicate(row) for predicate in predicates)
+
+    key, value = q
+    path, lookup = split_lookup(key)
+    f = LOOKUP_FUNCTIONS[lookup]
+
+    if isinstance(value, F):
+        return lambda row: f(_get_value(row, path), _get_value(row, value.name))
+    return lambda row: f(_get_value(row, path), value)
+
+
 @with_meta
 class Filter(Part):
     """
@@ -533,11 +642,135 @@ def many_to_many(cls, call_target, model_field, **kwargs):
 
 Filter.value_to_q.iommi_needs_attr = True
 
+# The result of these only depends on the arguments, so a query that only
+# uses filters with these functions has its compiled Q cached
+Filter.value_to_q.iommi_pure = True
+Filter.parse.iommi_pure = True
+Filter.query_operator_to_q_operator.iommi_pure = True
+case_sensitive_query_operator_to_q_operator.iommi_pure = True
+boolean__query_operator_to_q_operator.iommi_pure = True
+bool_parse.iommi_pure = True
+boolean_tristate__parse.iommi_pure = True
+int_parse.iommi_pure = True
+float_parse.iommi_pure = True
+
 
 class StringValue(str):
     pass
 
 
+QUERY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def create_grammar():
+    """
+    Pyparsing implementation of a where clause grammar based on http://pyparsing.wikispaces.com/file/view/simpleSQL.py
+
+    The query language is a series of statements separated by AND or OR operators and parentheses can be used to group/provide
+    precedence.
+
+    A statement is a combination of three strings "<filter> <operator> <value>" or "<filter> <operator> <filter>".
+
+    A value can be a string, integer or a real(floating) number or a (ISO YYYY-MM-DD) date.
+
+    An operator must be one of "= != < > >= <= !:" and are translated into django __lte or equivalent suffixes.
+    See self.as_q
+
+    Example
+    something < 10 AND other >= 2015-01-01 AND (foo < 1 OR bar > 1)
+
+    The grammar does not depend on the filters, so it's only created once. It
+    parses into plain tuples that `Query` compiles into a `Q` object.
+    """
+    quoted_string_excluding_quotes = QuotedString('"', escChar='\\').setParseAction(
+        lambda token: ('string', token[0])
+    )
+    and_ = Keyword('and', caseless=True)
+    or_ = Keyword('or', caseless=True)
+    binary_op = oneOf('=> =< = < > >= <= : != !:', caseless=True).setResultsName('operator')
+
+    # define query tokens
+    identifier = Word(alphas, alphanums + '_$-.').setName('identifier')
+    raw_value_chars = alphanums + '_$-+/$%*;?@[]\\^`{}|~.'
+    raw_value = Word(raw_value_chars, raw_value_chars).setName('raw_value').setParseAction(
+        lambda token: ('raw', token[0])
+    )
+    value_string = quoted_string_excluding_quotes | raw_value
+
+    # Define a where expression
+    where_expression = Forward()
+    binary_operator_statement = (identifier + binary_op + value_string).setParseAction(
+        lambda token: ('binary', *token)
+    )
+    unary_operator_statement = (identifier | (Char('!') + identifier)).setParseAction(
+        lambda token: ('unary', *token)
+    )
+    free_text_statement = quotedString.copy().setParseAction(lambda token: ('freetext', *token))
+    operator_statement = binary_operator_statement | free_text_statement | unary_operator_statement
+    where_condition = Group(operator_statement | (Char('(').suppress() + where_expression + Char(')').suppress()))
+    where_expression << where_condition + ZeroOrMore((and_ | or_) + where_expression)
+
+    # define the full grammar
+    query_statement = Forward()
+    query_statement << Group(where_expression).setResultsName("where")
+    return query_statement
+
+
+def _tokens_to_tuple(tokens):
+    return tuple(
+        ('group', *_tokens_to_tuple(token)) if isinstance(token, ParseResults) else token
+        for token in tokens
+    )
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def parse_query_string_to_tokens(query_string):
+    """
+    Parse a query string into nested tuples. The result does not depend on
+    the filters and only on the meaning of the query, so for example
+    `a=1  AND b=2` and `a=1 and b=2` give the same result.
+    """
+    try:
+        return _tokens_to_tuple(create_grammar().parseString(query_string, parseAll=True))
+    except ParseException:
+        raise QueryException('Invalid syntax for query')
+
+
+class _LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        with self.lock:
+            try:
+                self.data.move_to_end(key)
+            except KeyError:
+                return None
+            return self.data[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+_q_cache = _LRUCache(maxsize=QUERY_CACHE_SIZE)
+
+
+def clear_query_cache():
+    parse_query_string_to_tokens.cache_clear()
+    _q_cache.clear()
+
+
 def default_endpoint__errors(query, **_):
     try:
         query.get_q()
@@ -765,11 +998,20 @@ def filter(query, rows, **_):
         if query.form:
             q = None
             try:
-                q = query.get_q()
+                q = timed('get_q', query, query.get_q)
             except QueryException:
                 pass
             if q:
-                rows = rows.filter(q)
+                try:
+                    # A QuerySet, or rows that can filter themselves like ColumnarRows
+                    if hasattr(rows, 'filter'):
+                        rows = rows.filter(q)
+                    else:
+                        predicate = q_to_predicate(q)
+                        rows = [row for row in rows if predicate(row)]
+                except QueryException as e:
+                    # Like the errors from get_q, the error is shown and the rows are not filtered
+                    query.query_error = str(e)
 
         return query.postprocess(rows=rows, **query.iommi_evaluate_parameters())
 
@@ -789,22 +1031,56 @@ def parse_query_string(self, query_string: str) -> Q:
         query_string = query_string.strip()
         if not query_string:
             return Q()
-        parser = self._create_grammar()
-        try:
-            tokens = parser.parseString(query_string, parseAll=True)
-        except ParseException:
-            raise QueryException('Invalid syntax for query')
-        return self._compile(tokens)
+        tokens = parse_query_string_to_tokens(query_string)
+
+        signature = self._q_cache_signature()
+        if signature is None:
+            return self._compile(tokens)
+
+        key = (signature, tokens)
+        q = _q_cache.get(key)
+        if q is None:
+            q = self._compile(tokens)
+            _q_cache.set(key, q)
+        # Q objects are mutable, so don't hand out the cached one
+        return deepcopy(q)
+
+    def _q_cache_signature(self):
+        """
+        Everything about the filters that goes into compiling a query to a `Q`,
+        or `None` if a filter uses a function that isn't marked with
+        `iommi_pure`, since then the same query can compile to different `Q`
+        objects (relative dates, lookups in the database, etc).
+        """
+        if not hasattr(self, '_q_cache_signature_cache'):
+            signature = []
+            for name, filter in items(self.filters):
+                functions = (filter.value_to_q, filter.parse, filter.query_operator_to_q_operator)
+                if not all(getattr(f, 'iommi_pure', False) for f in functions):
+                    signature = None
+                    break
+                signature.append((name, filter.query_name, filter.attr, bool(filter.freetext), bool(filter.unary), *functions))
+            self._q_cache_signature_cache = tuple(signature) if signature is not None else None
+        return self._q_cache_signature_cache
 
     def _compile(self, tokens) -> Q:
         items = []
         for token in tokens:
-            if isinstance(token, ParseResults):
-                items.append(self._compile(token))
-            elif isinstance(token, Q):
-                items.append(token)
-            elif token in ('and', 'or'):
+            if isinstance(token, str):
+                # 'and' or 'or'
                 items.append(token)
+                continue
+            kind = token[0]
+            if kind == 'group':
+                items.append(self._compile(token[1:]))
+            elif kind == 'binary':
+                _, query_name, op, (value_kind, value) = token
+                items.append(self._binary_op_to_q((query_name, op, StringValue(value) if value_kind == 'string' else value)))
+            elif kind == 'unary':
+                items.append(self._unary_op_to_q(token[1:]))
+            else:
+                assert kind == 'freetext'
+                items.append(self._freetext_to_q(token[1:]))
         return self._rpn_to_q(self._tokens_to_rpn(items))
 
     @staticmethod
@@ -846,51 +1122,6 @@ def _tokens_to_rpn(tokens):
             result_q.append(stack.pop()[0])
         return result_q
 
-    def _create_grammar(self):
-        """
-        Pyparsing implementation of a where clause grammar based on http://pyparsing.wikispaces.com/file/view/simpleSQL.py
-
-        The query language is a series of statements separated by AND or OR operators and parentheses can be used to group/provide
-        precedence.
-
-        A statement is a combination of three strings "<filter> <operator> <value>" or "<filter> <operator> <filter>".
-
-        A value can be a string, integer or a real(floating) number or a (ISO YYYY-MM-DD) date.
-
-        An operator must be one of "= != < > >= <= !:" and are translated into django __lte or equivalent suffixes.
-        See self.as_q
-
-        Example
-        something < 10 AND other >= 2015-01-01 AND (foo < 1 OR bar > 1)
-
-        """
-        quoted_string_excluding_quotes = QuotedString('"', escChar='\\').setParseAction(
-            lambda token: StringValue(token[0])
-        )
-        and_ = Keyword('and', caseless=True)
-        or_ = Keyword('or', caseless=True)
-        binary_op = oneOf('=> =< = < > >= <= : != !:', caseless=True).setResultsName('operator')
-
-        # define query tokens
-        identifier = Word(alphas, alphanums + '_$-.').setName('identifier')
-        raw_value_chars = alphanums + '_$-+/$%*;?@[]\\^`{}|~.'
-        raw_value = Word(raw_value_chars, raw_value_chars).setName('raw_value')
-        value_string = quoted_string_excluding_quotes | raw_value
-
-        # Define a where expression
-        where_expression = Forward()
-        binary_operator_statement = (identifier + binary_op + value_string).setParseAction(self._binary_op_to_q)
-        unary_operator_statement = (identifier | (Char('!') + identifier)).setParseAction(self._unary_op_to_q)
-        free_text_statement = quotedString.copy().setParseAction(self._freetext_to_q)
-        operator_statement = binary_operator_statement | free_text_statement | unary_operator_statement
-        where_condition = Group(operator_statement | ('(' + where_expression + ')'))
-        where_expression << where_condition + ZeroOrMore((and_ | or_) + where_expression)
-
-        # define the full grammar
-        query_statement = Forward()
-        query_statement << Group(where_expression).setResultsName("where")
-        return query_statement
-
     def _unary_op_to_q(self, token):
         if len(token) == 1:
             (filter_name,) = token
@@ -982,6 +1213,8 @@ def _freetext_to_q(self, token):
     def get_query_string(self):
         """
         Based on the data in the request, return the equivalent query string that you can use with parse_query_string() to create a query set.
+
+        The query string is canonical: the filters are in declaration order, and multiple values for a filter are sorted and without duplicates, so the same selection always gives the same query string.
         """
         form = self.form
         request = self.get_request()
@@ -995,7 +1228,7 @@ def get_query_string(self):
 
             def expr(field, is_list, value):
                 if is_list:
-                    return '(' + ' OR '.join([expr(field, is_list=False, value=x) for x in field.value]) + ')'
+                    return '(' + ' or '.join(sorted({expr(field, is_list=False, value=x) for x in field.value})) + ')'
                 return build_query_expression(filter=self.filters[field._name], value=value)
 
             result = [
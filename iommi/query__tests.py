@@ -37,12 +37,17 @@
     register_search_fields,
 )
 from iommi.query import (
+    _q_cache,
     build_query_expression,
     choice_queryset_value_to_q,
+    clear_query_cache,
+    create_grammar,
     Filter,
     FREETEXT_SEARCH_NAME,
     Q_OPERATOR_BY_QUERY_OPERATOR,
+    parse_query_string_to_tokens,
     Query,
+    q_to_predicate,
     QueryException,
     value_to_str_for_query,
 )
@@ -137,6 +142,54 @@ def test_freetext(MyTestQuery):
     assert repr(query2.get_q()) == expected
 
 
+def test_grammar_is_created_once():
+    assert create_grammar() is create_grammar()
+
+
+def test_parse_query_string_to_tokens_is_canonical():
+    assert parse_query_string_to_tokens('foo_name="asd"   OR bar_name = 7') == parse_query_string_to_tokens('foo_name="asd" or bar_name=7')
+    assert parse_query_string_to_tokens('foo_name="7"') != parse_query_string_to_tokens('foo_name=7')
+
+
+def test_compiled_q_is_cached(MyTestQuery):
+    clear_query_cache()
+    query = MyTestQuery().bind(request=None)
+    q = query.parse_query_string('foo_name="asd" and bar_name = 7')
+    assert len(_q_cache.data) == 1
+
+    q2 = MyTestQuery().bind(request=None).parse_query_string('foo_name="asd"  AND  bar_name=7')
+    assert len(_q_cache.data) == 1
+    assert repr(q2) == repr(q) == repr(Q(**{'foo__iexact': 'asd'}) & Q(**{'bar__exact': '7'}))
+    assert q2 is not q
+
+    # Different filters gives a different cache entry
+    query3 = MyTestQuery(filters__foo_name__attr='other_foo').bind(request=None)
+    assert repr(query3.parse_query_string('foo_name="asd" and bar_name = 7')) == repr(Q(**{'other_foo__iexact': 'asd'}) & Q(**{'bar__exact': '7'}))
+    assert len(_q_cache.data) == 2
+
+
+def test_compiled_q_is_not_cached_for_impure_filters():
+    clear_query_cache()
+
+    class DateQuery(Query):
+        foo = Filter.date()
+
+    query = DateQuery().bind(request=None)
+    assert query._q_cache_signature() is None
+    query.parse_query_string('foo=2020-01-01')
+    assert len(_q_cache.data) == 0
+
+
+def test_get_query_string_is_canonical():
+    class ChoiceQuery(Query):
+        foo = Filter.multi_choice(choices=['a', 'b', 'c'], field__include=True)
+
+    def query_string(values):
+        return ChoiceQuery().bind(request=req('get', **{'-': '-', 'foo': values})).get_query_string()
+
+    assert query_string(['b', 'a']) == query_string(['a', 'b', 'a']) == '(foo="a" or foo="b")'
+
+
 def test_or(MyTestQuery):
     query = MyTestQuery().bind(request=None)
     assert repr(query.parse_query_string('foo_name="asd" or bar_name = 7')) == repr(
@@ -411,6 +464,97 @@ def test_null(MyTestQuery):
     assert repr(query.parse_query_string('foo_name=null')) == repr(Q(**{'foo': None}))
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'query_string',
+    [
+        'a=1',
+        'a!=1',
+        'a>1',
+        'a>=2',
+        'a<2',
+        'a<=2',
+        'b=foo',
+        'b="FOO"',
+        'b:o',
+        'b!:O',
+        'b_case=foo',
+        'b=null',
+        'a=1 or a=3 and b:a',
+        '(a=1 or a=3) and b:a',
+        'b=a_b',
+        '"fo"',
+    ],
+)
+def test_q_to_predicate_matches_the_database(query_string):
+    for a, b in [(1, 'foo'), (2, 'FOO'), (3, 'bar'), (4, 'baz')]:
+        TFoo.objects.create(a=a, b=b)
+
+    class TFooQuery(Query):
+        a = Filter.integer()
+        b = Filter(freetext=True)
+        b_case = Filter.case_sensitive(attr='b')
+        a_b = Filter(attr='a')
+
+    q = TFooQuery().bind(request=None).parse_query_string(query_string)
+    expected = list(TFoo.objects.filter(q).order_by('pk').values_list('pk', flat=True))
+    assert [foo.pk for foo in TFoo.objects.order_by('pk') if q_to_predicate(q)(foo)] == expected
+
+
+def test_q_to_predicate_on_dicts():
+    rows = [dict(a=1, b=dict(c='x')), dict(a=None, b=None), dict(a=3)]
+    assert [q_to_predicate(Q(a__gt=0))(row) for row in rows] == [True, False, True]
+    assert [q_to_predicate(Q(a=None))(row) for row in rows] == [False, True, False]
+    assert [q_to_predicate(Q(b__c__iexact='X'))(row) for row in rows] == [True, False, False]
+    assert [q_to_predicate(~Q(b__c__iexact='X'))(row) for row in rows] == [False, True, True]
+    assert [q_to_predicate(Q(a__in=[1, 3]))(row) for row in rows] == [True, False, True]
+    assert [q_to_predicate(Q(b__isnull=True))(row) for row in rows] == [False, True, True]
+    assert all(q_to_predicate(Q())(row) for row in rows)
+    # SQLite can't do a case sensitive contains, so this is not in the test against the database above
+    assert [q_to_predicate(Q(b__c__contains='X'))(row) for row in rows] == [False, False, False]
+
+
+def test_filter_list():
+    class ListQuery(Query):
+        a = Filter.integer()
+        b = Filter(freetext=True)
+
+    rows = [Struct(a=1, b='foo'), Struct(a=2, b='bar'), Struct(a=3, b='Food')]
+    query = ListQuery(rows=rows).bind(request=req('get', **{'-query': 'a>1'}))
+    assert query.filter(query=query, rows=rows) == rows[1:]
+
+    query = ListQuery(rows=rows).bind(request=req('get', **{FREETEXT_SEARCH_NAME: 'FOO'}))
+    assert query.filter(query=query, rows=rows) == [rows[0], rows[2]]
+
+
+def test_filter_list_errors():
+    rows = [Struct(a=i, b=str(i)) for i in range(5)]
+
+    with pytest.raises(QueryException) as e:
+        q_to_predicate(Q(a__lt='2'))(rows[0])
+    assert str(e.value) == "Can not compare 0 and '2'"
+
+    for lookup in ['range', 'year', 'date', 'regex']:
+        with pytest.raises(QueryException) as e:
+            q_to_predicate(Q(**{f'a__{lookup}': 1}))
+        assert str(e.value) == f'The lookup "{lookup}" is not supported when filtering rows that are not a QuerySet'
+
+    # Like for a QuerySet the error is shown, and the rows are not filtered
+    class ListQuery(Query):
+        a = Filter()
+
+    query = ListQuery(rows=rows).bind(request=req('get', **{'-query': 'a>2'}))
+    assert query.filter(query=query, rows=rows) == rows
+    assert query.query_error == "Can not compare 0 and '2'"
+
+    class IntegerListQuery(Query):
+        a = Filter.integer()
+
+    query = IntegerListQuery(rows=rows).bind(request=req('get', **{'-query': 'a>2'}))
+    assert query.filter(query=query, rows=rows) == rows[3:]
+    assert query.query_error is None
+
+
 def test_date_out_of_range():
     class MyTestQuery(Query):
         foo = Filter.date()
@@ -18,6 +18,7 @@
 from django.db.utils import DEFAULT_DB_ALIAS
 from django.http import HttpResponse
 from django.utils.html import format_html
+from tri_struct import Struct
 
 from iommi.attrs import render_style
 from iommi.thread_locals import (
@@ -105,6 +106,10 @@ def __call__(self, request):
 
             sql_debug_last_call(response)
 
+            n_plus_one = sql_debug_n_plus_one(getattr(request, 'iommi_sql_debug_log', None) or [])
+            if n_plus_one:
+                response['X-Iommi-Sql-N-Plus-One'] = ', '.join(f'{x.count}x {x.origin}' for x in n_plus_one)
+
             if sql_trace is not None:
                 iommi_sql_debug_log = getattr(request, 'iommi_sql_debug_log', None)
                 if iommi_sql_debug_log is not None:
@@ -148,6 +153,12 @@ def __call__(self, request):
                                 format_html('<span style="display: inline-block; height: 30px; width: {}%; background-color: {}; border-left: 1px solid black" title="{} queries. Ran {}s, like {}"></span>', proportion, color, len(group), f'{duration:.3}', k)
                             )
 
+                    if n_plus_one:
+                        result.append('<p>Probable N+1:</p><pre>')
+                        for x in n_plus_one:
+                            result.append(format_html('{} times from {}:\n    {}\n', x.count, x.origin, x.sql))
+                        result.append('</pre>')
+
                     result.append('<p></p><pre>')
 
                     for i, x in enumerate(iommi_sql_debug_log):
@@ -345,22 +356,23 @@ def format_clickable_filename(file_name, line, fn, extra=None):
     return f'  File "{file_name}", line {line}, in {fn} => {extra.strip()}'
 
 
+def _skip_frame(frame):
+    filename = frame.f_code.co_filename
+    return (
+        '/lib/python' in filename
+        or 'django/core' in filename
+        or 'pydev/pydevd' in filename
+        or 'gunicorn' in filename
+    )
+
+
 def sql_debug_format_stack_trace(frame):
     base_path = os.path.abspath(os.path.join(settings.BASE_DIR, '..')) + "/"
     msg = []
     skip_template_code = False
 
-    def skip_line(frame):
-        filename = frame.f_code.co_filename
-        return (
-            '/lib/python' in filename
-            or 'django/core' in filename
-            or 'pydev/pydevd' in filename
-            or 'gunicorn' in filename
-        )
-
     while frame:
-        if skip_line(frame):
+        if _skip_frame(frame):
             frame = frame.f_back
             continue
 
@@ -390,6 +402,86 @@ def skip_line(frame):
     return stack
 
 
+def sql_debug_origin(frame):
+    """
+    The innermost frame of the stack that is not library, database or
+    template code, formatted as `file:line in function`.
+    """
+    base_path = os.path.abspath(os.path.join(settings.BASE_DIR, '..')) + "/"
+    while frame:
+        file_name = frame.f_code.co_filename
+        if not (_skip_frame(frame) or 'django/db' in file_name or 'django/template' in file_name or file_name == __file__):
+            return f'{file_name.replace(base_path, "")}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return None
+
+
+def normalize_sql(sql):
+    """
+    Strip the literals and parameters from `sql`, so statements that only
+    differ in their values are equal.
+    """
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'%s|\b\d+(?:\.\d+)?\b', '?', sql)
+    sql = re.sub(r'\(\s*\?(?:\s*,\s*\?)*\s*\)', '(...)', sql)
+    return re.sub(r'\s+', ' ', sql).strip()
+
+
+def sql_debug_n_plus_one(log, cutoff=None):
+    """
+    Find probable N+1 problems in a list of logged statements: the same
+    normalized statement run more than `cutoff` times from the same place.
+    The default cutoff is the setting `SQL_DEBUG_N_PLUS_ONE_CUTOFF`, or 3.
+
+    Returns a list of `Struct(sql, origin, count, duration)`, worst first.
+    """
+    if cutoff is None:
+        cutoff = getattr(settings, 'SQL_DEBUG_N_PLUS_ONE_CUTOFF', 3)
+
+    groups = defaultdict(list)
+    for x in log:
+        groups[normalize_sql(x['sql']), x.get('origin')].append(x)
+
+    result = [
+        Struct(sql=sql, origin=origin, count=len(logs), duration=sum(x.get('duration', 0) for x in logs))
+        for (sql, origin), logs in groups.items()
+        if len(logs) > cutoff
+    ]
+    return sorted(result, key=lambda x: x.count, reverse=True)
+
+
+@contextmanager
+def assert_max_queries(max_queries, *, using=DEFAULT_DB_ALIAS):
+    """
+    Context manager for tests that fails if more than `max_queries` SQL
+    statements are run on the database `using` inside it. The failure lists
+    the probable N+1 problems.
+
+    .. code-block:: python
+
+        with assert_max_queries(3):
+            client.get('/albums/')
+    """
+    log = []
+
+    def log_query(execute, sql, params, many, context):
+        log.append(dict(sql=sql, origin=sql_debug_origin(sys._getframe().f_back)))
+        return execute(sql, params, many, context)
+
+    with connections[using].execute_wrapper(log_query):
+        yield log
+
+    if len(log) > max_queries:
+        n_plus_one = ''.join(
+            f'\n    {x.count} times from {x.origin}: {x.sql}'
+            for x in sql_debug_n_plus_one(log)
+        )
+        raise AssertionError(
+            f'{len(log)} queries were run, the budget is {max_queries}.'
+            + (f'\nProbable N+1:{n_plus_one}' if n_plus_one else '')
+        )
+
+
 def sql_debug_last_call(response):
     request = get_current_request()
     if get_sql_debug() == SQL_DEBUG_LEVEL_WORST and hasattr(
@@ -451,6 +543,7 @@ def _execute_and_log(self, *, f, **kwargs):
             duration = stop - start
             sql_debug_log_to_request(
                 stack=sql_debug_format_stack_trace(frame),
+                origin=sql_debug_origin(frame),
                 duration=duration,
                 rowcount=self.cursor.rowcount,
                 using=self.db.alias,
@@ -13,17 +13,20 @@
 from tri_struct import Struct
 
 from iommi.sql_trace import (
+    assert_max_queries,
     colorize,
     format_clickable_filename,
     format_sql,
     get_sql_debug,
     linkify,
     no_sql_debug,
+    normalize_sql,
     safe_unicode_literal,
     set_sql_debug,
     sql_debug_format_stack_trace,
     SQL_DEBUG_LEVEL_WORST,
     sql_debug_log_to_request,
+    sql_debug_n_plus_one,
     sql_debug_total_time,
     sql_debug_trace_sql,
 )
@@ -43,9 +46,16 @@ def bogus_view_with_no_queries(request):
     return HttpResponse('unseen')
 
 
+def n_plus_one_view(request):
+    for username in ['foo', 'bar', 'baz', 'qux']:
+        list(User.objects.filter(username=username))
+    return HttpResponse('n+1')
+
+
 urlpatterns = [
     path('', bogus_view),
     path('no_queries/', bogus_view_with_no_queries),
+    path('n_plus_one/', n_plus_one_view),
 ]
 
 
@@ -81,6 +91,59 @@ def test_middleware(settings, client, caplog):
     assert '... and 3 more unique statements' in caplog.text
 
 
+@pytest.mark.django_db
+def test_middleware_n_plus_one_header(settings, client):
+    settings.ROOT_URLCONF = __name__
+    settings.DEBUG = True
+
+    response = client.get('/n_plus_one/')
+    header = response['X-Iommi-Sql-N-Plus-One']
+    assert header.startswith('4x ')
+    assert 'sql_trace__tests.py:' in header
+    assert header.endswith(' in n_plus_one_view')
+
+    # The same statement from different lines is not an N+1
+    response = client.get('/')
+    assert 'X-Iommi-Sql-N-Plus-One' not in response
+
+
+def test_normalize_sql():
+    assert normalize_sql('SELECT "t2"."a" FROM "t2" WHERE "t2"."b" = \'it\'\'s\' AND "t2"."c" > 1.5') == (
+        'SELECT "t2"."a" FROM "t2" WHERE "t2"."b" = ? AND "t2"."c" > ?'
+    )
+    assert normalize_sql('SELECT a\n  FROM b WHERE c IN (%s, %s,%s) LIMIT 21') == 'SELECT a FROM b WHERE c IN (...) LIMIT ?'
+
+
+def test_sql_debug_n_plus_one():
+    log = [dict(sql=f'SELECT a FROM b WHERE c = {i}', origin='foo.py:1 in f', duration=1) for i in range(4)]
+    log += [dict(sql='SELECT a FROM b WHERE c = 1', origin='foo.py:2 in g', duration=1)]
+    log += [dict(sql=f'SELECT d FROM b WHERE c = {i}', origin='foo.py:1 in f', duration=1) for i in range(3)]
+
+    assert sql_debug_n_plus_one(log) == [
+        Struct(sql='SELECT a FROM b WHERE c = ?', origin='foo.py:1 in f', count=4, duration=4),
+    ]
+    assert [x.count for x in sql_debug_n_plus_one(log, cutoff=0)] == [4, 3, 1]
+
+
+@pytest.mark.django_db
+def test_assert_max_queries():
+    with assert_max_queries(4) as log:
+        n_plus_one_view(None)
+    assert len(log) == 4
+
+    with pytest.raises(AssertionError) as e:
+        with assert_max_queries(3):
+            n_plus_one_view(None)
+    message = str(e.value)
+    assert message.startswith('4 queries were run, the budget is 3.\nProbable N+1:\n    4 times from ')
+    assert 'in n_plus_one_view: SELECT' in message
+
+    with pytest.raises(AssertionError) as e:
+        with assert_max_queries(3):
+            bogus_view(None)
+    assert str(e.value) == '4 queries were run, the budget is 3.'
+
+
 @pytest.mark.parametrize(
     'text, fg, bold, expected',
     [
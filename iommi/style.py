@@ -19,6 +19,7 @@
 from iommi.base import (
     items,
     keys,
+    values,
 )
 from iommi.refinable import RefinableObject
 
@@ -95,23 +96,64 @@ def __init__(
         for name, sub_style in items(self.sub_styles):
             sub_style.name = name
 
+        self._clear_component_cache()
+
     def component(self, obj, is_root=False):
         """
         Calculate the namespace of additional argument that should be applied
         to the given object. If is_root is set to True, assets might also be
         added to the namespace.
+
+        The result is cached per class, shortcut stack and `is_root`, so
+        it must not be mutated.
         """
-        result = Namespace()
+        shortcut_stack = tuple(getattr(obj, '__tri_declarative_shortcut_stack', []))
+        return self.component_for_class(type(obj), shortcut_stack=shortcut_stack, is_root=is_root)
 
-        # TODO: is this wrong? Should it take classes first, then loop through shortcuts?
-        for class_name in class_names_for(type(obj)):
+    def component_for_class(self, cls, shortcut_stack=(), is_root=False):
+        if self._component_cache_generation != _component_cache_generation:
+            self._clear_component_cache()
+
+        key = (cls, shortcut_stack, is_root)
+        try:
+            return self._component_cache[key]
+        except KeyError:
+            pass
+
+        result = self._calculate_component(cls, shortcut_stack, is_root)
+        self._component_cache[key] = result
+        return result
+
+    def _clear_component_cache(self):
+        self._component_cache = {}
+        self._class_configs_cache = {}
+        self._component_cache_generation = _component_cache_generation
+
+    def _class_configs(self, cls):
+        try:
+            return self._class_configs_cache[cls]
+        except KeyError:
+            pass
+
+        result = []
+        for class_name in class_names_for(cls):
             if class_name in self.config:
                 config = Namespace(self.config.get(class_name, {}))
                 shortcuts_config = Namespace(config.pop('shortcuts', {}))
-                result.update(config)
+                result.append((config, shortcuts_config))
+
+        self._class_configs_cache[cls] = result
+        return result
+
+    def _calculate_component(self, cls, shortcut_stack, is_root):
+        result = Namespace()
+
+        # TODO: is this wrong? Should it take classes first, then loop through shortcuts?
+        for config, shortcuts_config in self._class_configs(cls):
+            result.update(config)
 
-                for shortcut_name in reversed(getattr(obj, '__tri_declarative_shortcut_stack', [])):
-                    result = Namespace(result, shortcuts_config.get(shortcut_name, {}))
+            for shortcut_name in reversed(shortcut_stack):
+                result = Namespace(result, shortcuts_config.get(shortcut_name, {}))
 
         if is_root:
             result = Namespace(result, self.root)
@@ -136,12 +178,21 @@ def resolve_sub_style(self, sub_style_name):
 
 _styles = {}
 
+# Bumped every time the registry changes, which invalidates the component caches of all styles
+_component_cache_generation = 0
+
+
+def _invalidate_component_caches():
+    global _component_cache_generation
+    _component_cache_generation += 1
+
 
 def register_style(name, style):
     assert name not in _styles, f'{name} is already registered'
     assert style.name is None
     style.name = name
     _styles[name] = style
+    _invalidate_component_caches()
 
     @contextmanager
     def _unregister():
@@ -155,6 +206,24 @@ def _unregister():
 def unregister_style(name):
     assert name in _styles
     del _styles[name]
+    _invalidate_component_caches()
+
+
+def warm_style_caches(*, additional_classes: List[Type] = None, styles=None):
+    """
+    Calculate the style data of all standard classes (plus
+    `additional_classes`) for all registered styles (or the given `styles`),
+    so that the first requests don't have to pay for it.
+    """
+    classes = get_default_style_classes() + (additional_classes or [])
+    if styles is None:
+        styles = _styles
+
+    for style in values(styles):
+        for s in [style, *values(style.sub_styles)]:
+            for cls in classes:
+                for is_root in (False, True):
+                    s.component_for_class(cls, is_root=is_root)
 
 
 def get_global_style(name):
@@ -184,6 +253,57 @@ class InvalidStyleConfigurationException(Exception):
     pass
 
 
+def get_default_style_classes():
+    """
+    All the `Part`-derived classes in iommi that styles apply to.
+    """
+    from iommi import (
+        Action,
+        Column,
+        Field,
+        Form,
+        Menu,
+        MenuItem,
+        Query,
+        Table,
+        Filter,
+    )
+    from iommi.table import Paginator
+    from iommi.menu import (
+        MenuBase,
+        get_debug_menu,
+    )
+    from iommi.error import Errors
+    from iommi.action import Actions
+    from iommi.admin import Admin
+    from iommi.fragment import Container
+    from iommi.fragment import Header
+    from iommi.live_edit import LiveEditPage
+    from iommi.form import FieldGroup
+
+    return [
+        Action,
+        Actions,
+        Column,
+        get_debug_menu().__class__,
+        Errors,
+        Field,
+        Form,
+        Menu,
+        MenuBase,
+        MenuItem,
+        Paginator,
+        Query,
+        Table,
+        Filter,
+        Admin,
+        Container,
+        Header,
+        LiveEditPage,
+        FieldGroup,
+    ]
+
+
 def validate_styles(*, additional_classes: List[Type] = None, default_classes=None, styles=None):
     """
     This function validates all registered styles against all standard
@@ -199,51 +319,7 @@ def validate_styles(*, additional_classes: List[Type] = None, default_classes=No
     parameter is primarily used by tests.
     """
     if default_classes is None:
-        from iommi import (
-            Action,
-            Column,
-            Field,
-            Form,
-            Menu,
-            MenuItem,
-            Query,
-            Table,
-            Filter,
-        )
-        from iommi.table import Paginator
-        from iommi.menu import (
-            MenuBase,
-            get_debug_menu,
-        )
-        from iommi.error import Errors
-        from iommi.action import Actions
-        from iommi.admin import Admin
-        from iommi.fragment import Container
-        from iommi.fragment import Header
-        from iommi.live_edit import LiveEditPage
-        from iommi.form import FieldGroup
-
-        default_classes = [
-            Action,
-            Actions,
-            Column,
-            get_debug_menu().__class__,
-            Errors,
-            Field,
-            Form,
-            Menu,
-            MenuBase,
-            MenuItem,
-            Paginator,
-            Query,
-            Table,
-            Filter,
-            Admin,
-            Container,
-            Header,
-            LiveEditPage,
-            FieldGroup,
-        ]
+        default_classes = get_default_style_classes()
     if additional_classes is None:
         additional_classes = []
 
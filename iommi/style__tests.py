@@ -27,6 +27,7 @@
     register_style,
     Style,
     validate_styles, resolve_style,
+    warm_style_caches,
 )
 from iommi.style_base import base
 from iommi.style_test_base import test
@@ -566,3 +567,46 @@ def test_style_on_child():
 def test_style_repr():
     with register_style('foo', Style()) as foo:
         assert repr(foo) == '<Style: foo>'
+
+
+def test_style_component_is_cached():
+    class A(Traversable):
+        foo = Refinable()
+
+    style = Style(A__foo=1)
+    a = A()
+    result = style.component(a)
+    assert result == dict(foo=1)
+    assert style.component(a) is result
+    assert style.component(a, is_root=True) is not result
+
+    # Changing the registry invalidates the cache
+    with register_style('test_style_component_is_cached', Style()):
+        assert style.component(a) is not result
+        assert style.component(a) == dict(foo=1)
+
+
+def test_style_component_cache_keyed_on_shortcut_stack():
+    class A(Traversable):
+        foo = Refinable()
+
+        @classmethod
+        @class_shortcut
+        def shortcut1(cls, call_target, **kwargs):
+            return call_target(**kwargs)
+
+    style = Style(A=dict(foo=1, shortcuts__shortcut1__foo=2))
+    assert style.component(A()) == dict(foo=1)
+    assert style.component(A.shortcut1()) == dict(foo=2)
+    assert style.component(A()) == dict(foo=1)
+
+
+def test_warm_style_caches():
+    class A(Traversable):
+        foo = Refinable()
+
+    style = Style(A__foo=1)
+    warm_style_caches(additional_classes=[A], styles=dict(my_style=style))
+    assert (A, (), False) in style._component_cache
+    assert (A, (), True) in style._component_cache
+    assert style.component(A()) is style._component_cache[(A, (), False)]
@@ -1,16 +1,27 @@
 import csv
+import json
+import sys
+import warnings
+from contextlib import contextmanager
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
 from datetime import (
     date,
     datetime,
     time,
 )
+from decimal import Decimal
 from enum import (
     auto,
     Enum,
 )
 from functools import total_ordering
+from hashlib import sha1
 from io import StringIO
 from itertools import groupby
+from threading import Thread
 from typing import (
     Any,
     Callable,
@@ -21,24 +32,47 @@
     Union,
 )
 from urllib.parse import quote_plus
+from uuid import (
+    UUID,
+    uuid4,
+)
 
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    ValidationError,
+)
+from django.db import connections
 from django.db.models import (
     AutoField,
     BooleanField,
+    Count,
     ManyToManyField,
     Model,
+    Q,
     QuerySet,
+    Window,
 )
+from django.db.models.query import ModelIterable
 from django.http import (
     FileResponse,
+    StreamingHttpResponse,
 )
 from django.utils.formats import date_format
 from django.utils.html import (
     conditional_escape,
 )
+from django.utils.timezone import (
+    get_current_timezone,
+    override as timezone_override,
+)
 from django.utils.translation import (
+    get_language,
     gettext,
     gettext_lazy,
+    override as translation_override,
 )
 from math import ceil
 from tri_declarative import (
@@ -84,6 +118,7 @@
 )
 from iommi.base import (
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     get_display_name,
     items,
     keys,
@@ -94,25 +129,31 @@
 )
 from iommi.endpoint import (
     DISPATCH_PREFIX,
+    get_dispatch_target_long_path,
     path_join,
 )
+from iommi.debug import iommi_debug_on
 from iommi.evaluate import (
     evaluate,
     evaluate_member,
     evaluate_strict,
+    signature_from_kwargs,
 )
 from iommi.form import (
     Field,
     Form,
 )
 from iommi.fragment import (
+    _void_elements,
     build_and_bind_h_tag,
     Tag,
 )
 from iommi.from_model import (
     AutoConfig,
     create_members_from_model,
+    get_field,
     get_search_fields,
+    invalidate_members_from_model_cache,
     member_from_model,
     NoRegisteredSearchFieldException,
 )
@@ -124,7 +165,10 @@
     Page,
     Part,
 )
-from iommi.part import render_root
+from iommi.part import (
+    render_root,
+    stream_placeholder,
+)
 from iommi.query import (
     Q_OPERATOR_BY_QUERY_OPERATOR,
     Query,
@@ -135,10 +179,24 @@
     RefinableMembers,
     RefinableObject,
 )
+from iommi.style import resolve_style
+from iommi.thread_locals import (
+    get_current_request,
+    set_current_request,
+)
+from iommi.timing import (
+    current_span,
+    timed,
+    timing_in_thread,
+)
 from iommi.traversable import (
+    build_long_path,
     Traversable,
 )
-from ._db_compat import base_defaults_factory
+from ._db_compat import (
+    base_defaults_factory,
+    query_is_sliced,
+)
 
 LAST = LAST
 
@@ -151,6 +209,7 @@ def register_column_factory(django_field_class, *, shortcut_name=MISSING, factor
         factory = Shortcut(call_target__attribute=shortcut_name)
 
     _column_factory_by_field_type[django_field_class] = factory
+    invalidate_members_from_model_cache()
 
 
 DESCENDING = 'descending'
@@ -158,6 +217,8 @@ def register_column_factory(django_field_class, *, shortcut_name=MISSING, factor
 
 DEFAULT_PAGE_SIZE = 40
 
+DEFAULT_STREAM_CHUNK_SIZE = 100
+
 
 def params_of_request(request):
     if request is None:
@@ -310,6 +371,45 @@ class DataRetrievalMethods(Enum):
     select = auto()
 
 
+def infer_related(model, paths):
+    """
+    Infer what to give to `select_related` and `prefetch_related` to read the
+    attribute paths `paths` (like `'album__artist__name'`) of instances of
+    `model` without a query per instance. Returns a tuple `(select, prefetch)`.
+
+    The paths are walked the same way as `get_field_path` does, but stops at
+    the first name that is not a field, like a property or a method.
+    """
+    select = set()
+    prefetch = set()
+    for path in paths:
+        current_model = model
+        relation_path = []
+        to_many = False
+        for name in path.split('__'):
+            try:
+                field = get_field(current_model, name)
+            except FieldDoesNotExist:
+                break
+            if not field.is_relation or name != field.name:
+                # Not a relation, or the column of a foreign key (like `foo_id`)
+                break
+            relation_path.append(name)
+            to_many = to_many or field.many_to_many or field.one_to_many
+            current_model = field.related_model
+            if current_model is None:
+                # Generic foreign keys can only be prefetched
+                to_many = True
+                break
+        if relation_path:
+            (prefetch if to_many else select).add('__'.join(relation_path))
+
+    def without_prefixes(paths):
+        return sorted(x for x in paths if not any(y.startswith(x + '__') for y in paths))
+
+    return without_prefixes(select), without_prefixes(prefetch)
+
+
 def default_icon__cell__format(column, value, **_):
     if not value:
         return ''
@@ -419,6 +519,7 @@ def on_refine_done(self):
         self.is_sorting: bool = None
         self.sort_direction: str = None
         self.table = None
+        self._cell_plan = None
         super(Column, self).on_refine_done()
 
     def __html__(self, *, render=None):
@@ -467,6 +568,19 @@ def on_bind(self) -> None:
     def own_evaluate_parameters(self):
         return dict(column=self)
 
+    def get_cell_plan(self, cell_class):
+        assert self._is_bound, NOT_BOUND_MESSAGE
+        if self._cell_plan is None or self._cell_plan_class is not cell_class:
+            self._cell_plan = CellPlan(self, cell_class)
+            self._cell_plan_class = cell_class
+        return self._cell_plan
+
+    def invalidate_cell_plan(self):
+        """
+        The cell configuration is read once and cached. If you change `cell` on a bound column you need to call this.
+        """
+        self._cell_plan = None
+
     @classmethod
     @dispatch(
         filter__call_target__attribute='from_model',
@@ -840,6 +954,20 @@ def foreign_key(cls, call_target, model_field, **kwargs):
         return call_target(model_field=model_field, **kwargs)
 
 
+def fragments_are_unstyled(table):
+    """
+    True if the style of `table` has no config for `Fragment`. A `Fragment` in
+    the table then renders as just its tag, attrs and children, so the rows
+    and the links in cells write their tags directly instead of binding a
+    `Fragment` for each of them.
+    """
+    result = table.__dict__.get('_fragments_are_unstyled')
+    if result is None:
+        result = not resolve_style(table._iommi_style_stack, None).component_for_class(Fragment)
+        table._fragments_are_unstyled = result
+    return result
+
+
 @with_meta
 class Cells(Traversable, Tag):
     """
@@ -874,11 +1002,19 @@ def __html__(self):
         if self.template:
             return render_template(self.iommi_parent().get_request(), self.template, self.iommi_evaluate_parameters())
 
+        children = mark_safe('\n'.join(bound_cell.__html__() for bound_cell in self))
+
+        if fragments_are_unstyled(self.get_table()) and self.tag not in _void_elements:
+            # The attrs are already evaluated by the bind, so the tag can be written directly
+            if not self.tag:
+                return children
+            return format_html('<{tag}{attrs}>{children}</{tag}>', tag=self.tag, attrs=render_attrs(self.attrs), children=children)
+
         return (
             Fragment(
                 tag=self.tag,
                 attrs=self.attrs,
-                children__text=mark_safe('\n'.join(bound_cell.__html__() for bound_cell in self)),
+                children__text=children,
             )
             .bind(parent=self)
             .__html__()
@@ -910,15 +1046,89 @@ class CellConfig(RefinableObject, Tag):
     link = Refinable()
 
 
-class Cell(CellConfig):
-    @dispatch
-    def __init__(self, cells: Cells, column):
-        kwargs = setdefaults_path(
+def _is_constant(value):
+    # Namespaces are callable, but they are never evaluated into something else
+    return not callable(value) or isinstance(value, Namespace)
+
+
+def _is_constant_attrs(attrs):
+    if not attrs:
+        return True
+    for k, v in items(attrs):
+        if k in ('class', 'style'):
+            if not _is_constant(v):
+                return False
+            if any(not _is_constant(x) for x in values(v)):
+                return False
+        elif not _is_constant(v):
+            return False
+    return True
+
+
+def _copy_attrs(attrs):
+    # A shallow copy, with copies of the class and style dicts, so each cell can change its own attrs
+    if not isinstance(attrs, Attrs):
+        return attrs
+    result = _shallow_copy(attrs)
+    for k in ('class', 'style'):
+        if k in attrs:
+            dict.__setitem__(result, k, _shallow_copy(attrs[k]))
+    return result
+
+
+def _shallow_copy(d):
+    # Skips Namespace.__init__, which would merge the already merged values again
+    result = type(d).__new__(type(d))
+    dict.update(result, d)
+    return result
+
+
+class CellPlan:
+    """
+    Internal class holding the cell configuration of a column merged with the
+    cell configuration of the table. This is calculated once per bound column
+    and reused for every row, instead of merging the config for every cell.
+    """
+
+    def __init__(self, column, cell_class):
+        namespace = setdefaults_path(
             Namespace(),
             column.cell,
             column.table.cell,
         )
-        super(Cell, self).__init__(**kwargs)
+        declared_items = cell_class.get_declared('refinable')
+        unknown_keys = [k for k in keys(namespace) if k not in declared_items]
+        if unknown_keys:
+            available_keys = '\n    '.join(sorted(declared_items.keys()))
+            raise TypeError(
+                f"""\
+{cell_class.__name__} object has no refinable attribute(s): {', '.join(f'"{k}"' for k in sorted(unknown_keys))}.
+Available attributes:
+    {available_keys}
+"""
+            )
+
+        self.namespace = namespace
+        self.members = {k: namespace.get(k, None) for k in keys(declared_items)}
+        # The evaluate parameters have the same names for every cell of a column, so the signatures are calculated once
+        self.signature = None
+        self.signature_with_value = None
+        self.value_is_constant = _is_constant(self.members['value'])
+        self.url_is_constant = _is_constant(self.members['url'])
+        self.url_title_is_constant = _is_constant(self.members['url_title'])
+        self.tag_is_constant = _is_constant(self.members['tag'])
+        self.attrs_is_constant = _is_constant_attrs(self.members['attrs'])
+        # Constant attrs are evaluated on the first cell and then copied for the rest of the column
+        self.evaluated_attrs = MISSING
+
+
+class Cell(CellConfig):
+    def __init__(self, cells: Cells, column):
+        plan = column.get_cell_plan(type(self))
+        self.__dict__.update(plan.members)
+        self.iommi_namespace = plan.namespace
+        self.is_refine_done = False
+        self._plan = plan
         self._name = 'cell'
         self._parent = cells
         self._is_bound = True
@@ -930,15 +1140,37 @@ def __init__(self, cells: Cells, column):
         self.table = cells.get_table()
         self.row = cells.row
 
-    def on_refine_done(self):
-        self._evaluate_parameters = {**self.cells.iommi_evaluate_parameters(), 'column': self.column}
+    def refine_done(self, parent=None):
+        # The config is already applied from the CellPlan of the column, so we skip the generic refine machinery here
+        assert not self.is_refine_done, f"refine_done() already invoked on {self!r}"
+        self.is_refine_done = True
+        self.on_refine_done()
+        return self
 
-        self.value = evaluate_strict(self.value, **self._evaluate_parameters)
-        self._evaluate_parameters['value'] = self.value
-        self.url = evaluate_strict(self.url, **self._evaluate_parameters)
-        self.attrs = evaluate_attrs(self, **self._evaluate_parameters)
-        self.url_title = evaluate_strict(self.url_title, **self._evaluate_parameters)
-        self.tag = evaluate_strict(self.tag, **self._evaluate_parameters)
+    def on_refine_done(self):
+        plan = self._plan
+        evaluate_parameters = self._evaluate_parameters = {**self.cells.iommi_evaluate_parameters(), 'column': self.column}
+
+        if not plan.value_is_constant:
+            if plan.signature is None:
+                plan.signature = signature_from_kwargs(evaluate_parameters)
+            self.value = evaluate_strict(self.value, __signature=plan.signature, **evaluate_parameters)
+        evaluate_parameters['value'] = self.value
+        if plan.signature_with_value is None:
+            plan.signature_with_value = signature_from_kwargs(evaluate_parameters)
+        signature = plan.signature_with_value
+        if not plan.url_is_constant:
+            self.url = evaluate_strict(self.url, __signature=signature, **evaluate_parameters)
+        if plan.attrs_is_constant:
+            if plan.evaluated_attrs is MISSING:
+                plan.evaluated_attrs = evaluate_attrs(self, __signature=signature, **evaluate_parameters)
+            self.attrs = _copy_attrs(plan.evaluated_attrs)
+        else:
+            self.attrs = evaluate_attrs(self, __signature=signature, **evaluate_parameters)
+        if not plan.url_title_is_constant:
+            self.url_title = evaluate_strict(self.url_title, __signature=signature, **evaluate_parameters)
+        if not plan.tag_is_constant:
+            self.tag = evaluate_strict(self.tag, __signature=signature, **evaluate_parameters)
 
     @property
     def iommi_dunder_path(self):
@@ -966,6 +1198,16 @@ def render_cell_contents(self):
         url = self.url
         if url:
             url_title = self.url_title
+            link = self.link
+            if (
+                isinstance(cell_contents, str)
+                and set(keys(link)) <= {'attrs'}
+                and _is_constant_attrs(link.get('attrs'))
+                and fragments_are_unstyled(self.table)
+            ):
+                attrs = setdefaults_path(Namespace(), link.get('attrs', {}), title=url_title, href=url, **{'class': {}, 'style': {}})
+                return format_html('<a{}>{}</a>', render_attrs(attrs), cell_contents)
+
             # TODO: `url`, `url_title` and `link` is overly complex
             cell_contents = (
                 Fragment(tag='a', attrs__title=url_title, attrs__href=url, children__content=cell_contents, **self.link)
@@ -1022,9 +1264,18 @@ class RowConfig(RefinableObject, Tag):
     template: Union[str, Template] = Refinable()
     extra: Dict[str, Any] = Refinable()
     extra_evaluated: Dict[str, Any] = Refinable()
+    cache: Namespace = Refinable()
+
+    def on_refine_done(self):
+        if self.cache is not None:
+            assert 'key' in self.cache, 'row__cache needs a key, like row__cache__key=lambda row, **_: (row.pk, row.updated_at)'
+            assert self.cache.get('prefix'), "row__cache needs a prefix that is unique for this table, like row__cache__prefix='albums'"
+            unknown_keys = set(keys(self.cache)) - {'key', 'prefix', 'timeout', 'cache_alias'}
+            assert not unknown_keys, f'Unknown row__cache parameters: {", ".join(sorted(unknown_keys))}'
+        super(RowConfig, self).on_refine_done()
 
     def as_dict(self):
-        return {k: getattr(self, k) for k in keys(self.get_declared('refinable'))}
+        return {k: getattr(self, k) for k in keys(self.get_declared('refinable')) if k != 'cache'}
 
 
 class ColumnHeader(object):
@@ -1178,6 +1429,292 @@ def paginator__count(rows, **_):
         return None
 
 
+class CappedCount(int):
+    """
+    The result of a count that stopped at `limit`. The value is `limit + 1`,
+    so there is always a next page after the limit, but it renders as "limit+".
+    """
+
+    def __new__(cls, limit):
+        result = super(CappedCount, cls).__new__(cls, limit + 1)
+        result.limit = limit
+        return result
+
+    def __getnewargs__(self):
+        return (self.limit,)
+
+    def __str__(self):
+        return f'{self.limit}+'
+
+    __html__ = __str__
+
+
+def capped_count(limit=1000):
+    """
+    Count strategy for `Paginator.count` that stops counting at `limit` rows,
+    with a `SELECT COUNT(*)` over a `LIMIT` subquery. If there are more rows the
+    count is a `CappedCount` that renders as "limit+". The limit is raised as
+    needed so the requested page is always reachable.
+
+    .. code-block:: python
+
+        Table(auto__model=Album, parts__page__count=capped_count(limit=10000))
+    """
+    def count(rows, paginator, page_size, **_):
+        if not isinstance(rows, QuerySet):
+            return paginator__count(rows=rows)
+
+        request = paginator.get_request()
+        try:
+            page = int(request.GET.get(paginator.iommi_path)) if request else 1
+        except (TypeError, ValueError):
+            page = 1
+
+        cap = max(limit, page * page_size)
+        result = rows.order_by()[:cap + 1].count()
+        if result > cap:
+            return CappedCount(cap)
+        return result
+
+    return count
+
+
+_row_count_estimator_by_vendor = {}
+
+
+def register_row_count_estimator(vendor, estimator):
+    """
+    Register a function that estimates the number of rows of a `QuerySet` for
+    a database vendor (`connection.vendor`, e.g. `'postgresql'`). The function
+    takes the `QuerySet` and returns the estimated count, or `None` if it can't
+    make an estimate. Returns a context manager that unregisters the estimator
+    again.
+    """
+    previous = _row_count_estimator_by_vendor.get(vendor)
+    _row_count_estimator_by_vendor[vendor] = estimator
+
+    @contextmanager
+    def _unregister():
+        try:
+            yield estimator
+        finally:
+            if previous is None:
+                del _row_count_estimator_by_vendor[vendor]
+            else:
+                _row_count_estimator_by_vendor[vendor] = previous
+    return _unregister()
+
+
+def is_unfiltered(rows):
+    query = rows.query
+    return not query.where and not query.distinct and query.group_by is None and not query_is_sliced(query) and not query.combinator
+
+
+def postgresql_row_count_estimate(rows):
+    connection = connections[rows.db]
+    with connection.cursor() as cursor:
+        if is_unfiltered(rows):
+            cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [connection.ops.quote_name(rows.model._meta.db_table)])
+            result = cursor.fetchone()
+            if result is None or result[0] < 0:
+                # The table has never been analyzed
+                return None
+            return int(result[0])
+
+        try:
+            sql, params = rows.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            # Django knows that there are no rows without querying, like for none() or pk__in=[]
+            return 0
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+register_row_count_estimator('postgresql', postgresql_row_count_estimate)
+
+
+def estimated_count(threshold=10000, filtered=False):
+    """
+    Count strategy for `Paginator.count` that uses an estimate from the
+    database instead of `COUNT(*)`. On PostgreSQL the estimate comes from
+    `pg_class.reltuples`, which is only used for unfiltered querysets. With
+    `filtered=True` the estimate of the query planner is used for filtered
+    querysets too, but those can be quite far off. Estimates below `threshold`
+    are replaced with an exact count, since they are cheap and the estimates of
+    small tables are not very good. On databases with no registered estimator
+    (see `register_row_count_estimator`) this is an exact count.
+
+    .. code-block:: python
+
+        Table(auto__model=Album, parts__page__count=estimated_count())
+    """
+    def count(rows, **_):
+        if not isinstance(rows, QuerySet) or not (filtered or is_unfiltered(rows)):
+            return paginator__count(rows=rows)
+
+        estimator = _row_count_estimator_by_vendor.get(connections[rows.db].vendor)
+        result = estimator(rows) if estimator is not None else None
+        if result is None or result < threshold:
+            return paginator__count(rows=rows)
+        return result
+
+    return count
+
+
+def cached_count(timeout=60, count=paginator__count, cache_alias='default'):
+    """
+    Count strategy for `Paginator.count` that caches the result of another
+    count strategy (`count`, default an exact count) in the Django cache for
+    `timeout` seconds. The cache key is the SQL of the `QuerySet` without
+    ordering, so changing the sorting of a table does not count again.
+
+    .. code-block:: python
+
+        Table(auto__model=Album, parts__page__count=cached_count(timeout=300))
+    """
+    def cached(rows, **kwargs):
+        if not isinstance(rows, QuerySet):
+            return evaluate_strict(count, rows=rows, **kwargs)
+
+        try:
+            sql, params = rows.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            # Django knows that there are no rows without querying, like for none() or pk__in=[]
+            return 0
+        key = 'iommi-count-' + sha1(repr((rows.db, sql, params)).encode()).hexdigest()
+        cache = caches[cache_alias]
+        result = cache.get(key)
+        if result is None:
+            result = evaluate_strict(count, rows=rows, **kwargs)
+            cache.set(key, result, timeout)
+        return result
+
+    return cached
+
+
+class _KeysetCursorEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, (datetime, date, time)):
+            return o.isoformat()
+        if isinstance(o, (Decimal, UUID)):
+            return str(o)
+        return super().default(o)
+
+
+def keyset__encode_cursor(direction, values):
+    s = json.dumps([direction, values], cls=_KeysetCursorEncoder, separators=(',', ':'))
+    return urlsafe_b64encode(s.encode()).decode().rstrip('=')
+
+
+def keyset__decode_cursor(cursor):
+    """
+    Returns a tuple of direction and values, or `None` if the cursor is not valid.
+    """
+    try:
+        s = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        direction, values = json.loads(s)
+    except (ValueError, TypeError):
+        return None
+    if direction not in ('next', 'previous') or not isinstance(values, list):
+        return None
+    return direction, values
+
+
+def keyset__order_fields(rows):
+    """
+    The ordering of `rows` as a list of field names (with '-' prefix for descending), with `pk` added at the end
+    as a tie-breaker if it's not already there. Returns `None` for orderings keyset pagination can't use: reversed
+    querysets, and orderings on expressions or random.
+    """
+    if not rows.query.standard_ordering:
+        return None
+    ordering = list(rows.query.order_by) or list(rows.model._meta.ordering)
+    pk_names = {'pk', rows.model._meta.pk.name}
+    result = []
+    for field in ordering:
+        if not isinstance(field, str) or field == '?':
+            return None
+        result.append(field)
+        if field.lstrip('-') in pk_names:
+            # Ordering after the pk is pointless, it's unique
+            return result
+    return result + ['pk']
+
+
+def keyset__model_fields(model, fields):
+    """
+    The model field of each of `fields`, or `None` if one of them is not a model field, can be null, or is a
+    relation. Keyset pagination can't be used for those. Ordering on a relation (like `artist`) orders by the
+    `Meta.ordering` of the related model, not by the pk that would be in the cursor.
+    """
+    result = []
+    for field in fields:
+        current_model = model
+        nullable = False
+        for name in field.lstrip('-').split('__'):
+            try:
+                model_field = current_model._meta.pk if name == 'pk' else get_field(current_model, name)
+            except FieldDoesNotExist:
+                return None
+            nullable = nullable or model_field.null
+            if model_field.remote_field is not None:
+                current_model = model_field.remote_field.model
+        if nullable:
+            return None
+        if model_field.remote_field is not None and name == model_field.name:
+            return None
+        result.append(model_field)
+    return result
+
+
+def keyset__clean_values(model_fields, values):
+    """
+    The values of a cursor converted with the `to_python` of the model fields, or `None` if they are not valid.
+    """
+    if len(values) != len(model_fields):
+        # The sort order has changed since the cursor was created
+        return None
+    try:
+        result = [model_field.to_python(value) for model_field, value in zip(model_fields, values)]
+    except (ValidationError, TypeError, ValueError):
+        return None
+    if any(value is None for value in result):
+        return None
+    return result
+
+
+def keyset__reverse_order_fields(fields):
+    return [field[1:] if field.startswith('-') else '-' + field for field in fields]
+
+
+def keyset__q(fields, values):
+    """
+    Q object for the rows after the row with the given `values` for `fields`, in the ordering given by `fields`.
+    """
+    result = None
+    equal = Q()
+    for field, value in zip(fields, values):
+        name = field.lstrip('-')
+        operator = 'lt' if field.startswith('-') else 'gt'
+        q = equal & Q(**{f'{name}__{operator}': value})
+        result = q if result is None else result | q
+        equal &= Q(**{name: value})
+    return result
+
+
+def keyset__row_values(fields, row):
+    result = []
+    for field in fields:
+        value = getattr_path(row, field.lstrip('-'))
+        if isinstance(value, Model):
+            value = value.pk
+        result.append(value)
+    return result
+
+
 class Paginator(Traversable):
     attrs: Attrs = Refinable()  # attrs is evaluated, but in a special way so gets no EvaluatedRefinable type
     template: Union[str, Template] = EvaluatedRefinable()
@@ -1194,6 +1731,9 @@ class Paginator(Traversable):
     count: int = Refinable()  # count is evaluated, but in a special way so gets no EvaluatedRefinable type
     slice = Refinable()
     show_always = Refinable()
+    keyset: bool = Refinable()
+    window_count: bool = Refinable()
+    snapshot: Namespace = Refinable()
 
     @dispatch(
         adjacent_pages=6,
@@ -1214,14 +1754,30 @@ class Paginator(Traversable):
             max(1, (paginator.count - (paginator.min_page_size - 1))) / paginator.page_size
         ),
         slice=lambda top, bottom, rows, **_: rows[bottom:top],
+        keyset=False,
+        window_count=False,
+        snapshot=None,
     )
     def __init__(self, **kwargs):
+        """
+        :param keyset: Use keyset (also known as seek) pagination. Instead of a page number the GET parameter holds a cursor with the values of the sort columns of the first or last row of the current page, and the next page is fetched with a `WHERE` on those values instead of with `OFFSET`. There is no `COUNT` query and only next/previous links are rendered. This requires the rows to be a `QuerySet`. The pk is added to the ordering as a tie-breaker. If a sort column is not a model field, can be null or is a relation, or if the ordering is reversed or on an expression, normal page numbers are used instead.
+        :param window_count: Get the count with a `COUNT(*) OVER ()` in the query for the rows of the page, instead of with a separate `COUNT` query. `count` is only used when the page is empty. This requires the rows to be a `QuerySet`, a database that supports window functions, and that `page` is not a callable. `DISTINCT` and combined (like `union`) querysets use the normal count.
+        :param snapshot: Store the pks of all the rows, in order, in the Django cache on the first request, and get the rows of the other pages by pk. This is for filters that make the query slow. The links of the paginator get a `<path>_snapshot` GET parameter with the token of the snapshot. When the snapshot has expired, or the filtering or sorting has changed, the rows are queried again and a new snapshot is made. Turn it on with `snapshot=True` or by giving any of `snapshot__timeout` (seconds, default 300), `snapshot__max_size` (the most pks to store, if there are more rows the snapshot isn't used, and that is remembered for `timeout` seconds, default 10000) and `snapshot__cache_alias`. The rows of a page are fetched from the rows of the table before filtering, so annotations and `select_related` are kept. This requires the rows to be a `QuerySet`.
+        """
         super(Paginator, self).__init__(**kwargs)
 
     def on_refine_done(self):
         self.context = None
         self.page_size = None
         self.rows = None
+        self.has_next = None
+        self.has_previous = None
+        self.snapshot_token = None
+        if self.snapshot is True:
+            self.snapshot = Namespace()
+        if self.snapshot is not None:
+            unknown_keys = set(keys(self.snapshot)) - {'timeout', 'max_size', 'cache_alias'}
+            assert not unknown_keys, f'Unknown snapshot parameters: {", ".join(sorted(unknown_keys))}'
         super(Paginator, self).on_refine_done()
 
     def on_bind(self) -> None:
@@ -1237,30 +1793,53 @@ def on_bind(self) -> None:
         self.link.attrs = evaluate_attrs(self.link)
 
         rows = table.sorted_and_filtered_rows
+
+        if self.keyset and self.page_size is not None and isinstance(rows, QuerySet):
+            fields = keyset__order_fields(rows)
+            model_fields = keyset__model_fields(rows.model, fields) if fields is not None else None
+            if model_fields is not None:
+                self._bind_keyset(rows, fields, model_fields)
+                return
+
         evaluate_parameters = dict(
             page_size=self.page_size,
             rows=rows,
             **self.iommi_evaluate_parameters(),
         )
 
+        # The rows of the page, if they were fetched together with the count
+        window_rows = None
+        # The pks of all the rows, if they are from a snapshot
+        snapshot_pks = None
+
         if self.page_size is None:
             self.number_of_pages = 1
         else:
-            self.count = evaluate_strict(self.count, **evaluate_parameters) if rows is not None else 0
+            if self._use_snapshot(rows):
+                snapshot_pks = timed('count', self, self._snapshot_pks, rows)
+            if snapshot_pks is not None:
+                self.count = len(snapshot_pks)
+            elif self._use_window_count(rows):
+                window_page = max(1, self._requested_page(evaluate_parameters))
+                window_rows, self.count = timed('count', self, self._window_count, rows, window_page, evaluate_parameters)
+            else:
+                self.count = timed('count', self, evaluate_strict, self.count, **evaluate_parameters) if rows is not None else 0
             if self.count is None:
                 self.number_of_pages = 1
             else:
                 self.number_of_pages = evaluate_strict(self.number_of_pages, **evaluate_parameters)
 
-        page = request.GET.get(self.iommi_path) if request else None
-        page = evaluate_strict(self.page, **evaluate_parameters) if page is None else int(page)
-        self.page = page
+        self.page = self._requested_page(evaluate_parameters)
 
         if self.page > self.number_of_pages:
             self.page = self.number_of_pages
         elif self.page < 1:
             self.page = 1
 
+        if window_rows is not None and self.page != window_page:
+            # The requested page was after the last page
+            window_rows = None
+
         self.context = self.iommi_evaluate_parameters().copy()
 
         if self.number_of_pages != 1:
@@ -1268,10 +1847,19 @@ def on_bind(self) -> None:
             top = bottom + self.page_size
             if top + self.min_page_size - 1 >= self.count:
                 top = self.count
-            paginated_rows = self.slice(**evaluate_parameters, bottom=bottom, top=top)
-            self.rows = paginated_rows
+            if snapshot_pks is not None:
+                self.rows = self._snapshot_rows(table, snapshot_pks[bottom:top])
+            elif window_rows is not None:
+                self.rows = window_rows[:top - bottom]
+            else:
+                paginated_rows = self.slice(**evaluate_parameters, bottom=bottom, top=top)
+                self.rows = table.with_inferred_related(paginated_rows)
+        elif snapshot_pks is not None:
+            self.rows = self._snapshot_rows(table, snapshot_pks)
+        elif window_rows is not None:
+            self.rows = window_rows
         else:
-            self.rows = evaluate_parameters['rows']
+            self.rows = table.with_inferred_related(evaluate_parameters['rows'])
 
         foo = self.page
         if foo <= self.adjacent_pages:
@@ -1289,12 +1877,17 @@ def on_bind(self) -> None:
         if self.iommi_path in get:
             del get[self.iommi_path]
 
+        if self.snapshot_token is not None:
+            get[self._snapshot_param()] = self.snapshot_token
+        elif self._snapshot_param() in get:
+            del get[self._snapshot_param()]
+
         self.context.update(
             dict(
                 extra=get and (get.urlencode() + "&") or "",
                 page_numbers=page_numbers,
                 show_first=1 not in page_numbers,
-                show_last=self.number_of_pages not in page_numbers,
+                show_last=self.number_of_pages not in page_numbers and not isinstance(self.count, CappedCount),
             )
         )
 
@@ -1314,11 +1907,167 @@ def on_bind(self) -> None:
             }
         )
 
+    def _requested_page(self, evaluate_parameters):
+        request = self.get_request()
+        page = request.GET.get(self.iommi_path) if request else None
+        return evaluate_strict(self.page, **evaluate_parameters) if page is None else int(page)
+
+    def _use_window_count(self, rows):
+        return (
+            self.window_count
+            and isinstance(rows, QuerySet)
+            and not callable(self.page)
+            and not rows.query.distinct
+            and not rows.query.combinator
+            and not query_is_sliced(rows.query)
+            and connections[rows.db].features.supports_over_clause
+        )
+
+    def _window_count(self, rows, page, evaluate_parameters):
+        """
+        Fetch the rows of `page` with the total count in each row. Returns the rows
+        and the count, or `None` and the count from `count` if the page is after the
+        last page.
+        """
+        bottom = (page - 1) * self.page_size
+        # The last page takes up to min_page_size - 1 more rows
+        top = bottom + self.page_size + self.min_page_size - 1
+
+        rows = self.iommi_evaluate_parameters()['table'].with_inferred_related(rows)
+        page_rows = list(rows.annotate(_iommi_window_count=Window(Count('*')))[bottom:top])
+        if page_rows:
+            return page_rows, page_rows[0]._iommi_window_count
+        if page == 1:
+            # No rows at all
+            return page_rows, 0
+        return None, evaluate_strict(self.count, **evaluate_parameters)
+
+    def _snapshot_param(self):
+        return self.iommi_path + '_snapshot'
+
+    def _use_snapshot(self, rows):
+        return (
+            self.snapshot is not None
+            and isinstance(rows, QuerySet)
+            and isinstance(self.iommi_evaluate_parameters()['table'].initial_rows, QuerySet)
+            and not rows.query.combinator
+            and not query_is_sliced(rows.query)
+        )
+
+    def _snapshot_pks(self, rows):
+        """
+        The pks of all the rows, from the snapshot in the request if it is for the same query, or from a new snapshot.
+        Returns `None` if there are more than `snapshot__max_size` rows.
+        """
+        cache = caches[self.snapshot.get('cache_alias', 'default')]
+        request = self.get_request()
+        try:
+            sql, params = rows.query.sql_with_params()
+        except EmptyResultSet:
+            # Django knows that there are no rows without querying, like for none() or pk__in=[]. There is nothing to
+            # snapshot.
+            return []
+        fingerprint = sha1(repr((rows.db, sql, params)).encode()).hexdigest()
+
+        token = request.GET.get(self._snapshot_param()) if request else None
+        if token:
+            snapshot = cache.get('iommi-snapshot-' + token)
+            if snapshot is not None and snapshot[0] == fingerprint:
+                self.snapshot_token = token
+                return snapshot[1]
+
+        max_size = self.snapshot.get('max_size', 10000)
+        timeout = self.snapshot.get('timeout', 300)
+        # Remember that the query has too many rows, so the next requests skip straight to the count and the page
+        too_large_key = f'iommi-snapshot-too-large-{max_size}-{fingerprint}'
+        if cache.get(too_large_key):
+            return None
+
+        pks = list(rows.values_list('pk', flat=True)[:max_size + 1])
+        if len(pks) > max_size:
+            cache.set(too_large_key, True, timeout)
+            return None
+
+        token = uuid4().hex
+        cache.set('iommi-snapshot-' + token, (fingerprint, pks), timeout)
+        self.snapshot_token = token
+        return pks
+
+    def _snapshot_rows(self, table, pks):
+        rows = table.with_inferred_related(table.initial_rows.order_by().filter(pk__in=pks))
+        row_by_pk = {row.pk: row for row in rows}
+        # Rows that have been deleted since the snapshot was made are skipped
+        return [row_by_pk[pk] for pk in pks if pk in row_by_pk]
+
+    def _bind_keyset(self, rows, fields, model_fields):
+        request = self.get_request()
+        rows = self.iommi_evaluate_parameters()['table'].with_inferred_related(rows)
+
+        cursor = request.GET.get(self.iommi_path) if request else None
+        cursor = keyset__decode_cursor(cursor) if cursor else None
+        if cursor is not None:
+            values = keyset__clean_values(model_fields, cursor[1])
+            cursor = None if values is None else (cursor[0], values)
+
+        if cursor is None:
+            page_rows = list(rows.order_by(*fields)[:self.page_size + 1])
+            has_next = len(page_rows) > self.page_size
+            has_previous = False
+            page_rows = page_rows[:self.page_size]
+        else:
+            direction, values = cursor
+            if direction == 'next':
+                page_rows = list(rows.filter(keyset__q(fields, values)).order_by(*fields)[:self.page_size + 1])
+                has_next = len(page_rows) > self.page_size
+                has_previous = True
+                page_rows = page_rows[:self.page_size]
+            else:
+                reversed_fields = keyset__reverse_order_fields(fields)
+                page_rows = list(
+                    rows.filter(keyset__q(reversed_fields, values)).order_by(*reversed_fields)[:self.page_size + 1]
+                )
+                has_previous = len(page_rows) > self.page_size
+                has_next = True
+                page_rows = list(reversed(page_rows[:self.page_size]))
+
+        self.rows = page_rows
+        # The total count is not known in keyset mode, this is the count of rows on the current page
+        self.count = len(page_rows)
+        self.page = None
+        self.number_of_pages = None
+        self.has_next = has_next and bool(page_rows)
+        self.has_previous = has_previous and bool(page_rows)
+
+        get = params_of_request(request)
+        if self.iommi_path in get:
+            del get[self.iommi_path]
+
+        self.context = self.iommi_evaluate_parameters().copy()
+        self.context.update(
+            {
+                'extra': get and (get.urlencode() + "&") or "",
+                'page_numbers': [],
+                'show_first': False,
+                'show_last': False,
+                'page_size': self.iommi_evaluate_parameters()['table'].page_size,
+                'has_next': self.has_next,
+                'has_previous': self.has_previous,
+                'next': keyset__encode_cursor('next', keyset__row_values(fields, page_rows[-1])) if self.has_next else None,
+                'previous': keyset__encode_cursor('previous', keyset__row_values(fields, page_rows[0])) if self.has_previous else None,
+                'page': None,
+                'pages': None,
+                'hits': None,
+                'paginator': self,
+            }
+        )
+
     def own_evaluate_parameters(self):
         return dict(paginator=self)
 
     def is_paginated(self):
         assert self._is_bound, NOT_BOUND_MESSAGE
+        if self.number_of_pages is None:
+            return self.has_next or self.has_previous
         return self.number_of_pages > 1
 
     def __html__(self):
@@ -1327,7 +2076,7 @@ def __html__(self):
             if self.page_size is None:
                 return ''
 
-            if self.number_of_pages <= 1:
+            if not self.is_paginated():
                 return ''
 
         return render_template(
@@ -1344,7 +2093,35 @@ class TableAutoConfig(AutoConfig):
     rows = Refinable()
 
 
-def endpoint__csv(table, **_):
+DEFAULT_CSV_CHUNK_SIZE = 2000
+
+
+def csv_smart_str(s):
+    if s is None:
+        return ''
+    elif isinstance(s, float):
+        result = ('%f' % s).strip('0')
+        if result[-1] == '.':
+            result += '0'
+        return result
+    else:
+        assert not isinstance(s, bytes)
+        return str(s).strip()
+
+
+def csv_safe_value(value):
+    # CSV formula injection protection: http://georgemauer.net/2017/10/07/csv-injection.html
+    if value and value[0] in ('+', '-', '@', '='):
+        return '\t' + value
+    else:
+        return value
+
+
+def csv_filename_and_rows(table, cells_iterable):
+    """
+    Returns the filename of the report and an iterator of the rows (as lists
+    of strings, header first) to write to the CSV.
+    """
     columns = [c for c in values(table.columns) if c.extra_evaluated.get('report_name')]
     csv_safe_column_indexes = {i for i, c in enumerate(values(table.columns)) if 'csv_whitelist' in c.extra}
     assert columns, 'To get CSV output you must specify at least one column with extra_evaluated__report_name'
@@ -1353,48 +2130,20 @@ def endpoint__csv(table, **_):
     ), 'To get CSV output you must specify extra_evaluated__report_name on the table'
     filename = table.extra_evaluated.report_name + '.csv'
 
-    header = [c.extra_evaluated.report_name for c in columns]
-
-    def smart_text2(s):
-        if s is None:
-            return ''
-        elif isinstance(s, float):
-            result = ('%f' % s).strip('0')
-            if result[-1] == '.':
-                result += '0'
-            return result
-        else:
-            assert not isinstance(s, bytes)
-            return str(s).strip()
-
-    def safe_csv_value(value):
-        # CSV formula injection protection: http://georgemauer.net/2017/10/07/csv-injection.html
-        if value and value[0] in ('+', '-', '@', '='):
-            return '\t' + value
-        else:
-            return value
-
     def cell_value(cells, bound_column):
         value = Cell(cells, bound_column).refine_done(parent=cells).value
         return bound_column.extra_evaluated.get('report_value', value)
 
     def rows():
-        for cells in table.cells_for_rows():
-            yield [cell_value(cells, bound_column) for bound_column in columns]
-
-    def write_csv_row(writer, row):
-        row_strings = [smart_text2(value) for value in row]
-        safe_row = [v if i in csv_safe_column_indexes else safe_csv_value(v) for i, v in enumerate(row_strings)]
-        writer.writerow(safe_row)
+        yield [c.extra_evaluated.report_name for c in columns]
+        for cells in cells_iterable:
+            row_strings = [csv_smart_str(cell_value(cells, bound_column)) for bound_column in columns]
+            yield [v if i in csv_safe_column_indexes else csv_safe_value(v) for i, v in enumerate(row_strings)]
 
-    f = StringIO()
-    writer = csv.writer(f)
-    writer.writerow(header)
-    for row in rows():
-        write_csv_row(writer, row)
+    return filename, rows()
 
-    response = FileResponse(f.getvalue(), 'text/csv')
 
+def set_csv_response_headers(response, filename):
     # RFC 2183, RFC 2184
     response['Content-Disposition'] = smart_str(
         "attachment; filename*=UTF-8''{value}".format(value=quote_plus(filename))
@@ -1403,12 +2152,221 @@ def write_csv_row(writer, row):
     return response
 
 
+def endpoint__csv(table, **_):
+    filename, rows = csv_filename_and_rows(table, table.cells_for_rows())
+
+    f = StringIO()
+    writer = csv.writer(f)
+    for row in rows:
+        writer.writerow(row)
+
+    return set_csv_response_headers(FileResponse(f.getvalue(), 'text/csv'), filename)
+
+
+def endpoint__csv_streaming(table, **_):
+    """
+    CSV export that streams the output in chunks instead of building the
+    entire file in memory. QuerySets are read with a server side cursor, so
+    memory use stays flat regardless of the number of rows. Use it with
+    `endpoints__csv__func=endpoint__csv_streaming`. The number of rows per
+    chunk is set with `extra_evaluated__report_chunk_size`.
+    """
+    chunk_size = table.extra_evaluated.get('report_chunk_size', DEFAULT_CSV_CHUNK_SIZE)
+    filename, rows = csv_filename_and_rows(table, table.cells_for_rows(chunk_size=chunk_size))
+
+    def chunks():
+        f = StringIO()
+        writer = csv.writer(f)
+        for i, row in enumerate(rows, start=1):
+            writer.writerow(row)
+            if i % chunk_size == 0:
+                yield f.getvalue()
+                f.seek(0)
+                f.truncate()
+        if f.tell():
+            yield f.getvalue()
+
+    return set_csv_response_headers(StreamingHttpResponse(chunks(), content_type='text/csv'), filename)
+
+
 class _Lazy_tbody:
     def __init__(self, table):
         self.table = table
 
     def __html__(self):
-        return mark_safe('\n'.join([cells.__html__() for cells in self.table.cells_for_rows()]))
+        placeholder = stream_placeholder(self.table, self.chunks)
+        if placeholder is not None:
+            return placeholder
+        return mark_safe('\n'.join(self.rows_html()))
+
+    def rows_html(self):
+        table = self.table
+        render_row = Cells.__html__
+        query_counter = None
+        if iommi_debug_on() and isinstance(table.rows, QuerySet):
+            query_counter = _RowQueryCounter(connections[table.rows.db])
+            render_row = query_counter.render_row
+
+        if table.row.cache is not None:
+            yield from render_rows_with_cache(table, render_row=render_row)
+        else:
+            for cells in table.cells_for_rows():
+                yield render_row(cells)
+
+        if query_counter is not None:
+            query_counter.warn(table)
+
+    def chunks(self, chunk_size=DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        The rows in groups of `chunk_size`, joined the same way as `__html__` joins them.
+        """
+        chunk = []
+        separator = ''
+        for row_html in self.rows_html():
+            chunk.append(row_html)
+            if len(chunk) == chunk_size:
+                yield separator + '\n'.join(chunk)
+                chunk = []
+                separator = '\n'
+        if chunk:
+            yield separator + '\n'.join(chunk)
+
+
+class _RowQueryCounter:
+    """
+    Counts the queries run while rendering rows, to warn about queries that
+    `select_related`/`prefetch_related` would have avoided.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.number_of_rows = 0
+        self.number_of_queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.number_of_queries += 1
+        return execute(sql, params, many, context)
+
+    def render_row(self, cells):
+        self.number_of_rows += 1
+        with self.connection.execute_wrapper(self):
+            return cells.__html__()
+
+    def warn(self, table):
+        if self.number_of_queries:
+            warnings.warn(
+                f'Rendering {self.number_of_rows} rows of the table {table.iommi_path or table._name} ran {self.number_of_queries} queries. '
+                f'Set data_retrieval_method on the columns that read relations that could not be inferred from their attr, '
+                f'or use select_related/prefetch_related on the rows.'
+            )
+
+
+def render_rows_with_cache(table, render_row=Cells.__html__):
+    """
+    Render the rows of `table` using the cache configured with `row__cache`.
+    The rows of a page are fetched with one `get_many`, and the rows that were
+    not in the cache are stored with one `set_many`.
+
+    The cache key is the result of `row__cache__key` together with
+    `row__cache__prefix`, the class and path of the table, the rendered
+    columns, the style and the active language.
+    """
+    config = table.row.cache
+    assert not any(column.auto_rowspan for column in values(table.columns)), 'row__cache can not be used with auto_rowspan'
+
+    iommi_style = table.iommi_style
+    table_key = (
+        config.prefix,
+        f'{type(table).__module__}.{type(table).__qualname__}',
+        build_long_path(table),
+        tuple(name for name, column in items(table.columns) if column.render_column),
+        getattr(iommi_style, 'name', iommi_style),
+        get_language(),
+    )
+
+    rows = list(table.cells_for_rows())
+    row_keys = [
+        'iommi-row-' + sha1(repr((table_key, evaluate_strict(config.key, **cells.iommi_evaluate_parameters()))).encode()).hexdigest()
+        for cells in rows
+    ]
+
+    cache = caches[config.get('cache_alias', 'default')]
+    html_by_key = cache.get_many(row_keys)
+    rendered = {}
+    for key, cells in zip(row_keys, rows):
+        if key not in html_by_key:
+            html_by_key[key] = rendered[key] = str(render_row(cells))
+    if rendered:
+        cache.set_many(rendered, config.get('timeout', DEFAULT_TIMEOUT))
+
+    return [html_by_key[key] for key in row_keys]
+
+
+def run_queries_concurrently(tables, max_workers=4):
+    """
+    Run the queries of the paginators of `tables`, the count and the rows of
+    the current page, concurrently on at most `max_workers` threads. The
+    tables are split between the threads, and each thread uses its own
+    database connection, which it closes when it's done. The count queries
+    run first (while binding the paginators, since the page depends on the
+    count), then the queries for the rows. The tables then render from the
+    fetched rows.
+
+    The connections of the threads are not in the transaction of the
+    caller, so they can't see its uncommitted changes. If a connection of the
+    caller is in a transaction (like with `ATOMIC_REQUESTS`) nothing is done
+    here, and the queries run in the caller's thread when the tables render.
+    """
+    if len(tables) < 2 or max_workers < 2:
+        return
+
+    if any(connection.in_atomic_block for connection in connections.all()):
+        return
+
+    language = get_language()
+    current_timezone = get_current_timezone()
+    request = get_current_request()
+    span = current_span()
+    # Importing iommi.sql_trace installs its cursor wrapper, so only carry over its state when it's in use
+    sql_trace = sys.modules.get('iommi.sql_trace')
+    sql_debug = getattr(sql_trace.state, 'sql_debug', None) if sql_trace is not None else None
+
+    def worker(tables_of_worker):
+        set_current_request(request)
+        if sql_trace is not None:
+            sql_trace.set_sql_debug(sql_debug, validate=False)
+        try:
+            with translation_override(language), timezone_override(current_timezone), timing_in_thread(span):
+                for table in tables_of_worker:
+                    # Bind the paginator, which runs the count
+                    table.parts.page
+                for table in tables_of_worker:
+                    paginator = table.parts.page
+                    if paginator is not None and isinstance(paginator.rows, QuerySet):
+                        len(paginator.rows)
+        finally:
+            set_current_request(None)
+            if sql_trace is not None:
+                sql_trace.set_sql_debug(None, validate=False)
+            connections.close_all()
+
+    errors = []
+
+    def run(tables_of_worker):
+        try:
+            worker(tables_of_worker)
+        except BaseException as e:
+            errors.append(e)
+
+    # A thread per group of tables, so that each thread opens and closes its connections once
+    number_of_workers = min(len(tables), max_workers)
+    threads = [Thread(target=run, args=(tables[i::number_of_workers],)) for i in range(number_of_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
 
 
 @declarative(Column, '_columns_dict', add_init_kwargs=False)
@@ -1434,6 +2392,7 @@ class Meta:
     bulk_exclude: Namespace = EvaluatedRefinable()
     sortable: bool = EvaluatedRefinable()
     query_from_indexes: bool = Refinable()
+    infer_related: bool = EvaluatedRefinable()
     default_sort_order = Refinable()
     attrs: Attrs = Refinable()  # attrs is evaluated, but in a special way so gets no EvaluatedRefinable type
     template: Union[str, Template] = EvaluatedRefinable()
@@ -1535,6 +2494,8 @@ def post_bulk_edit(table, queryset, updates, **_):
         row__template=None,
         row__extra=EMPTY,
         row__extra_evaluated=EMPTY,
+        row__cache=None,
+        infer_related=True,
         cell__tag='td',
         header__template='iommi/table/table_header_rows.html',
         h_tag__call_target=Header,
@@ -1571,9 +2532,11 @@ def __init__(
         :param attrs: dict of strings to string/callable of HTML attributes to apply to the table
         :param row__attrs: dict of strings to string/callable of HTML attributes to apply to the row. Callables are passed the row as argument.
         :param row__template: name of template (or `Template` object) to use for rendering the row
+        :param row__cache: cache the rendered HTML of the rows. `row__cache__key` is a callable returning a key for the row, like `lambda row, **_: (row.pk, row.updated_at)`, and `row__cache__prefix` is a string that is unique for this table, so that two tables with the same columns don't share cached rows. Optional: `row__cache__timeout` and `row__cache__cache_alias`.
         :param bulk_filter: filters to apply to the `QuerySet` before performing the bulk operation
         :param bulk_exclude: exclude filters to apply to the `QuerySet` before performing the bulk operation
         :param sortable: set this to `False` to turn off sorting for all columns
+        :param infer_related: `select_related` and `prefetch_related` the relations that the `attr` of the rendered columns go through, for the rows of the current page. Default `True`.
         """
         super(Table, self).__init__(**kwargs)
 
@@ -1654,7 +2617,8 @@ def add_hidden_all_pks_field(declared_bulk_fields):
             )
 
         form_class = self.get_meta().form_class
-        if self.model:
+        # column.filter.include can be a callable here. We treat that as truthy on purpose.
+        if self.model or any(getattr(column.filter, 'include', None) for column in values(self.iommi_namespace.columns)) or query_args.get('filters'):
             # Query
             filters = Struct()
 
@@ -1700,6 +2664,7 @@ def add_hidden_all_pks_field(declared_bulk_fields):
             declared_filters = self.query.iommi_namespace.filters
             self.query = self.query.refine_defaults(filters=declared_filters)
 
+        if self.model:
             # Bulk
             field_class = self.get_meta().form_class.get_meta().member_class
 
@@ -1819,11 +2784,38 @@ def on_bind(self) -> None:
             self.initial_rows = self.initial_rows.all()
             self.rows = self.initial_rows
 
-        self._prepare_sorting()
+        # Sorting fewer rows is faster, so lists are filtered before they are sorted. For a QuerySet it doesn't matter.
+        # That leaves `sorted_rows` unsorted for a list, use `sorted_and_filtered_rows` for the sorted rows.
+        sort_after_filter = isinstance(self.initial_rows, list)
+        if sort_after_filter:
+            self.sorted_rows = self.initial_rows
+            self.rows = self.sorted_rows
+        else:
+            timed('sort', self, self._prepare_sorting)
+
+        # An ajax dispatch to the query or the bulk form (e.g. a choice lookup) only needs that part of the table
+        dispatch_target = self._dispatch_target_part()
+
+        if dispatch_target in (None, 'query'):
+            self._bind_query()
+        else:
+            self.query = None
+            self.sorted_and_filtered_rows = self.sorted_rows
+            self.rows = self.sorted_and_filtered_rows
 
-        self._bind_query()
-        self._bind_bulk_form()
-        self._bind_headers()
+        if sort_after_filter:
+            self.sorted_and_filtered_rows = timed('sort', self, self._sort_rows, self.sorted_and_filtered_rows)
+            self.rows = self.sorted_and_filtered_rows
+
+        if dispatch_target in (None, 'bulk'):
+            self._bind_bulk_form()
+        else:
+            self.bulk = None
+
+        if dispatch_target is None:
+            self._bind_headers()
+        else:
+            self.header_levels = []
 
         # If the column is not included, the down stream query filters and bulk fields should also be gone
         for name, column in items(self.iommi_namespace.columns):
@@ -1855,10 +2847,50 @@ def on_bind(self) -> None:
 
         self.bulk_container = self.bulk_container.bind(parent=self)
 
+    def _dispatch_target_part(self):
+        """
+        If the request is an ajax dispatch to the query or the bulk form of this table, return `'query'` or `'bulk'`.
+        """
+        long_path = get_dispatch_target_long_path(self)
+        if long_path is None:
+            return None
+        table_path = build_long_path(self)
+        if table_path:
+            if not long_path.startswith(table_path + '/'):
+                return None
+            long_path = long_path[len(table_path) + 1:]
+        name = long_path.split('/')[0]
+        return name if name in ('query', 'bulk') else None
+
     def get_visible_rows(self):
         self.visible_rows = self.parts.page.rows
         return self.visible_rows
 
+    def with_inferred_related(self, rows):
+        """
+        Apply the `select_related` and `prefetch_related` inferred from the `attr` of the rendered columns
+        to `rows`. This is called by the paginator with the rows of the current page.
+        """
+        if not self.infer_related or not isinstance(rows, QuerySet):
+            return rows
+        if rows._iterable_class is not ModelIterable or rows.query.combinator:
+            # Rows from values()/values_list() and combined querysets (like union) can't be select_related
+            return rows
+
+        paths = [
+            column.attr
+            for column in values(self.columns)
+            if column.render_column
+            and column.data_retrieval_method == DataRetrievalMethods.attribute_access
+            and isinstance(column.attr, str)
+        ]
+        select, prefetch = infer_related(rows.model, paths)
+        if select:
+            rows = rows.select_related(*select)
+        if prefetch:
+            rows = rows.prefetch_related(*prefetch)
+        return rows
+
     def _bind_query(self):
         """
         Bind the query form and apply it.
@@ -1941,19 +2973,20 @@ def auto_rowspan_style(row, **_):
                 if 'style' not in column.cell.attrs:
                     column.cell.attrs['style'] = {}
                 column.cell.attrs['style']['display'] = auto_rowspan_style
+                column.invalidate_cell_plan()
 
     def _prepare_sorting(self):
         """Sort all the rows.
 
         self.sorted_rows = sorted(self.initial_rows)
         """
-        # TODO: Sorting less values is faster then sorting more values, so we should
-        # filter first and then sort.
-        self.sorted_rows = self.initial_rows
+        self.sorted_rows = self._sort_rows(self.initial_rows)
         self.rows = self.sorted_rows
+
+    def _sort_rows(self, rows):
         request = self.get_request()
         if request is None:
-            return
+            return rows
 
         order = request.GET.get(path_join(self.iommi_path, 'order'), self.default_sort_order)
         if order is not None:
@@ -1961,19 +2994,20 @@ def _prepare_sorting(self):
             order_field = is_desc and order[1:] or order
             tmp = [x for x in values(self.columns) if x._name == order_field]
             if len(tmp) == 0:
-                return  # Unidentified sort column
+                return rows  # Unidentified sort column
             sort_column = tmp[0]
             order_args = evaluate_strict(sort_column.sort_key, column=sort_column)
             order_args = isinstance(order_args, list) and order_args or [order_args]
 
             if sort_column.sortable:
-                if isinstance(self.initial_rows, list):
-                    self.sorted_rows = ordered_by_on_list(self.initial_rows, order_args[0], is_desc)
-                    self.rows = self.sorted_rows
-                else:
+                # A QuerySet, or another row source that sorts itself like ColumnarRows
+                if hasattr(rows, 'order_by'):
                     order_args = ["%s%s" % (is_desc and '-' or '', x) for x in order_args]
-                    self.sorted_rows = self.initial_rows.order_by(*order_args)
-                    self.rows = self.sorted_rows
+                    return rows.order_by(*order_args)
+                else:
+                    return ordered_by_on_list(rows, order_args[0], is_desc)
+
+        return rows
 
     def _bind_headers(self):
         prepare_headers(self)
@@ -2025,10 +3059,16 @@ def _bind_headers(self):
     def own_evaluate_parameters(self):
         return dict(table=self)
 
-    def cells_for_rows(self):
-        """Yield a Cells instance for each visible row on the screen."""
+    def cells_for_rows(self, chunk_size=None):
+        """Yield a Cells instance for each visible row on the screen.
+
+        If `chunk_size` is given, QuerySets are iterated with a server side cursor fetching that many rows at a time,
+        instead of loading all the rows into memory at once.
+        """
         assert self._is_bound, NOT_BOUND_MESSAGE
         rows = self.preprocess_rows(rows=self.get_visible_rows(), **self.iommi_evaluate_parameters())
+        if chunk_size is not None and isinstance(rows, QuerySet):
+            rows = rows.iterator(chunk_size=chunk_size)
         for i, row in enumerate(rows):
             row = self.preprocess_row(table=self, row=row)
             assert row is not None, 'preprocess_row must return the object'
@@ -2111,5 +3151,8 @@ def __html__(self, *, template=None, render=None):
 
         return render(request=request, template=template or self.template, context=context)
 
-    def as_view(self):
-        return build_as_view_wrapper(self)
+    def as_view(self, stream=False):
+        return build_as_view_wrapper(self, stream=stream)
+
+    def as_async_view(self):
+        return build_async_as_view_wrapper(self)
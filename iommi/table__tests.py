@@ -1,10 +1,12 @@
 import json
+import pickle
 from collections import defaultdict
 from datetime import (
     date,
     datetime,
     time,
 )
+from unittest import mock
 
 import django
 import pytest
@@ -12,8 +14,12 @@
     F,
     QuerySet,
 )
+from django.db.models.functions import Lower
 from django.http import HttpResponse
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
 from tri_declarative import (
     class_shortcut,
     get_members,
@@ -57,12 +63,27 @@
     set_sql_debug,
     SQL_DEBUG_LEVEL_ALL,
 )
+from iommi.style import (
+    register_style,
+    Style,
+)
+from iommi.style_test_base import test
 from iommi.table import (
     bulk_delete__post_handler,
+    cached_count,
+    capped_count,
+    CappedCount,
     Column,
     datetime_formatter,
+    endpoint__csv_streaming,
+    estimated_count,
+    fragments_are_unstyled,
+    infer_related,
+    keyset__encode_cursor,
     ordered_by_on_list,
+    postgresql_row_count_estimate,
     register_cell_formatter,
+    register_row_count_estimator,
     Struct,
     Table,
     yes_no_formatter,
@@ -78,6 +99,7 @@
     BooleanFromModelTestModel,
     ChoicesModel,
     CSVExportTestModel,
+    Foo,
     FromModelWithInheritanceTest,
     QueryFromIndexesTestModel,
     SortKeyOnForeignKeyB,
@@ -2006,6 +2028,58 @@ class TestTable(Table):
     }
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'path, bound_query, bound_bulk',
+    [
+        ('/choices', True, False),
+        ('/parts/table/query/form/fields/foo/endpoints/choices', True, False),
+        ('/foo/choices', False, True),
+        ('/parts/table/bulk/fields/foo/endpoints/choices', False, True),
+    ],
+)
+def test_ajax_endpoint_only_binds_the_targeted_part(path, bound_query, bound_bulk):
+    f1 = TFoo.objects.create(a=17, b="Hej")
+    f2 = TFoo.objects.create(a=42, b="Hopp")
+
+    TBar(foo=f1, c=True).save()
+    TBar(foo=f2, c=False).save()
+
+    class TestTable(Table):
+        foo = Column.choice_queryset(
+            model=TFoo,
+            choices=lambda table, **_: TFoo.objects.all(),
+            filter__include=True,
+            bulk__include=True,
+        )
+
+    page = Page(parts__table=TestTable(rows=TBar.objects.all())).bind(request=req('get', **{path: 'hopp'}))
+    table = page.parts.table
+    assert (table.query is not None) == bound_query
+    assert (table.bulk is not None) == bound_bulk
+    assert table.header_levels == []
+
+    assert perform_ajax_dispatch(root=page, path=path, value='hopp') == {
+        'results': [
+            {'id': 2, 'text': 'Foo(42, Hopp)'},
+        ],
+        'pagination': {'more': False},
+        'page': 1,
+    }
+
+
+@pytest.mark.django_db
+def test_ajax_endpoint_of_the_table_binds_everything():
+    table = Table(
+        auto__model=TBar,
+        columns__foo__filter__include=True,
+        columns__foo__bulk__include=True,
+    ).bind(request=req('get', **{'/tbody': ''}))
+    assert table.query is not None
+    assert table.bulk is not None
+    assert table.header_levels != []
+
+
 @pytest.mark.django_db
 def test_ajax_endpoint_empty_response():
     class TestTable(Table):
@@ -2613,6 +2687,32 @@ def test_csv_download():
     )
 
 
+@pytest.mark.django_db
+def test_csv_download_streaming():
+    CSVExportTestModel.objects.create(a=1, b='a', c=2.3)
+    CSVExportTestModel.objects.create(a=2, b='b', c=5.0)
+    CSVExportTestModel.objects.create(a=3, b='c', c=7.0)
+    t = Table(
+        auto__model=CSVExportTestModel,
+        columns__a__extra_evaluated__report_name='A',
+        columns__b__extra_evaluated__report_name='B',
+        columns__c__extra_evaluated__report_name='C',
+        columns__danger__extra_evaluated__report_name='DANGER',
+        extra_evaluated__report_name='foo',
+        extra_evaluated__report_chunk_size=2,
+        endpoints__csv__func=endpoint__csv_streaming,
+    ).bind(request=req('get', **{'/csv': ''}))
+    response = t.render_to_response()
+    assert response.streaming
+    assert response['Content-Type'] == 'text/csv'
+    assert response['Content-Disposition'] == "attachment; filename*=UTF-8''foo.csv"
+    chunks = [x.decode() for x in response.streaming_content]
+    assert chunks == [
+        "A,B,C,DANGER\r\n1,a,2.3,\t=2+5+cmd|' /C calc'!A0\r\n",
+        "2,b,5.0,\t=2+5+cmd|' /C calc'!A0\r\n3,c,7.0,\t=2+5+cmd|' /C calc'!A0\r\n",
+    ]
+
+
 @pytest.mark.django_db
 def test_query_from_indexes():
     t = Table(
@@ -2702,6 +2802,542 @@ def test_paginator_clamping():
     assert t.bind(request=req('get', page='11')).paginator.page == 10
 
 
+@pytest.mark.django_db
+def test_paginator_keyset():
+    for i in range(7):
+        TFoo.objects.create(a=i // 2, b=str(i))
+
+    def bind(**params):
+        return Table(
+            auto__model=TFoo,
+            page_size=3,
+            parts__page__keyset=True,
+        ).bind(request=req('get', **params))
+
+    def visible(table):
+        return [x.b for x in table.get_visible_rows()]
+
+    with CaptureQueriesContext(connection) as queries:
+        t = bind(order='-a')
+        assert visible(t) == ['6', '4', '5']
+    assert not [q for q in queries.captured_queries if 'COUNT' in q['sql']]
+    assert t.paginator.has_next and not t.paginator.has_previous
+    assert t.paginator.is_paginated()
+
+    t = bind(order='-a', page=t.paginator.context['next'])
+    assert visible(t) == ['2', '3', '0']
+    assert t.paginator.has_next and t.paginator.has_previous
+
+    last = bind(order='-a', page=t.paginator.context['next'])
+    assert visible(last) == ['1']
+    assert not last.paginator.has_next and last.paginator.has_previous
+
+    t = bind(order='-a', page=last.paginator.context['previous'])
+    assert visible(t) == ['2', '3', '0']
+    assert t.paginator.has_next and t.paginator.has_previous
+
+    t = bind(order='-a', page=t.paginator.context['previous'])
+    assert visible(t) == ['6', '4', '5']
+    assert t.paginator.has_next and not t.paginator.has_previous
+
+    # Garbage cursors give the first page
+    assert visible(bind(order='-a', page='garbage')) == ['6', '4', '5']
+    assert visible(bind(order='-a', page=keyset__encode_cursor('next', ['abc', 'abc']))) == ['6', '4', '5']
+    assert visible(bind(order='-a', page=keyset__encode_cursor('next', [{'x': 1}, 1]))) == ['6', '4', '5']
+    assert visible(bind(order='-a', page=keyset__encode_cursor('next', [1, None]))) == ['6', '4', '5']
+    assert visible(bind(order='-a', page=keyset__encode_cursor('next', [1]))) == ['6', '4', '5']
+    # Values of the wrong type that can be converted are
+    assert visible(bind(order='-a', page=keyset__encode_cursor('next', ['2', '6']))) == ['2', '3', '0']
+
+
+@pytest.mark.django_db
+def test_paginator_keyset_falls_back_to_page_numbers():
+    for i in range(3):
+        CSVExportTestModel.objects.create(a=i, b='x', c=1.0, d=None if i == 1 else i)
+        TBar.objects.create(foo=TFoo.objects.create(a=i, b=str(i)), c=False)
+
+    def bind(model, **params):
+        return Table(
+            auto__model=model,
+            page_size=2,
+            parts__page__keyset=True,
+        ).bind(request=req('get', **params))
+
+    # Nullable sort columns
+    t = bind(CSVExportTestModel, order='d')
+    assert t.paginator.page == 1
+    assert t.paginator.number_of_pages == 2
+    assert [x.a for x in t.get_visible_rows()] == [1, 0]
+    assert [x.a for x in bind(CSVExportTestModel, order='a').get_visible_rows()] == [0, 1]
+    assert bind(CSVExportTestModel, order='a').paginator.page is None
+
+    # Paths through foreign keys are fine
+    t = bind(TBar, order='foo')
+    assert t.paginator.page is None
+    t = bind(TBar, order='foo', page=t.paginator.context['next'])
+    assert [x.foo.a for x in t.get_visible_rows()] == [2]
+
+    def bind_rows(rows):
+        return Table(
+            auto__model=TFoo,
+            rows=rows,
+            page_size=2,
+            parts__page__keyset=True,
+        ).bind(request=req('get'))
+
+    # Reversed querysets and expressions
+    for rows in [
+        TFoo.objects.order_by('a').reverse(),
+        TFoo.objects.order_by(F('a').desc()),
+        TFoo.objects.order_by(Lower('b').desc()),
+        TFoo.objects.order_by('?'),
+    ]:
+        t = bind_rows(rows)
+        assert t.paginator.page == 1
+        assert t.paginator.number_of_pages == 2
+
+    # Ordering on a relation is by the ordering of the related model, not by the pk in the cursor
+    t = Table(
+        auto__model=TBar,
+        rows=TBar.objects.order_by('-foo'),
+        page_size=2,
+        parts__page__keyset=True,
+    ).bind(request=req('get'))
+    assert t.paginator.page == 1
+    assert [x.foo.a for x in t.get_visible_rows()] == [2, 1]
+
+
+@pytest.mark.django_db
+def test_paginator_keyset_rendered():
+    for i in range(3):
+        TFoo.objects.create(a=i, b=str(i))
+
+    t = Table(
+        auto__model=TFoo,
+        page_size=2,
+        parts__page__keyset=True,
+    ).bind(request=req('get'))
+    next_cursor = t.paginator.context['next']
+    content = t.paginator.__html__()
+    assert f'href="?page={next_cursor}" aria-label="Next Page"' in content
+    assert 'aria-label="Page 1"' not in content
+    assert 'aria-label="Previous Page"' not in content
+
+
+@pytest.mark.django_db
+def test_paginator_window_count():
+    for i in range(7):
+        TFoo.objects.create(a=i, b=str(i))
+
+    def bind(rows=TFoo.objects.all(), page='1', **kwargs):
+        queries = []
+
+        def collect(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(collect):
+            t = Table(
+                auto__model=TFoo,
+                rows=rows,
+                page_size=3,
+                parts__page__window_count=True,
+                **kwargs
+            ).bind(request=req('get', page=page))
+            rows = [x.a for x in t.paginator.rows]
+        return t, rows, queries
+
+    t, rows, queries = bind(page='2')
+    assert rows == [3, 4, 5]
+    assert t.paginator.count == 7
+    assert t.paginator.number_of_pages == 3
+    assert len(queries) == 1
+    assert 'COUNT(*) OVER ()' in queries[0]
+
+    # The last page gets the rows that would make a page smaller than min_page_size
+    t, rows, queries = bind(page='2', parts__page__min_page_size=2)
+    assert rows == [3, 4, 5, 6]
+    assert len(queries) == 1
+
+    # After the last page, the count is used and the last page is fetched
+    t, rows, queries = bind(page='7')
+    assert rows == [6]
+    assert t.paginator.page == 3
+    assert len(queries) == 3
+
+    t, rows, queries = bind(rows=TFoo.objects.filter(a__gt=10))
+    assert rows == []
+    assert t.paginator.count == 0
+    assert len(queries) == 1
+
+    t, rows, queries = bind(rows=TFoo.objects.distinct())
+    assert rows == [0, 1, 2]
+    assert not any('OVER' in q for q in queries)
+
+
+@pytest.mark.django_db
+def test_paginator_window_count_page_after_last_with_min_page_size():
+    for i in range(4):
+        TFoo.objects.create(a=i, b=str(i))
+
+    t = Table(
+        auto__model=TFoo,
+        page_size=3,
+        parts__page__window_count=True,
+        parts__page__min_page_size=2,
+    ).bind(request=req('get', page='2'))
+    assert t.paginator.number_of_pages == 1
+    assert t.paginator.page == 1
+    assert [x.a for x in t.paginator.rows] == [0, 1, 2, 3]
+
+
+@pytest.mark.django_db
+def test_paginator_capped_count():
+    for i in range(10):
+        TFoo.objects.create(a=i, b=str(i))
+
+    t = Table(auto__model=TFoo, page_size=2, parts__page__count=capped_count(limit=5)).bind(request=req('get'))
+    assert isinstance(t.paginator.count, CappedCount)
+    assert str(t.paginator.count) == '5+'
+    assert t.paginator.number_of_pages == 3
+    assert t.paginator.context['show_last'] is False
+    assert [x.a for x in t.paginator.rows] == [0, 1]
+
+    # The limit is raised so that the requested page can be reached
+    t = Table(auto__model=TFoo, page_size=2, parts__page__count=capped_count(limit=5)).bind(request=req('get', page='4'))
+    assert str(t.paginator.count) == '8+'
+    assert t.paginator.page == 4
+    assert t.paginator.context['has_next'] is True
+    assert [x.a for x in t.paginator.rows] == [6, 7]
+
+    t = Table(auto__model=TFoo, page_size=2, parts__page__count=capped_count(limit=20)).bind(request=req('get'))
+    assert t.paginator.count == 10
+    assert not isinstance(t.paginator.count, CappedCount)
+
+    assert pickle.loads(pickle.dumps(CappedCount(5))) == CappedCount(5)
+    assert str(pickle.loads(pickle.dumps(CappedCount(5)))) == '5+'
+
+
+@pytest.mark.django_db
+def test_paginator_estimated_count():
+    for i in range(4):
+        TFoo.objects.create(a=i, b=str(i))
+
+    def table(rows=None, **kwargs):
+        if rows is None:
+            rows = TFoo.objects.all()
+        return Table(auto__model=TFoo, rows=rows, page_size=2, parts__page__count=estimated_count(**kwargs))
+
+    # No estimator registered for sqlite, so this is an exact count
+    assert table().bind(request=req('get')).paginator.count == 4
+
+    estimated = []
+
+    def estimator(rows):
+        estimated.append(rows)
+        return 100000
+
+    with register_row_count_estimator('sqlite', estimator):
+        assert table().bind(request=req('get')).paginator.count == 100000
+        assert table(threshold=200000).bind(request=req('get')).paginator.count == 4
+
+        filtered = table(rows=TFoo.objects.filter(a__gt=1))
+        assert filtered.bind(request=req('get')).paginator.count == 2
+        assert filtered.bind(request=req('get')).paginator.count == 2
+        assert len(estimated) == 2
+
+        assert table(rows=TFoo.objects.filter(a__gt=1), filtered=True).bind(request=req('get')).paginator.count == 100000
+        assert len(estimated) == 3
+
+    assert table().bind(request=req('get')).paginator.count == 4
+
+    # Rows that Django knows are empty without a query
+    for rows in [TFoo.objects.none(), TFoo.objects.filter(a__in=[])]:
+        assert postgresql_row_count_estimate(rows) == 0
+        with register_row_count_estimator('sqlite', postgresql_row_count_estimate):
+            assert table(rows=rows, filtered=True).bind(request=req('get')).paginator.count == 0
+
+
+@pytest.mark.django_db
+def test_paginator_cached_count():
+    from django.core.cache import cache
+
+    # The cache expiry does not work with the time frozen in 1948
+    with freeze_time('2020-01-01'):
+        cache.clear()
+
+        for i in range(4):
+            TFoo.objects.create(a=i, b=str(i))
+
+        def count(rows, **_):
+            counted.append(rows)
+            return rows.count()
+
+        counted = []
+        t = Table(auto__model=TFoo, page_size=2, parts__page__count=cached_count(count=count))
+        assert t.bind(request=req('get')).paginator.count == 4
+        TFoo.objects.create(a=4, b='4')
+        assert t.bind(request=req('get')).paginator.count == 4
+        # The ordering is not part of the cache key
+        assert t.bind(request=req('get', order='-a')).paginator.count == 4
+        assert len(counted) == 1
+
+        t2 = Table(auto__model=TFoo, rows=TFoo.objects.filter(a=1), page_size=2, parts__page__count=cached_count(count=count))
+        assert t2.bind(request=req('get')).paginator.count == 1
+        assert len(counted) == 2
+
+        cache.clear()
+        assert t.bind(request=req('get')).paginator.count == 5
+
+        # Rows that Django knows are empty without a query
+        for rows in [TFoo.objects.none(), TFoo.objects.filter(a__in=[])]:
+            t3 = Table(auto__model=TFoo, rows=rows, page_size=2, parts__page__count=cached_count(count=count))
+            assert t3.bind(request=req('get')).paginator.count == 0
+
+
+@pytest.mark.django_db
+def test_paginator_snapshot():
+    from django.core.cache import cache
+
+    # The cache expiry does not work with the time frozen in 1948
+    with freeze_time('2020-01-01'):
+        cache.clear()
+
+        for i in range(8):
+            TFoo.objects.create(a=i, b=str(i))
+
+        table = Table(
+            auto__model=TFoo,
+            page_size=3,
+            columns__a__filter__include=True,
+            parts__page__snapshot=True,
+        ).refine_done()
+
+        def bind(**params):
+            queries = []
+
+            def collect(execute, sql, params, many, context):
+                queries.append(sql)
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(collect):
+                t = table.bind(request=req('get', **{'-query/query': 'a<7', 'order': '-a', **params}))
+                rows = [x.a for x in t.paginator.rows]
+            return t, rows, queries
+
+        t, rows, queries = bind()
+        assert rows == [6, 5, 4]
+        assert t.paginator.count == 7
+        assert len(queries) == 2
+        assert not any('COUNT' in q for q in queries)
+        token = t.paginator.snapshot_token
+        assert token
+        assert f'page_snapshot={token}' in t.paginator.context['extra']
+
+        # The next page doesn't run the filtered query
+        TFoo.objects.filter(a=2).delete()
+        t, rows, queries = bind(page='2', page_snapshot=token)
+        assert rows == [3, 1]
+        assert t.paginator.count == 7
+        assert t.paginator.snapshot_token == token
+        assert len(queries) == 1
+        assert '"tests_tfoo"."a" <' not in queries[0]
+
+        # A different query makes a new snapshot
+        t, rows, queries = bind(page='2', page_snapshot=token, order='a')
+        assert rows == [4, 5, 6]
+        assert t.paginator.snapshot_token != token
+
+        # So does an expired snapshot
+        cache.clear()
+        t, rows, queries = bind(page='2', page_snapshot=token)
+        assert rows == [3, 1, 0]
+        assert t.paginator.count == 6
+        assert t.paginator.snapshot_token != token
+
+        # Too many rows to snapshot
+        too_large_table = Table(
+            auto__model=TFoo,
+            page_size=3,
+            parts__page__snapshot__max_size=5,
+        ).refine_done()
+        for expected_queries in [3, 2]:
+            queries = []
+
+            def collect(execute, sql, params, many, context):
+                queries.append(sql)
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(collect):
+                t = too_large_table.bind(request=req('get', page_snapshot=token))
+                assert [x.a for x in t.paginator.rows] == [0, 1, 3]
+            assert t.paginator.snapshot_token is None
+            assert 'page_snapshot' not in t.paginator.context['extra']
+            # The next request remembers that there are too many rows, and only runs the count and the page
+            assert len(queries) == expected_queries
+
+        # Rows that Django knows are empty without a query have no snapshot
+        for rows in [TFoo.objects.none(), TFoo.objects.filter(a__in=[])]:
+            t = Table(
+                auto__model=TFoo,
+                rows=rows,
+                page_size=3,
+                parts__page__snapshot=True,
+            ).bind(request=req('get', page_snapshot=token))
+            assert t.paginator.rows == []
+            assert t.paginator.count == 0
+            assert t.paginator.snapshot_token is None
+            assert '<tbody>' in t.__html__()
+
+    with pytest.raises(AssertionError) as e:
+        Table(auto__model=TFoo, parts__page__snapshot__foo=1).bind(request=req('get'))
+    assert str(e.value) == 'Unknown snapshot parameters: foo'
+
+
+def test_row_cache():
+    from django.core.cache import caches
+
+    cache = caches['default']
+    rows = [Struct(pk=1, a='foo', version=1), Struct(pk=2, a='bar', version=1)]
+
+    def a_value(row, **_):
+        evaluated.append(row.pk)
+        return row.a
+
+    # The cache expiry does not work with the time frozen in 1948
+    with freeze_time('2020-01-01'):
+        cache.clear()
+        evaluated = []
+
+        t = Table(
+            rows=rows,
+            columns__a__cell__value=a_value,
+            row__cache__key=lambda row, **_: (row.pk, row.version),
+            row__cache__prefix='test',
+        )
+        first = t.bind(request=req('get')).__html__()
+        assert 'foo' in first
+        assert evaluated == [1, 2]
+
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as get_many, mock.patch.object(
+            cache, 'set_many', wraps=cache.set_many
+        ) as set_many:
+            assert t.bind(request=req('get')).__html__() == first
+            assert evaluated == [1, 2]
+            assert get_many.call_count == 1
+            assert set_many.call_count == 0
+
+            # A row with a new key is rendered again, the other one is taken from the cache
+            rows[0].a = 'baz'
+            rows[0].version = 2
+            assert 'baz' in t.bind(request=req('get')).__html__()
+            assert evaluated == [1, 2, 1]
+            assert get_many.call_count == 2
+            assert set_many.call_count == 1
+
+        # The rendered columns are part of the key
+        Table(
+            rows=rows,
+            columns__a__cell__value=a_value,
+            columns__b__cell__value='b',
+            row__cache__key=lambda row, **_: (row.pk, row.version),
+            row__cache__prefix='test',
+        ).bind(request=req('get')).__html__()
+        assert evaluated == [1, 2, 1, 1, 2]
+
+        # So are the prefix and the class of the table
+        Table(
+            rows=rows,
+            columns__a__cell__value=a_value,
+            row__cache__key=lambda row, **_: (row.pk, row.version),
+            row__cache__prefix='other',
+        ).bind(request=req('get')).__html__()
+        assert evaluated == [1, 2, 1, 1, 2, 1, 2]
+
+        class MyTable(Table):
+            pass
+
+        MyTable(
+            rows=rows,
+            columns__a__cell__value=a_value,
+            row__cache__key=lambda row, **_: (row.pk, row.version),
+            row__cache__prefix='test',
+        ).bind(request=req('get')).__html__()
+        assert evaluated == [1, 2, 1, 1, 2, 1, 2, 1, 2]
+
+
+def test_row_cache_needs_a_key_and_a_prefix():
+    with pytest.raises(AssertionError, match='row__cache needs a key'):
+        Table(rows=[], row__cache__timeout=10).refine_done()
+
+    with pytest.raises(AssertionError, match='row__cache needs a prefix'):
+        Table(rows=[], row__cache__key=lambda row, **_: row.pk).refine_done()
+
+
+def test_infer_related():
+    assert infer_related(TBar2, ['bar__foo__a', 'bar__c', 'bar_id', 'pk', 'bar__foo__b__upper']) == (['bar__foo'], [])
+    assert infer_related(TBaz, ['foo']) == ([], ['foo'])
+    assert infer_related(Foo, ['bars__foo__foo']) == ([], ['bars__foo'])
+    assert infer_related(TBar, ['foo', 'does_not_exist__foo']) == (['foo'], [])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('infer, expected_number_of_queries', [(True, 2), (False, 5)])
+def test_infer_related_on_page_rows(infer, expected_number_of_queries):
+    for i in range(3):
+        TBar2.objects.create(bar=TBar.objects.create(foo=TFoo.objects.create(a=i, b=str(i)), c=False))
+
+    t = Table(
+        auto__model=TBar2,
+        columns__foo=Column(attr='bar__foo__a'),
+        infer_related=infer,
+    )
+    queries = []
+
+    def log_query(execute, sql, *args):
+        queries.append(sql)
+        return execute(sql, *args)
+
+    with connection.execute_wrapper(log_query):
+        t.bind(request=req('get')).__html__()
+    assert len(queries) == expected_number_of_queries
+    # The count query is not joined
+    assert 'COUNT' in queries[0] and 'JOIN' not in queries[0]
+
+
+@pytest.mark.django_db
+def test_infer_related_skips_values_and_combined_querysets():
+    TBar.objects.create(foo=TFoo.objects.create(a=17, b='17'), c=False)
+
+    t = Table(
+        rows=TBar.objects.values('foo__a', 'c'),
+        columns__foo_a=Column(attr='foo__a', cell__value=lambda row, **_: row['foo__a']),
+    ).bind(request=req('get'))
+    assert [row['foo__a'] for row in t.get_visible_rows()] == [17]
+    assert '<td>17</td>' in t.__html__()
+
+    t = Table(
+        auto__model=TBar,
+        rows=TBar.objects.filter(c=True).order_by().union(TBar.objects.filter(c=False).order_by()),
+        columns__foo=Column(attr='foo__a'),
+    ).bind(request=req('get'))
+    assert '<td>17</td>' in t.__html__()
+
+
+@pytest.mark.django_db
+def test_warn_about_queries_per_row_in_debug():
+    TBar2.objects.create(bar=TBar.objects.create(foo=TFoo.objects.create(a=1, b='1'), c=False))
+
+    t = Table(
+        auto__model=TBar2,
+        columns__foo=Column(attr='bar__foo__a'),
+        infer_related=False,
+    )
+    with override_settings(IOMMI_DEBUG=True):
+        with pytest.warns(UserWarning, match='Rendering 1 rows of the table .* ran 1 queries'):
+            t.bind(request=req('get')).__html__()
+
+
 @pytest.mark.django_db
 def test_reinvoke():
     class MyTable(Table):
@@ -2766,6 +3402,74 @@ class MyTable(Table):
     assert repr(t.header_levels[0][0]) == '<Header: foo>'
 
 
+def test_cell_plan_is_shared_by_all_cells_of_a_column():
+    evaluated_rows = []
+
+    def value(row, **_):
+        evaluated_rows.append(row)
+        return row * 2
+
+    t = Table(
+        columns__foo=Column(cell__value=value, cell__attrs__class__bar=True),
+        rows=[1, 2, 3],
+    ).bind(request=req('get'))
+
+    all_cells = [list(cells) for cells in t.cells_for_rows()]
+    assert evaluated_rows == [1, 2, 3]
+    assert [cells[0].value for cells in all_cells] == [2, 4, 6]
+    assert all_cells[0][0]._plan is all_cells[2][0]._plan
+    # Constant attrs are only evaluated once per column, but each cell gets its own copy
+    assert all_cells[0][0]._plan.evaluated_attrs == all_cells[2][0].attrs
+    assert all_cells[0][0].attrs is not all_cells[2][0].attrs
+    all_cells[0][0].attrs['class']['baz'] = True
+    all_cells[0][0].attrs.style['color'] = 'red'
+    all_cells[0][0].attrs['title'] = 'first'
+    assert str(all_cells[0][0].attrs) == ' class="bar baz" style="color: red" title="first"'
+    assert str(all_cells[2][0].attrs) == ' class="bar"'
+    assert str(all_cells[0][0]._plan.evaluated_attrs) == ' class="bar"'
+
+
+def test_cell_plan_invalid_config():
+    t = Table(
+        columns__foo=Column(cell__not_a_thing=True),
+        rows=[1],
+    ).bind(request=req('get'))
+
+    with pytest.raises(TypeError) as e:
+        list(next(t.cells_for_rows()))
+
+    assert 'Cell object has no refinable attribute(s): "not_a_thing"' in str(e.value)
+
+
+def test_rows_render_the_same_without_fragments():
+    def table(**kwargs):
+        return Table(
+            columns__a=Column(cell__url=lambda row, **_: f'/{row.a}/', cell__url_title='a & b'),
+            columns__b=Column(cell__url='/b/', cell__link__attrs__class__custom=True, cell__link__attrs__style__color='red'),
+            columns__d=Column(cell__url='/d/', cell__format=lambda value, **_: mark_safe(f'<b>{value}</b>')),
+            row__attrs__class__odd=lambda row, **_: row.a % 2,
+            row__attrs__title=lambda row, **_: f'<{row.a}>',
+            rows=[Struct(a=i, b='<b>', d=i) for i in range(3)],
+            **kwargs
+        ).bind(request=req('get'))
+
+    fast = table()
+    assert fragments_are_unstyled(fast)
+
+    # A style with config for Fragment makes the rows and links render as Fragments
+    with register_style('test_rows_with_fragments', Style(test, Fragment__attrs__class__styled=False)):
+        slow = table(iommi_style='test_rows_with_fragments')
+        assert not fragments_are_unstyled(slow)
+        expected = slow.tbody.__html__()
+
+    actual = fast.tbody.__html__()
+    assert actual == expected
+    assert '<tr class="odd" title="<1>">' in actual
+    assert '<a href="/0/" title="a & b">0</a>' in actual
+    assert '<a class="custom" href="/b/" style="color: red">&lt;b&gt;</a>' in actual
+    assert '<a href="/d/"><b>2</b></a>' in actual
+
+
 @pytest.mark.django_db
 def test_automatic_url():
     foo = AutomaticUrl.objects.create(a=7)
@@ -3154,6 +3858,26 @@ class TestTable(Table):
     )
 
 
+def test_sort_rows_that_are_not_a_list():
+    rows = [
+        Struct(foo='b', bar=2),
+        Struct(foo='c', bar=3),
+        Struct(foo='a', bar=1),
+    ]
+
+    t = Table(rows=tuple(rows), columns__foo=dict()).bind(request=req('get', order='foo'))
+    assert [row.foo for row in t.sorted_and_filtered_rows] == ['a', 'b', 'c']
+
+    t = Table(
+        rows=rows,
+        columns__foo__filter__include=True,
+        query__filter=lambda rows, **_: (row for row in rows if row.bar > 1),
+    ).bind(request=req('get', order='-foo'))
+    assert [row.foo for row in t.sorted_and_filtered_rows] == ['c', 'b']
+    # A list is filtered before it is sorted, so sorted_rows is the rows in their original order
+    assert t.sorted_rows == rows
+
+
 @pytest.mark.django_db
 def test_sort_django_table():
 
@@ -3247,6 +3971,32 @@ def test_order_by_on_list_nested():
     assert sorted_rows == list(reversed(rows))
 
 
+def test_query_on_list():
+    rows = [Struct(a=i, b=name) for i, name in enumerate(['foo', 'bar', 'Food', 'baz'])]
+    table = Table(
+        rows=rows,
+        columns__a=Column.integer(filter__include=True),
+        columns__b=Column(filter__include=True, filter__freetext=True),
+    )
+
+    t = table.bind(request=req('get', freetext_search='fo', order='-a'))
+    assert t.sorted_and_filtered_rows == [rows[2], rows[0]]
+
+    with mock.patch('iommi.table.ordered_by_on_list', side_effect=ordered_by_on_list) as m:
+        t = table.bind(request=req('get', **{'-query/query': 'a>1 or b="foo"', 'order': 'b'}))
+        assert t.sorted_and_filtered_rows == [rows[2], rows[3], rows[0]]
+    # Only the filtered rows are sorted
+    assert len(m.call_args[0][0]) == 3
+
+    t = table.bind(request=req('get', **{'-query/query': 'not_a_filter=1'}))
+    assert t.sorted_and_filtered_rows == rows
+    assert 'Unknown filter "not_a_filter"' in t.query.query_error
+
+
+def test_no_query_on_list_without_filters():
+    assert Table(rows=[1, 2], columns__a=Column()).bind(request=req('get')).query is None
+
+
 def test_sort_default_desc_no_sort():
     class TestTable(Table):
         foo = Column()
@@ -3668,3 +4418,49 @@ def test_auto_rowspan_twice():
     table = Table(rows=[Struct(a=1), Struct(a=1)], columns__a__auto_rowspan=True).refine_done()
     table.bind(request=req('get')).__html__()
     table.bind(request=req('get')).__html__()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('number_of_rows, number_of_row_chunks', [(0, 0), (1, 1), (250, 3)])
+def test_streaming(number_of_rows, number_of_row_chunks):
+    TFoo.objects.bulk_create(TFoo(a=i, b=str(i)) for i in range(number_of_rows))
+    table = Table(auto__model=TFoo, page_size=None).refine_done()
+
+    expected = table.bind(request=req('get')).render_to_response().content
+
+    response = table.bind(request=req('get')).render_to_response(stream=True)
+    assert response.streaming
+    chunks = list(response.streaming_content)
+    assert b''.join(chunks) == expected
+    # The base template up to the content, the table up to the rows, the rows, the rest of the table and the rest of the base template
+    assert len(chunks) == 2 + number_of_row_chunks + 2
+
+    response = table.as_view(stream=True)(req('get'))
+    assert b''.join(response.streaming_content) == expected
+
+
+def test_streaming_page():
+    page = Page(
+        parts=dict(
+            foo=Table(rows=[Struct(a=1)], columns__a=dict()),
+            bar=Table(rows=[Struct(a=2)], columns__a=dict()),
+        ),
+    ).refine_done()
+    expected = page.bind(request=req('get')).render_to_response().content
+    response = page.as_view(stream=True)(req('get'))
+    assert b''.join(response.streaming_content) == expected
+
+
+@pytest.mark.parametrize('template', [
+    dict(tbody__template=''),
+    dict(template='{{ table.container }}{{ table.container }}'),
+])
+def test_streaming_rows_not_rendered_once(template):
+    table = Table(
+        rows=[Struct(a=1)],
+        columns__a=dict(),
+        **{k: Template(v) for k, v in template.items()},
+    ).refine_done()
+    expected = table.bind(request=req('get')).render_to_response().content
+    response = table.as_view(stream=True)(req('get'))
+    assert b''.join(response.streaming_content) == expected
@@ -0,0 +1,238 @@
+"""
+Timing of the phases of an iommi request: bind, on_bind, dispatch, sorting,
+the paginator count, building the query, SQL execution and rendering, per
+part path.
+
+Add `'iommi.timing.Middleware'` to `settings.MIDDLEWARE` to time requests.
+The timings are emitted in a `Server-Timing` header (in debug mode or for
+staff), available as a tree in `request.iommi_timing`, and passed to the
+hooks registered with `register_timing_hook`. When the middleware is not
+timing the current request, the instrumented code paths only do a thread
+local lookup.
+"""
+import threading
+from contextlib import (
+    contextmanager,
+    ExitStack,
+)
+from time import perf_counter
+
+from django.db import connections
+
+from ._web_compat import settings
+
+
+class _State(threading.local):
+    timing = None
+
+
+_state = _State()
+
+_timing_hooks = []
+
+
+class Span:
+    __slots__ = ('kind', 'node', 'path', 'start', 'duration', 'children')
+
+    def __init__(self, kind, node=None, path=None):
+        self.kind = kind
+        self.node = node
+        self.path = path
+        self.start = perf_counter()
+        self.duration = None
+        self.children = []
+
+    def __repr__(self):
+        return f'<Span {self.kind} {self.path!r} {self.duration}>'
+
+
+class Timing:
+    """
+    The timing tree of a request. The root span is the whole request.
+    """
+
+    def __init__(self):
+        self.root = Span('total', path='')
+        self.stack = [self.root]
+
+    def start(self, kind, node=None):
+        span = Span(kind, node=node)
+        self.stack[-1].children.append(span)
+        self.stack.append(span)
+        return span
+
+    def finish(self, span):
+        span.duration = perf_counter() - span.start
+        popped = self.stack.pop()
+        assert popped is span, 'Spans must be finished in the reverse order they were started'
+        if span.path is None and span.node is not None:
+            span.path = _path_of(span.node)
+        span.node = None
+
+    def spans(self):
+        """
+        All spans depth first, as `(span, depth)` tuples.
+        """
+        todo = [(self.root, 0)]
+        while todo:
+            span, depth = todo.pop()
+            yield span, depth
+            todo.extend((child, depth + 1) for child in reversed(span.children))
+
+    def totals(self):
+        """
+        The total duration in seconds per kind of span. Spans nested in a
+        span of the same kind (like the bind of a table in a page) are not
+        counted twice.
+        """
+        result = {}
+
+        def _traverse(span, kinds):
+            if span.kind not in kinds:
+                result[span.kind] = result.get(span.kind, 0) + (span.duration or 0)
+                kinds = kinds | {span.kind}
+            for child in span.children:
+                _traverse(child, kinds)
+
+        _traverse(self.root, frozenset())
+        return result
+
+    def server_timing_header(self):
+        return ', '.join(f'{kind};dur={duration * 1000:.2f}' for kind, duration in self.totals().items())
+
+
+def _path_of(node):
+    if not getattr(node, '_is_bound', False):
+        return None
+    names = []
+    while node.iommi_parent() is not None:
+        name = node.iommi_name()
+        if name is None:
+            # Not placed in the tree, like the fragments that are created while rendering
+            return None
+        names.append(name)
+        node = node.iommi_parent()
+    return '/'.join(reversed(names)) or node.iommi_name()
+
+
+def get_timing():
+    """
+    The `Timing` of the current request, or `None` if it isn't timed.
+    """
+    return _state.timing
+
+
+def timed(kind, node, f, *args, **kwargs):
+    """
+    Call `f(*args, **kwargs)` and time it as a span of `kind` for `node` if
+    the current request is timed.
+    """
+    timing = _state.timing
+    if timing is None:
+        return f(*args, **kwargs)
+
+    span = timing.start(kind, node)
+    try:
+        return f(*args, **kwargs)
+    finally:
+        timing.finish(span)
+
+
+@contextmanager
+def timing_span(kind, node=None):
+    """
+    Context manager version of `timed`. Yields the span, or `None` if the
+    current request isn't timed.
+    """
+    timing = _state.timing
+    if timing is None:
+        yield None
+        return
+
+    span = timing.start(kind, node)
+    try:
+        yield span
+    finally:
+        timing.finish(span)
+
+
+def current_span():
+    """
+    The innermost span of this thread, or `None` if the current request
+    isn't timed.
+    """
+    timing = _state.timing
+    return None if timing is None else timing.stack[-1]
+
+
+@contextmanager
+def timing_in_thread(parent):
+    """
+    Time the code run in another thread, like a worker of a thread pool, as
+    children of `parent`, a span from `current_span()` in the thread of the
+    request. The spans are added to `parent` when the block exits.
+    """
+    if parent is None:
+        yield
+        return
+
+    timing = Timing()
+    previous = _state.timing
+    _state.timing = timing
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_time_sql))
+            yield
+    finally:
+        _state.timing = previous
+        parent.children.extend(timing.root.children)
+
+
+def register_timing_hook(hook):
+    """
+    Register a function that is called with `request` and `timing` (a
+    `Timing`) at the end of each timed request, for example to forward the
+    spans to an APM. Returns a context manager that unregisters the hook
+    again.
+    """
+    _timing_hooks.append(hook)
+
+    @contextmanager
+    def _unregister():
+        try:
+            yield hook
+        finally:
+            _timing_hooks.remove(hook)
+    return _unregister()
+
+
+def _time_sql(execute, sql, params, many, context):
+    return timed('sql', None, execute, sql, params, many, context)
+
+
+class Middleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timing = Timing()
+        request.iommi_timing = timing
+        previous = _state.timing
+        _state.timing = timing
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_time_sql))
+                response = self.get_response(request)
+        finally:
+            _state.timing = previous
+            timing.root.duration = perf_counter() - timing.root.start
+
+        if settings.DEBUG or getattr(getattr(request, 'user', None), 'is_staff', False):
+            response['Server-Timing'] = timing.server_timing_header()
+
+        for hook in _timing_hooks:
+            hook(request=request, timing=timing)
+
+        return response
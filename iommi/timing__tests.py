@@ -0,0 +1,81 @@
+import pytest
+
+from iommi import (
+    Page,
+    Table,
+)
+from iommi.timing import (
+    get_timing,
+    Middleware,
+    register_timing_hook,
+    timed,
+    Timing,
+)
+from tests.helpers import (
+    req,
+    staff_req,
+)
+from tests.models import TFoo
+
+
+def view(request):
+    return Page(
+        parts__foo=Table(
+            auto__model=TFoo,
+            columns__a__filter__include=True,
+        ),
+    ).bind(request=request).render_to_response()
+
+
+@pytest.mark.django_db
+def test_timing_middleware():
+    TFoo.objects.create(a=1, b='foo')
+
+    hook_calls = []
+    with register_timing_hook(lambda request, timing: hook_calls.append((request, timing))):
+        request = staff_req('get', a='1')
+        response = Middleware(view)(request)
+
+    assert get_timing() is None
+    timing = request.iommi_timing
+    assert hook_calls == [(request, timing)]
+
+    spans = [(span.kind, span.path) for span, _ in timing.spans()]
+    assert spans[:3] == [('total', ''), ('bind', 'root'), ('on_bind', 'root')]
+    assert ('bind', 'parts/foo') in spans
+    assert ('on_bind', 'parts/foo') in spans
+    assert ('sort', 'parts/foo') in spans
+    assert ('get_q', 'parts/foo/query') in spans
+    assert ('count', 'parts/foo/parts/page') in spans
+    assert ('sql', None) in spans
+    assert ('render', 'root') in spans
+    assert ('render_root', 'root') in spans
+    assert all(span.duration is not None for span, _ in timing.spans())
+
+    header = response['Server-Timing']
+    assert [x.split(';')[0] for x in header.split(', ')] == list(timing.totals())
+    assert header.startswith('total;dur=')
+    for kind in ['bind', 'on_bind', 'sort', 'get_q', 'count', 'sql', 'render', 'render_root']:
+        assert f'{kind};dur=' in header
+
+
+@pytest.mark.django_db
+def test_timing_header_only_for_staff_or_debug():
+    response = Middleware(view)(req('get'))
+    assert 'Server-Timing' not in response
+
+
+def test_timing_totals_do_not_count_nested_spans_twice():
+    timing = Timing()
+    outer = timing.start('bind')
+    inner = timing.start('bind')
+    timing.finish(inner)
+    timing.finish(outer)
+    timing.root.duration = 1
+
+    assert timing.totals() == dict(total=1, bind=outer.duration)
+
+
+def test_timed_without_timing():
+    assert get_timing() is None
+    assert timed('foo', None, lambda x: x * 2, 3) == 6
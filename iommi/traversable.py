@@ -20,6 +20,7 @@
     evaluate_members,
     evaluate_strict,
     evaluate_strict_container,
+    signature_from_kwargs,
 )
 from iommi.path import decode_path_components
 from iommi.refinable import (
@@ -33,6 +34,7 @@
     get_style_data_for_object,
     Style,
 )
+from iommi.timing import get_timing
 
 # Backward compatible definition
 EvaluatedRefinable = EvaluatedRefinable  # pragma: no mutate this is just marking the symbols as used
@@ -54,6 +56,7 @@ class Traversable(RefinableObject):
     _parent = None
     _is_bound = False
     _request = None
+    _iommi_timed = False  # on_bind is timed when the request is timed, see iommi.timing
     context = None
 
     iommi_style: str = Refinable()
@@ -105,6 +108,10 @@ def iommi_path(self) -> str:
         if hasattr(self, '_iommi_path_override'):
             return self._iommi_path_override
 
+        path = self.__dict__.get('_iommi_path') if self._is_bound else None
+        if path is not None:
+            return path
+
         long_path = build_long_path(self)
         path_by_long_path = get_path_by_long_path(self)
         path = path_by_long_path.get(long_path)
@@ -113,6 +120,8 @@ def iommi_path(self) -> str:
             raise PathNotFoundException(
                 f"Path not found(!) (Searched for '{long_path}' among the following:\n{candidates}"
             )
+        if self._is_bound:
+            self._iommi_path = path
         return path
 
     @property
@@ -172,22 +181,33 @@ def bind(self, *, parent=None, request=None):
 
         result.include = True
 
-        result.on_bind()
+        timing = get_timing()
+        if timing is not None and result._iommi_timed:
+            span = timing.start('on_bind', result)
+            try:
+                result.on_bind()
+            finally:
+                timing.finish(span)
+        else:
+            result.on_bind()
 
         # on_bind has a chance to hide itself
         if result.include is False:
             return None
 
+        # on_bind can change the evaluate parameters, so the signature is calculated after it
+        signature = signature_from_kwargs(evaluate_parameters)
+
         if hasattr(result, 'attrs'):
-            result.attrs = evaluate_attrs(result, **result.iommi_evaluate_parameters())
+            result.attrs = evaluate_attrs(result, __signature=signature, **evaluate_parameters)
 
         evaluated_attributes = [
             k for k, v in items(result.get_declared('refinable')) if is_evaluated_refinable(v)
         ]
-        evaluate_members(result, evaluated_attributes, **evaluate_parameters)
+        evaluate_members(result, evaluated_attributes, __signature=signature, **evaluate_parameters)
 
         if hasattr(result, 'extra_evaluated'):
-            result.extra_evaluated = evaluate_strict_container(result.extra_evaluated or {}, **evaluate_parameters)
+            result.extra_evaluated = evaluate_strict_container(result.extra_evaluated or {}, __signature=signature, **evaluate_parameters)
 
         return result
 
@@ -256,56 +276,96 @@ def _traverse(t: Traversable) -> List[str]:
             return []
         return _traverse(t.iommi_parent()) + [t.iommi_name()]
 
-    return '/'.join(_traverse(node))
+    if not getattr(node, '_is_bound', False):
+        return '/'.join(_traverse(node))
+
+    # The position of a bound node in the tree doesn't change
+    long_path = node.__dict__.get('_iommi_long_path')
+    if long_path is None:
+        long_path = '/'.join(_traverse(node))
+        node._iommi_long_path = long_path
+    return long_path
 
 
 def include_in_short_path(node):
     return getattr(node, '_name', None) is not None
 
 
+# Bumped when a declared members dict is changed after refine_done, which invalidates the cached path entries
+_path_entries_generation = 0
+
+
+def invalidate_path_entries():
+    global _path_entries_generation
+    _path_entries_generation += 1
+
+
+def _path_entries(node):
+    """
+    The nodes of the tree below `node`, including `node` itself, that get a
+    path, in the order `build_long_path_by_path` gives them paths. Each entry
+    is a tuple of the long path segments and the short path candidate segments,
+    relative to `node`.
+
+    The tree below a refine done node that isn't bound is the same for all
+    binds of it, so the entries are cached on it. When the declaration is
+    reused between requests (like with `as_view` or `prepared`), only the
+    bound nodes need to be walked.
+    """
+    cacheable = isinstance(node, RefinableObject) and node.is_refine_done and not getattr(node, '_is_bound', False)
+    if cacheable:
+        cached = node.__dict__.get('_iommi_path_entries')
+        if cached is not None and cached[0] == _path_entries_generation:
+            return cached[1]
+
+    entries = []
+    if include_in_short_path(node):
+        entries.append(((), ()))
+
+    if isinstance(node, RefinableObject):
+        members = declared_members(node)
+    elif isinstance(node, dict):
+        members = node
+        assert '_declared_members' not in members
+    else:
+        members = {}
+
+    for name, member in sorted(items(members), key=lambda item: item[0] == 'endpoints'):
+        assert name != '_declared_members'
+        if member:
+            long_prefix = (name,)
+            short_prefix = (name,) if include_in_short_path(member) else ()
+            entries.extend(
+                (long_prefix + long_segments, short_prefix + short_segments)
+                for long_segments, short_segments in _path_entries(member)
+            )
+
+    if cacheable:
+        node._iommi_path_entries = (_path_entries_generation, entries)
+    return entries
+
+
 def build_long_path_by_path(root) -> Dict[str, str]:
     result = dict()
 
-    def _traverse(node, long_path_segments, short_path_candidate_segments):
-        if include_in_short_path(node):
-
-            def find_unique_suffix(parts):
-                for i in range(len(parts), -1, -1):
-                    candidate = '/'.join(parts[i:])
-                    if candidate not in result:
-                        return candidate
-
-            long_path = '/'.join(long_path_segments)
-            short_path = find_unique_suffix(short_path_candidate_segments)
-            if short_path is not None:
-                result[short_path] = long_path
-            else:
-                less_short_path = find_unique_suffix(long_path_segments)
-                assert less_short_path is not None, (
-                    f"Ran out of names...\n"
-                    f"Any suitable short name for {'/'.join(long_path_segments)} already taken.\n\n"
-                    f"Result so far:\n" + '\n'.join(f'{k}   ->   {v}' for k, v in result.items())
-                )
-                result[less_short_path] = long_path
-
-        if isinstance(node, RefinableObject):
-            members = declared_members(node)
-        elif isinstance(node, dict):
-            members = node
-            assert '_declared_members' not in members
+    def find_unique_suffix(parts):
+        for i in range(len(parts), -1, -1):
+            candidate = '/'.join(parts[i:])
+            if candidate not in result:
+                return candidate
+
+    for long_path_segments, short_path_candidate_segments in _path_entries(root):
+        long_path = '/'.join(long_path_segments)
+        short_path = find_unique_suffix(short_path_candidate_segments)
+        if short_path is not None:
+            result[short_path] = long_path
         else:
-            return
-
-        for name, member in sorted(items(members), key=lambda item: item[0] == 'endpoints'):
-            assert name != '_declared_members'
-            if member:
-                _traverse(
-                    member,
-                    long_path_segments=long_path_segments + [name],
-                    short_path_candidate_segments=short_path_candidate_segments
-                    + ([name] if include_in_short_path(member) else []),
-                )
-
-    _traverse(root, [], [])
+            less_short_path = find_unique_suffix(long_path_segments)
+            assert less_short_path is not None, (
+                f"Ran out of names...\n"
+                f"Any suitable short name for {'/'.join(long_path_segments)} already taken.\n\n"
+                f"Result so far:\n" + '\n'.join(f'{k}   ->   {v}' for k, v in result.items())
+            )
+            result[less_short_path] = long_path
 
     return result
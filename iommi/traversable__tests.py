@@ -1,4 +1,5 @@
 from typing import Dict
+from unittest import mock
 
 import pytest
 from tri_declarative import (
@@ -41,6 +42,8 @@
 )
 from iommi.traversable import (
     build_long_path_by_path,
+    declared_members,
+    invalidate_path_entries,
     Traversable,
 )
 from tests.helpers import (
@@ -422,3 +425,28 @@ class MyBasket(Basket):
             'fruit_shortcut_base',
             'my_basket_fruit_invoke',
         })
+
+
+@pytest.mark.django_db
+def test_path_index_is_cached_per_declaration():
+    table = Table(auto__model=TFoo, columns__a__filter__include=True).refine_done()
+
+    first = table.bind(request=req('get'))
+    invalidate_path_entries()
+    with mock.patch('iommi.traversable.declared_members', wraps=declared_members) as declared_members_mock:
+        expected = build_long_path_by_path(first)
+    uncached_call_count = declared_members_mock.call_count
+    assert first.columns.a.iommi_path == 'columns/a'
+    assert first.columns.a._iommi_path == 'columns/a'
+
+    assert build_long_path_by_path(table.bind(request=req('get'))) == expected
+    second = table.bind(request=req('get'))
+    with mock.patch('iommi.traversable.declared_members', wraps=declared_members) as declared_members_mock:
+        assert build_long_path_by_path(second) == expected
+    # Only the bound nodes are walked again
+    assert 0 < declared_members_mock.call_count < uncached_call_count / 2
+
+    # Deleting a member changes the declaration
+    assert 'columns/b' in expected
+    del second.columns['b']
+    assert 'columns/b' not in build_long_path_by_path(table.bind(request=req('get')))
@@ -0,0 +1,75 @@
+"""
+Benchmark of `evaluate`, the function that calls the callables of the
+declarations with the parameters they ask for.
+
+Run with:
+
+    python -m tests.benchmark_evaluate
+"""
+import os
+from timeit import repeat
+
+NUMBER = 200_000
+REPEAT = 5
+
+
+def main():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    import django
+
+    django.setup()
+
+    from iommi.evaluate import (
+        evaluate,
+        evaluate_strict,
+        signature_from_kwargs,
+    )
+
+    # The shape of the parameters of a bound column
+    kwargs = dict(
+        request=None,
+        table=None,
+        traversable=None,
+        column=None,
+        bound_column=None,
+        params=None,
+    )
+
+    def f(table, column, **_):
+        return 1
+
+    def g(foo):
+        return 1  # pragma: no cover
+
+    def report(title, f):
+        seconds = min(repeat(f, number=NUMBER, repeat=REPEAT))
+        print(f'    {title:<42} {NUMBER / seconds:12,.0f} calls/s')
+
+    print(f'evaluate, best of {REPEAT} runs of {NUMBER} calls')
+    report('constant', lambda: evaluate(17, **kwargs))
+    report('callable', lambda: evaluate(f, **kwargs))
+    report('callable, strict', lambda: evaluate_strict(f, **kwargs))
+    signature = signature_from_kwargs(kwargs)
+    report('callable, precomputed signature', lambda: evaluate(f, __signature=signature, **kwargs))
+    report('callable, non-matching', lambda: evaluate(g, **kwargs))
+
+    from tri_struct import Struct
+
+    from iommi import Table
+    from tests.helpers import req
+
+    rows = [Struct(a=i, b=str(i), c=i * 2) for i in range(100)]
+    table = Table(
+        rows=rows,
+        page_size=None,
+        columns__a__cell__url=lambda row, **_: f'/{row.a}/',
+        columns__b__cell__attrs__class__odd=lambda row, **_: row.a % 2,
+        columns__c=dict(),
+    ).refine_done()
+    request = req('get')
+    seconds = min(repeat(lambda: table.bind(request=request).__html__(), number=20, repeat=REPEAT)) / 20
+    print(f'Bind and render of a table with {len(rows)} rows: {seconds * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
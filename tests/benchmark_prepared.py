@@ -0,0 +1,58 @@
+"""
+Benchmark of `Part.prepared()`: instantiation and bind of a table with 30
+columns from a model, with and without a shared prepared declaration.
+
+Run with:
+
+    python -m tests.benchmark_prepared
+"""
+import os
+from timeit import repeat
+
+NUMBER = 20
+REPEAT = 5
+NUMBER_OF_COLUMNS = 30
+
+
+def main():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    import django
+
+    django.setup()
+
+    from django.db import models
+
+    from iommi import Table
+    from tests.helpers import req
+
+    Wide = type(
+        'BenchmarkWideModel',
+        (models.Model,),
+        {
+            '__module__': __name__,
+            'Meta': type('Meta', (), dict(app_label='tests', managed=False)),
+            **{f'field_{i}': models.CharField(max_length=10) for i in range(NUMBER_OF_COLUMNS)},
+        },
+    )
+
+    class WideTable(Table):
+        class Meta:
+            auto__model = Wide
+            # No rows, so the benchmark doesn't need a database table
+            rows = Wide.objects.none()
+
+    request = req('get')
+
+    def report(title, f):
+        seconds = min(repeat(f, number=NUMBER, repeat=REPEAT)) / NUMBER
+        print(f'    {title:<42} {seconds * 1000:8.3f} ms')
+
+    print(f'Table with {NUMBER_OF_COLUMNS} columns from a model, best of {REPEAT} runs of {NUMBER}')
+    report('instantiation + bind', lambda: WideTable().bind(request=request))
+    report('prepared() + bind', lambda: WideTable.prepared().bind(request=request))
+    report('instantiation + bind + render', lambda: WideTable().bind(request=request).__html__())
+    report('prepared() + bind + render', lambda: WideTable.prepared().bind(request=request).__html__())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of the root template handling in `render_root`.
+
+Run with:
+
+    python -m tests.benchmark_render_root
+"""
+import os
+from timeit import timeit
+
+NUMBER = 2000
+
+
+def main():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+    import django
+
+    django.setup()
+
+    from iommi import Page
+    from iommi._web_compat import get_template_from_string
+    from iommi.part import (
+        clear_root_template_cache,
+        get_root_template,
+        render_root,
+    )
+    from tests.helpers import req
+
+    template_name = 'iommi/base.html'
+    content_block_name = 'content'
+    template_string = (
+        '{% extends "' + template_name + '" %} {% block ' + content_block_name + ' %}{{ iommi_debug_panel }}{{ content }}{% endblock %}'
+    )
+
+    uncached = timeit(lambda: get_template_from_string(template_string), number=NUMBER)
+    clear_root_template_cache()
+    cached = timeit(lambda: get_root_template(template_name, content_block_name), number=NUMBER)
+
+    print(f'Root template lookup, {NUMBER} requests')
+    print(f'    parsed per request: {uncached / NUMBER * 1_000_000:8.1f} µs/request')
+    print(f'    cached:             {cached / NUMBER * 1_000_000:8.1f} µs/request')
+
+    page = Page(parts__foo='foo').refine_done()
+    request = req('get')
+    full_render = timeit(lambda: render_root(part=page.bind(request=request)), number=NUMBER)
+    print(f'Full render_root of a small page: {full_render / NUMBER * 1_000_000:8.1f} µs/request')
+
+
+if __name__ == '__main__':
+    main()